@@ -36,9 +36,37 @@ interface InterviewResult {
   question?: Record<string, string>;
 }
 
+// Best-effort parse of feedback JSON that is still being written: close the open
+// string, arrays and objects. Returns null while the text ends mid-key.
+function parsePartialFeedback(text: string): Partial<FeedbackScore> | null {
+  const closers: string[] = [];
+  let inString = false;
+  let escaped = false;
+  for (const ch of text) {
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === "\\") escaped = true;
+      else if (ch === '"') inString = false;
+    } else if (ch === '"') inString = true;
+    else if (ch === "{") closers.push("}");
+    else if (ch === "[") closers.push("]");
+    else if (ch === "}" || ch === "]") closers.pop();
+  }
+  let candidate = escaped ? text.slice(0, -1) : text;
+  if (inString) candidate += '"';
+  candidate = candidate.replace(/[\s,:]+$/, "");
+  try {
+    const parsed = JSON.parse(candidate + closers.reverse().join(""));
+    return typeof parsed === "object" && parsed !== null ? parsed : null;
+  } catch {
+    return null;
+  }
+}
+
 async function listenForFeedback(
   interviewId: string,
   token: string,
+  onPartial: (partial: Partial<FeedbackScore>) => void,
   onFeedback: (data: InterviewResult) => void,
   onError: () => void
 ) {
@@ -49,20 +77,53 @@ async function listenForFeedback(
     if (!res.ok || !res.body) { onError(); return; }
     const reader = res.body.getReader();
     const decoder = new TextDecoder();
+    let buffered = "";
+    // feedback.delta pieces of the current attempt, joined in seq order as they arrive
+    let attempt: string | null = null;
+    const superseded = new Set<string>();
+    let streamed = "";
+    let nextSeq = 0;
+    const early = new Map<number, string>();
     while (true) {
       const { value, done } = await reader.read();
       if (done) break;
-      const text = decoder.decode(value);
-      for (const line of text.split("\n")) {
+      buffered += decoder.decode(value, { stream: true });
+      const lines = buffered.split("\n");
+      buffered = lines.pop() ?? "";
+      for (const line of lines) {
         if (line.startsWith("data: ")) {
           try {
             const payload = JSON.parse(line.slice(6));
+            if (payload.type === "feedback.delta") {
+              if (payload.attempt !== attempt && !superseded.has(payload.attempt)) {
+                // A retried job starts over; late pieces of the old attempt are dropped
+                if (attempt !== null) superseded.add(attempt);
+                attempt = payload.attempt;
+                streamed = "";
+                nextSeq = 0;
+                early.clear();
+              }
+              if (payload.attempt === attempt) {
+                early.set(payload.seq, payload.delta);
+                while (early.has(nextSeq)) {
+                  streamed += early.get(nextSeq);
+                  early.delete(nextSeq++);
+                }
+                const partial = parsePartialFeedback(streamed);
+                if (partial) onPartial(partial);
+              }
+            }
             if (payload.type === "feedback") {
               const interview = await apiClient.get(`/api/interviews/${interviewId}/feedback`);
               onFeedback(interview.data.interview);
               reader.cancel();
               return;
             }
+            if (payload.type === "failure") {
+              reader.cancel();
+              onError();
+              return;
+            }
           } catch { /* ignore malformed lines */ }
         }
       }
@@ -72,46 +133,57 @@ async function listenForFeedback(
   }
 }
 
-function FeedbackDisplay({ feedback }: { feedback: FeedbackScore | string }) {
+function FeedbackDisplay({ feedback }: { feedback: Partial<FeedbackScore> | string }) {
   if (typeof feedback === "string") {
     return <div className="whitespace-pre-line text-gray-700">{feedback}</div>;
   }
+  // Sections appear as they arrive when rendering feedback that is still streaming
   return (
     <div className="space-y-4">
-      <div className="flex items-center gap-3 mb-2">
-        <span className="text-sm font-medium text-gray-600">Score</span>
-        <span className="inline-block bg-black text-white text-sm font-bold px-3 py-1 rounded-full">
-          {feedback.score} / 10
-        </span>
-      </div>
-      <div>
-        <h4 className="font-semibold mb-1">Overall Impression</h4>
-        <p className="text-gray-700 text-sm">{feedback.overall_impression}</p>
-      </div>
-      <div>
-        <h4 className="font-semibold mb-1">Strengths</h4>
-        <ul className="list-disc list-inside space-y-1">
-          {feedback.strengths.map((s, i) => (
-            <li key={i} className="text-gray-700 text-sm">{s}</li>
-          ))}
-        </ul>
-      </div>
-      <div>
-        <h4 className="font-semibold mb-1">Areas for Improvement</h4>
-        <ul className="list-disc list-inside space-y-1">
-          {feedback.areas_for_improvement.map((a, i) => (
-            <li key={i} className="text-gray-700 text-sm">{a}</li>
-          ))}
-        </ul>
-      </div>
-      <div>
-        <h4 className="font-semibold mb-1">Suggestions</h4>
-        <ul className="list-disc list-inside space-y-1">
-          {feedback.suggestions.map((s, i) => (
-            <li key={i} className="text-gray-700 text-sm">{s}</li>
-          ))}
-        </ul>
-      </div>
+      {typeof feedback.score === "number" && (
+        <div className="flex items-center gap-3 mb-2">
+          <span className="text-sm font-medium text-gray-600">Score</span>
+          <span className="inline-block bg-black text-white text-sm font-bold px-3 py-1 rounded-full">
+            {feedback.score} / 10
+          </span>
+        </div>
+      )}
+      {feedback.overall_impression !== undefined && (
+        <div>
+          <h4 className="font-semibold mb-1">Overall Impression</h4>
+          <p className="text-gray-700 text-sm">{feedback.overall_impression}</p>
+        </div>
+      )}
+      {feedback.strengths && (
+        <div>
+          <h4 className="font-semibold mb-1">Strengths</h4>
+          <ul className="list-disc list-inside space-y-1">
+            {feedback.strengths.map((s, i) => (
+              <li key={i} className="text-gray-700 text-sm">{s}</li>
+            ))}
+          </ul>
+        </div>
+      )}
+      {feedback.areas_for_improvement && (
+        <div>
+          <h4 className="font-semibold mb-1">Areas for Improvement</h4>
+          <ul className="list-disc list-inside space-y-1">
+            {feedback.areas_for_improvement.map((a, i) => (
+              <li key={i} className="text-gray-700 text-sm">{a}</li>
+            ))}
+          </ul>
+        </div>
+      )}
+      {feedback.suggestions && (
+        <div>
+          <h4 className="font-semibold mb-1">Suggestions</h4>
+          <ul className="list-disc list-inside space-y-1">
+            {feedback.suggestions.map((s, i) => (
+              <li key={i} className="text-gray-700 text-sm">{s}</li>
+            ))}
+          </ul>
+        </div>
+      )}
     </div>
   );
 }
@@ -129,6 +201,7 @@ export default function QuestionDetailPage() {
   const [submitError, setSubmitError] = useState<string | null>(null);
   const [result, setResult] = useState<InterviewResult | null>(null);
   const [waitingForFeedback, setWaitingForFeedback] = useState(false);
+  const [partialFeedback, setPartialFeedback] = useState<Partial<FeedbackScore> | null>(null);
   const audioRef = useRef<HTMLAudioElement>(null);
   const recorderControls = useAudioRecorder();
 
@@ -163,10 +236,12 @@ export default function QuestionDetailPage() {
 
       const { data } = await apiClient.post("/api/interviews/submit-recording", form);
       setWaitingForFeedback(true);
+      setPartialFeedback(null);
 
       listenForFeedback(
         data.interview,
         token!,
+        setPartialFeedback,
         (interview) => { setResult(interview); setWaitingForFeedback(false); },
         () => {
           setWaitingForFeedback(false);
@@ -299,6 +374,13 @@ export default function QuestionDetailPage() {
               Record another answer
             </button>
           </div>
+        ) : waitingForFeedback && partialFeedback ? (
+          <div className="bg-white rounded-lg shadow-lg p-6">
+            <h2 className="font-mono text-xl font-bold mb-4">Feedback</h2>
+            <div className="bg-blue-50 p-4 rounded-lg">
+              <FeedbackDisplay feedback={partialFeedback} />
+            </div>
+          </div>
         ) : waitingForFeedback ? (
           <div className="bg-white rounded-lg shadow-lg p-6 flex flex-col items-center gap-4">
             <p className="text-gray-700 font-medium">Generating feedback…</p>
@@ -1,8 +1,47 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     openai_api_key: str
+    openai_base_url: str | None = None  # point at a local fake server in tests/benchmarks
     rabbitmq_uri: str
     app_id: str = "feedback_service"
     health_port: int = 8002
+    # Unacked deliveries, and how many run at once (see mq.consumer.limit_concurrency)
+    prefetch_count: int = 8
+    max_concurrency: int = 8
+    # Connection pool of the process-wide OpenAI client
+    openai_max_connections: int = 20
+    openai_max_keepalive_connections: int = 10
+    openai_keepalive_expiry: float = 30.0
+    # Starting OpenAI limits; RATE_LIMIT_REDIS_URL shares them between replicas
+    openai_requests_per_minute: float = 500
+    openai_tokens_per_minute: float = 30_000
+    rate_limit_redis_url: str | None = None
+    # Feedback already generated for the same question and (normalised) answer. Entries
+    # are fresh for the TTL, then served stale for another stale window while a
+    # background call refreshes them. Local SQLite file unless a Redis URL is set.
+    feedback_cache_enabled: bool = True
+    feedback_cache_ttl_seconds: float = 7 * 24 * 3600
+    feedback_cache_stale_seconds: float = 0.0
+    feedback_cache_path: str = "/app/cache/feedback.sqlite3"
+    feedback_cache_max_bytes: int = 64 * 1024 * 1024
+    feedback_cache_redis_url: str | None = None
+    # Stream the completion and forward its text as feedback.delta messages, coalesced
+    # to at most one per interval, so the browser can show feedback as it is written
+    feedback_streaming_enabled: bool = True
+    feedback_delta_interval_seconds: float = 0.1
+    # Backlog mode: while feedback_processing holds more than batch_queue_threshold
+    # ready messages, also pull them batch_size at a time and grade each pull as one
+    # batch job (the OpenAI Batch API, or ordinary calls with "local"). Pulled
+    # messages stay unacked until their batch ends, so RabbitMQ's consumer_timeout
+    # must exceed the batch turnaround.
+    batch_mode_enabled: bool = False
+    batch_provider: Literal["openai", "local"] = "openai"
+    batch_queue_threshold: int = 1000
+    batch_size: int = 500
+    batch_max_in_flight: int = 20
+    batch_check_seconds: float = 15.0
+    batch_poll_seconds: float = 30.0
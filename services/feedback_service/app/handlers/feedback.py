@@ -1,32 +1,217 @@
+import asyncio
 import logging
+import time
+from uuid import uuid4
 
 import aio_pika
+import openai
 from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+from aio_pika.exceptions import AMQPError, ChannelInvalidStateError
+from openai import AsyncOpenAI
+from pydantic import ValidationError
 
-from mock_interview_shared.schemas.messages import FeedbackRequest, FeedbackResult
+from mock_interview_shared.mq.retry import dead_letter, retry_or_dead_letter
+from mock_interview_shared.schemas.messages import (
+    FailureResult,
+    FeedbackDelta,
+    FeedbackRequest,
+    FeedbackResult,
+    FeedbackScore,
+)
+from mock_interview_shared.utils.rate_limit import AdaptiveRateLimiter
 
 from ..config import Settings
 from ..services.ai import generate_feedback
+from ..services.batch import BatchItem, BatchItemError, FeedbackBatchProvider
+from ..services.feedback_cache import FeedbackCache
 
 logger = logging.getLogger(__name__)
 
+QUEUE = "feedback_processing"
 
-async def handle(
-    message: AbstractIncomingMessage, channel: AbstractChannel, settings: Settings
+# Provider hiccups worth waiting out, plus a malformed model reply, which a fresh
+# completion usually fixes; anything else (e.g. a 400) won't improve on retry
+_RETRYABLE = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    ValidationError,
+)
+
+# What a publish, ack or nack raises when the broker or the channel goes away
+BROKER_ERRORS = (AMQPError, ChannelInvalidStateError, ConnectionError, asyncio.TimeoutError)
+
+
+async def _publish(channel: AbstractChannel, body: str) -> None:
+    await channel.default_exchange.publish(
+        aio_pika.Message(body=body.encode()), routing_key="results_to_main_api"
+    )
+
+
+async def _publish_feedback(
+    channel: AbstractChannel, req: FeedbackRequest, score: FeedbackScore, settings: Settings
 ) -> None:
-    async with message.process(requeue=False):
-        req = FeedbackRequest.model_validate_json(message.body)
+    result = FeedbackResult(
+        interview_id=req.interview_id,
+        feedback=score,
+        app_id=settings.app_id,
+    )
+    await _publish(channel, result.model_dump_json(by_alias=True))
+
 
-        score = await generate_feedback(req.question, req.transcript, settings.openai_api_key)
+class _DeltaPublisher:
+    """Forwards streamed feedback text to main_api, at most one message per interval.
 
-        result = FeedbackResult(
-            interview_id=req.interview_id,
-            feedback=score,
-            app_id=settings.app_id,
+    The first piece goes out at once; later ones are buffered until the interval has
+    passed. Deltas are best-effort: a failed publish is logged and the job goes on.
+    """
+
+    def __init__(self, channel: AbstractChannel, req: FeedbackRequest, settings: Settings):
+        self._channel = channel
+        self._req = req
+        self._settings = settings
+        self._pending: list[str] = []
+        self._attempt = uuid4().hex
+        self._seq = 0
+        self._flushed_at = float("-inf")
+        self._closed = False
+
+    def close(self) -> None:
+        """Stop forwarding, e.g. once the final result is out (a cache refresh may go on)."""
+        self._closed = True
+
+    async def __call__(self, text: str) -> None:
+        if self._closed:
+            return
+        self._pending.append(text)
+        interval = self._settings.feedback_delta_interval_seconds
+        if time.monotonic() - self._flushed_at >= interval:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        delta = FeedbackDelta(
+            interview_id=self._req.interview_id,
+            attempt=self._attempt,
+            seq=self._seq,
+            delta="".join(self._pending),
+            app_id=self._settings.app_id,
         )
-        await channel.default_exchange.publish(
-            aio_pika.Message(body=result.model_dump_json(by_alias=True).encode()),
-            routing_key="results_to_main_api",
+        self._pending.clear()
+        self._seq += 1
+        self._flushed_at = time.monotonic()
+        try:
+            await _publish(self._channel, delta.model_dump_json(by_alias=True))
+        except BROKER_ERRORS as exc:
+            logger.warning("Dropping feedback delta for %s: %s", self._req.interview_id, exc)
+
+
+async def _fail(
+    channel: AbstractChannel,
+    message: AbstractIncomingMessage,
+    req: FeedbackRequest,
+    settings: Settings,
+    exc: Exception,
+) -> None:
+    """Schedule a retry, or give up on the job and tell main_api so."""
+    reason = f"{type(exc).__name__}: {exc}"
+    logger.warning("Feedback failed for interview %s: %s", req.interview_id, reason)
+    retryable = isinstance(exc, _RETRYABLE) or (isinstance(exc, BatchItemError) and exc.retryable)
+    if await retry_or_dead_letter(channel, message, QUEUE, reason, retryable):
+        failure = FailureResult(interview_id=req.interview_id, error=reason, app_id=settings.app_id)
+        await _publish(channel, failure.model_dump_json(by_alias=True))
+
+
+async def handle(
+    message: AbstractIncomingMessage,
+    channel: AbstractChannel,
+    settings: Settings,
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None = None,
+    cache: FeedbackCache | None = None,
+) -> None:
+    # Failures are moved to a retry or dead-letter queue below, so this only requeues
+    # if that move itself failed — the job is never dropped
+    async with message.process(requeue=True):
+        try:
+            req = FeedbackRequest.model_validate_json(message.body)
+        except ValidationError as exc:
+            await dead_letter(channel, message, QUEUE, f"invalid request: {exc}")
+            return
+
+        on_delta = (
+            _DeltaPublisher(channel, req, settings) if settings.feedback_streaming_enabled else None
         )
+        try:
+            if cache is not None:
+                score = await cache.get_or_generate(
+                    req.question,
+                    req.transcript,
+                    lambda: generate_feedback(
+                        req.question, req.transcript, client, limiter, on_delta
+                    ),
+                )
+            else:
+                score = await generate_feedback(
+                    req.question, req.transcript, client, limiter, on_delta
+                )
+            await _publish_feedback(channel, req, score, settings)
+        except Exception as exc:  # noqa: BLE001 - every failure is retried or dead-lettered
+            await _fail(channel, message, req, settings, exc)
+            return
+        finally:
+            if on_delta is not None:
+                on_delta.close()
 
         logger.info("Processed feedback for interview %s", req.interview_id)
+
+
+async def handle_batch(
+    messages: list[AbstractIncomingMessage],
+    channel: AbstractChannel,
+    settings: Settings,
+    provider: FeedbackBatchProvider,
+) -> None:
+    """Grade several deliveries with one batch job, then settle each message on its own.
+
+    Each message ends exactly like it would in handle(): result published, or moved
+    to a retry or dead-letter queue, then acked. If the broker fails while settling
+    one, only that message is requeued; anything else propagates, and the caller
+    requeues whatever is still unsettled.
+    """
+    jobs: dict[str, tuple[AbstractIncomingMessage, FeedbackRequest]] = {}
+    for index, message in enumerate(messages):
+        try:
+            req = FeedbackRequest.model_validate_json(message.body)
+        except ValidationError as exc:
+            await dead_letter(channel, message, QUEUE, f"invalid request: {exc}")
+            await message.ack()
+            continue
+        # The index keeps ids unique when one interview's job was delivered twice
+        jobs[f"{index}:{req.interview_id}"] = (message, req)
+    if not jobs:
+        return
+
+    items = [
+        BatchItem(custom_id, req.question, req.transcript) for custom_id, (_, req) in jobs.items()
+    ]
+    try:
+        results = await provider.run(items)
+    except Exception as exc:  # noqa: BLE001 - the whole batch is retried, item by item
+        logger.warning("Feedback batch of %d failed: %s", len(items), exc)
+        failure = BatchItemError(f"{type(exc).__name__}: {exc}", retryable=True)
+        results = {custom_id: failure for custom_id in jobs}
+
+    for custom_id, (message, req) in jobs.items():
+        outcome = results.get(custom_id) or BatchItemError("missing from batch", retryable=True)
+        try:
+            if isinstance(outcome, FeedbackScore):
+                await _publish_feedback(channel, req, outcome, settings)
+            else:
+                await _fail(channel, message, req, settings, outcome)
+            await message.ack()
+        except BROKER_ERRORS as exc:
+            logger.error("Requeueing feedback job for %s: %s", req.interview_id, exc)
+            await message.nack(requeue=True)
+    logger.info("Processed feedback batch of %d", len(jobs))
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 
 app = FastAPI()
 
@@ -6,3 +6,14 @@ app = FastAPI()
 @app.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok", "service": "feedback_service"}
+
+
+@app.get("/metrics")
+async def metrics(request: Request) -> dict:
+    # The worker attaches these at startup
+    limiter = getattr(request.app.state, "rate_limiter", None)
+    cache = getattr(request.app.state, "feedback_cache", None)
+    return {
+        "rate_limiter": limiter.stats() if limiter is not None else None,
+        "feedback_cache": cache.stats() if cache is not None else None,
+    }
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+import openai
+from mock_interview_shared.schemas.messages import FeedbackScore
+from openai import AsyncOpenAI
+from pydantic import ValidationError
+
+from .ai import completion_request, parse_feedback
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    custom_id: str
+    question: str
+    transcript: str
+
+
+class BatchItemError(Exception):
+    """One item of a batch failed; `retryable` says whether submitting it again may help."""
+
+    def __init__(self, message: str, retryable: bool) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+BatchResults = dict[str, FeedbackScore | BatchItemError]
+
+
+class FeedbackBatchProvider(Protocol):
+    async def run(self, items: list[BatchItem]) -> BatchResults:
+        """Grade every item; the result has an entry per custom_id, success or failure."""
+        ...
+
+
+class LocalBatchProvider:
+    """Grades a batch with ordinary per-item calls, `concurrency` at a time.
+
+    The stand-in for providers without a batch API, and for tests.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[str, str], Awaitable[FeedbackScore]],
+        concurrency: int = 8,
+    ) -> None:
+        self._generate = generate
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(self, item: BatchItem) -> FeedbackScore | BatchItemError:
+        async with self._semaphore:
+            try:
+                return await self._generate(item.question, item.transcript)
+            except (openai.OpenAIError, ValidationError) as exc:
+                return BatchItemError(f"{type(exc).__name__}: {exc}", retryable=True)
+
+    async def run(self, items: list[BatchItem]) -> BatchResults:
+        results = await asyncio.gather(*(self._one(item) for item in items))
+        return {item.custom_id: result for item, result in zip(items, results)}
+
+
+# Batch statuses after which the batch will not change any more
+_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class OpenAIBatchProvider:
+    """Grades a batch through the OpenAI Batch API.
+
+    Batch calls are billed at half the synchronous price and count against a
+    separate, much larger queue limit, so a backlog drains without competing with
+    live traffic for the per-minute limits. Results usually arrive within minutes;
+    the provider polls every poll_interval seconds until the batch is final.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        poll_interval: float = 30.0,
+        completion_window: str = "24h",
+    ) -> None:
+        self._client = client
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+
+    async def run(self, items: list[BatchItem]) -> BatchResults:
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": item.custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": completion_request(item.question, item.transcript),
+                }
+            )
+            for item in items
+        ]
+        upload = await self._client.files.create(
+            file=("feedback-batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = await self._client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window=self.completion_window,  # type: ignore[arg-type]
+        )
+        logger.info("Submitted feedback batch %s with %d items", batch.id, len(items))
+        while batch.status not in _FINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await self._client.batches.retrieve(batch.id)
+
+        results: BatchResults = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                content = await self._client.files.content(file_id)
+                for line in content.text.splitlines():
+                    if line.strip():
+                        custom_id, outcome = self._parse_line(json.loads(line))
+                        results[custom_id] = outcome
+        # Expired or failed batches leave some items without any line at all
+        for item in items:
+            results.setdefault(
+                item.custom_id, BatchItemError(f"batch {batch.status}", retryable=True)
+            )
+        logger.info("Feedback batch %s finished: %s", batch.id, batch.status)
+        return results
+
+    @staticmethod
+    def _parse_line(line: dict) -> tuple[str, FeedbackScore | BatchItemError]:
+        custom_id = line["custom_id"]
+        error = line.get("error")
+        response = line.get("response") or {}
+        status = response.get("status_code")
+        if error or status != 200:
+            message = (error or {}).get("message") or f"status {status}"
+            # Same split as the synchronous path: throttling and server errors may pass
+            retryable = status is None or status == 429 or status >= 500
+            return custom_id, BatchItemError(message, retryable=retryable)
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+            return custom_id, parse_feedback(content)
+        except (KeyError, IndexError, ValidationError) as exc:
+            return custom_id, BatchItemError(f"unusable reply: {exc}", retryable=True)
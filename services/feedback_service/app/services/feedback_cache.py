@@ -0,0 +1,252 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from mock_interview_shared.schemas.messages import FeedbackScore
+from mock_interview_shared.utils.sqlite_store import SQLiteLRUStore
+
+from .ai import MODEL, PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Per-question counters are kept for this many distinct questions (least recent dropped)
+_MAX_TRACKED_QUESTIONS = 500
+
+
+def normalize_transcript(transcript: str) -> str:
+    """Fold case and whitespace, which Whisper varies between identical answers."""
+    return " ".join(transcript.casefold().split())
+
+
+def feedback_cache_key(question: str, transcript: str) -> str:
+    parts = (PROMPT_VERSION, MODEL, question.strip(), normalize_transcript(transcript))
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedFeedback:
+    feedback: str  # FeedbackScore as JSON
+    stored_at: float  # wall-clock seconds, comparable across replicas
+    latency: float  # how long generating it took, i.e. what a hit saves
+
+
+class FeedbackCacheBackend(Protocol):
+    async def get(self, key: str) -> CachedFeedback | None: ...
+    async def put(self, key: str, entry: CachedFeedback) -> None: ...
+
+
+class SQLiteFeedbackBackend:
+    """Local-disk backend: one SQLite file, bounded by total size and by age.
+
+    Entries older than max_age go first, then least recently used ones (see
+    SQLiteLRUStore). Errors are logged and read as misses.
+    """
+
+    def __init__(self, path: str, max_bytes: int, max_age: float) -> None:
+        self._store = SQLiteLRUStore(path, max_bytes, max_age)
+
+    async def get(self, key: str) -> CachedFeedback | None:
+        try:
+            raw = await self._store.get(key)
+        except sqlite3.Error as exc:
+            logger.warning("Feedback cache lookup failed: %s", exc)
+            return None
+        if raw is None:
+            return None
+        return CachedFeedback(**json.loads(raw))
+
+    async def put(self, key: str, entry: CachedFeedback) -> None:
+        try:
+            await self._store.put(key, json.dumps(entry.__dict__), entry.stored_at)
+        except sqlite3.Error as exc:
+            logger.warning("Feedback cache write failed: %s", exc)
+
+    def close(self) -> None:
+        self._store.close()
+
+
+class RedisFeedbackBackend:
+    """Shared backend over any redis.asyncio-compatible client.
+
+    Entries expire after max_age; size is bounded by the server's maxmemory policy
+    (use allkeys-lru or volatile-lru). `errors` are the exceptions the client raises
+    when the server is unreachable or fails; they are logged and read as misses.
+    redis is optional, so the factory passes its error types in.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_age: float,
+        prefix: str = "mock-interview:feedback:",
+        errors: tuple[type[Exception], ...] = (OSError,),
+    ):
+        self._client = client
+        self.max_age = max_age
+        self._prefix = prefix
+        self._errors = errors
+
+    async def get(self, key: str) -> CachedFeedback | None:
+        try:
+            raw = await self._client.get(self._prefix + key)
+        except self._errors as exc:
+            logger.warning("Feedback cache lookup failed: %s", exc)
+            return None
+        if raw is None:
+            return None
+        return CachedFeedback(**json.loads(raw))
+
+    async def put(self, key: str, entry: CachedFeedback) -> None:
+        try:
+            await self._client.set(
+                self._prefix + key,
+                json.dumps(entry.__dict__),
+                px=max(1, int(self.max_age * 1000)),
+            )
+        except self._errors as exc:
+            logger.warning("Feedback cache write failed: %s", exc)
+
+
+def create_feedback_cache_backend(
+    redis_url: str | None, path: str, max_bytes: int, max_age: float
+) -> FeedbackCacheBackend:
+    """Return a Redis backend when a URL is configured, otherwise a local SQLite file."""
+    if not redis_url:
+        return SQLiteFeedbackBackend(path, max_bytes, max_age)
+    try:
+        import redis.asyncio as redis_asyncio  # type: ignore[import-not-found]
+        from redis.exceptions import RedisError  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise RuntimeError(
+            "FEEDBACK_CACHE_REDIS_URL is set but the 'redis' package is not installed"
+        ) from exc
+    return RedisFeedbackBackend(
+        redis_asyncio.from_url(redis_url), max_age, errors=(RedisError, OSError)
+    )
+
+
+@dataclass
+class _QuestionStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+
+
+class FeedbackCache:
+    """Serves feedback for answers already graded under the same prompt and model.
+
+    An entry is fresh for `ttl` seconds. For a further `stale_ttl` seconds it is
+    still served, but a background refresh is started (stale-while-revalidate);
+    after that it is a miss. Concurrent misses for one key share a single call.
+    """
+
+    def __init__(self, backend: FeedbackCacheBackend, ttl: float, stale_ttl: float = 0.0) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._inflight: dict[str, asyncio.Future[FeedbackScore]] = {}
+        self._refreshing: set[asyncio.Task[None]] = set()
+        self._questions: OrderedDict[str, _QuestionStats] = OrderedDict()
+
+    def _stats_for(self, question: str) -> _QuestionStats:
+        label = question.strip()[:120]
+        stats = self._questions.get(label)
+        if stats is None:
+            stats = self._questions[label] = _QuestionStats()
+            if len(self._questions) > _MAX_TRACKED_QUESTIONS:
+                self._questions.popitem(last=False)
+        self._questions.move_to_end(label)
+        return stats
+
+    async def get_or_generate(
+        self,
+        question: str,
+        transcript: str,
+        generate: Callable[[], Awaitable[FeedbackScore]],
+    ) -> FeedbackScore:
+        key = feedback_cache_key(question, transcript)
+        stats = self._stats_for(question)
+        entry = await self.backend.get(key)
+        if entry is not None:
+            age = time.time() - entry.stored_at
+            if age < self.ttl + self.stale_ttl:
+                stats.hits += 1
+                stats.saved_seconds += entry.latency
+                if age >= self.ttl:
+                    stats.stale_hits += 1
+                    self._revalidate(key, generate)
+                return FeedbackScore.model_validate_json(entry.feedback)
+        stats.misses += 1
+        return await self._generate(key, generate)
+
+    async def _generate(
+        self, key: str, generate: Callable[[], Awaitable[FeedbackScore]]
+    ) -> FeedbackScore:
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future: asyncio.Future[FeedbackScore] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            started = time.perf_counter()
+            score = await generate()
+            latency = time.perf_counter() - started
+            await self.backend.put(
+                key, CachedFeedback(score.model_dump_json(), time.time(), latency)
+            )
+            future.set_result(score)
+            return score
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # Mark retrieved: waiters, if any, get it re-raised
+            raise
+        finally:
+            del self._inflight[key]
+
+    def _revalidate(self, key: str, generate: Callable[[], Awaitable[FeedbackScore]]) -> None:
+        if key in self._inflight:
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._generate(key, generate)
+            except Exception:
+                # Nobody awaits this task, so log the traceback here rather than lose it
+                logger.exception("Background feedback refresh failed")
+
+        task = asyncio.create_task(refresh())
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    def stats(self) -> dict:
+        per_question = {
+            question: {
+                "hits": s.hits,
+                "stale_hits": s.stale_hits,
+                "misses": s.misses,
+                "hit_ratio": round(s.hits / (s.hits + s.misses), 3) if s.hits + s.misses else 0.0,
+                "saved_seconds": round(s.saved_seconds, 3),
+            }
+            for question, s in self._questions.items()
+        }
+        hits = sum(s.hits for s in self._questions.values())
+        misses = sum(s.misses for s in self._questions.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "saved_seconds": round(sum(s.saved_seconds for s in self._questions.values()), 3),
+            "refreshing": len(self._refreshing),
+            "questions": per_question,
+        }
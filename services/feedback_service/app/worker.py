@@ -1,39 +1,162 @@
 import asyncio
+import contextlib
 import logging
+from collections.abc import Awaitable, Callable
 
 import uvicorn
-from aio_pika.abc import AbstractIncomingMessage
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
+from openai import AsyncOpenAI
 
+from mock_interview_shared.ai.client import create_openai_client
 from mock_interview_shared.mq.client import declare_queues, get_channel, get_connection
+from mock_interview_shared.mq.consumer import limit_concurrency
+from mock_interview_shared.utils.rate_limit import AdaptiveRateLimiter, create_rate_limit_backend
 
 from .config import Settings
-from .handlers.feedback import handle
+from .handlers.feedback import BROKER_ERRORS, QUEUE, handle, handle_batch
 from .health import app as health_app
+from .services.ai import generate_feedback
+from .services.batch import FeedbackBatchProvider, LocalBatchProvider, OpenAIBatchProvider
+from .services.feedback_cache import FeedbackCache, create_feedback_cache_backend
 
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bucket key, named after the model (see AdaptiveRateLimiter)
+LIMITER_NAME = "openai:gpt-4o"
+
+
+def make_on_message(
+    channel: AbstractChannel,
+    settings: Settings,
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None = None,
+    cache: FeedbackCache | None = None,
+) -> Callable[[AbstractIncomingMessage], Awaitable[None]]:
+    """Grade each delivery, answering repeats from `cache` when one is given."""
+
+    async def on_message(message: AbstractIncomingMessage) -> None:
+        await handle(message, channel, settings, client, limiter, cache)
+
+    return limit_concurrency(on_message, settings.max_concurrency)
+
+
+async def collect_batch(queue: AbstractQueue, size: int) -> list[AbstractIncomingMessage]:
+    """Pull up to `size` ready messages off `queue` without acking them."""
+    messages: list[AbstractIncomingMessage] = []
+    while len(messages) < size:
+        message = await queue.get(no_ack=False, fail=False)
+        if message is None:
+            break
+        messages.append(message)
+    return messages
+
+
+async def drain_backlog(
+    queue: AbstractQueue,
+    channel: AbstractChannel,
+    settings: Settings,
+    provider: FeedbackBatchProvider,
+) -> None:
+    """Grade the queue in batches for as long as it is deeper than the threshold.
+
+    Runs alongside the regular consumer and only adds throughput. `queue` must be on
+    its own channel: its deliveries are acked there when their batch settles. Up to
+    batch_max_in_flight batches run at once, since a batch job's turnaround, not
+    our CPU, is what bounds the drain rate.
+    """
+    slots = asyncio.Semaphore(settings.batch_max_in_flight)
+    running: set[asyncio.Task[None]] = set()
+
+    async def run(messages: list[AbstractIncomingMessage]) -> None:
+        try:
+            await handle_batch(messages, channel, settings, provider)
+        except Exception:
+            logger.exception("Feedback batch crashed; requeueing its unsettled messages")
+            for message in messages:
+                if not message.processed:
+                    # If the channel is gone, the broker redelivers them anyway
+                    with contextlib.suppress(*BROKER_ERRORS):
+                        await message.nack(requeue=True)
+        finally:
+            slots.release()
+
+    while True:
+        depth = (await queue.declare()).message_count
+        if depth is None or depth <= settings.batch_queue_threshold:
+            await asyncio.sleep(settings.batch_check_seconds)
+            continue
+        await slots.acquire()
+        messages = await collect_batch(queue, settings.batch_size)
+        if not messages:
+            slots.release()
+            continue
+        logger.info("Backlog of %d: submitting a batch of %d", depth, len(messages))
+        task = asyncio.create_task(run(messages))
+        running.add(task)
+        task.add_done_callback(running.discard)
 
 
 async def main() -> None:
     settings = Settings()
 
+    limiter = AdaptiveRateLimiter(
+        create_rate_limit_backend(settings.rate_limit_redis_url),
+        LIMITER_NAME,
+        settings.openai_requests_per_minute,
+        settings.openai_tokens_per_minute,
+    )
+    health_app.state.rate_limiter = limiter
+    cache: FeedbackCache | None = None
+    if settings.feedback_cache_enabled:
+        backend = create_feedback_cache_backend(
+            settings.feedback_cache_redis_url,
+            settings.feedback_cache_path,
+            settings.feedback_cache_max_bytes,
+            max_age=settings.feedback_cache_ttl_seconds + settings.feedback_cache_stale_seconds,
+        )
+        cache = FeedbackCache(
+            backend, settings.feedback_cache_ttl_seconds, settings.feedback_cache_stale_seconds
+        )
+    health_app.state.feedback_cache = cache
+    client = create_openai_client(settings, limiter)
     connection = await get_connection(settings.rabbitmq_uri)
     channel = await get_channel(connection)
-    queues = await declare_queues(channel)
+    queues = await declare_queues(channel, prefetch_count=settings.prefetch_count)
 
-    async def on_message(message: AbstractIncomingMessage) -> None:
-        await handle(message, channel, settings)
-
-    await queues["feedback_processing"].consume(on_message)
+    await queues["feedback_processing"].consume(
+        make_on_message(channel, settings, client, limiter, cache)
+    )
 
     server_config = uvicorn.Config(
         health_app, host="0.0.0.0", port=settings.health_port, log_level="warning"
     )
     server = uvicorn.Server(server_config)
 
-    await asyncio.gather(
-        asyncio.get_event_loop().create_future(),  # keeps consumer alive
-        server.serve(),
-    )
+    background = [server.serve()]
+    if settings.batch_mode_enabled:
+        provider: FeedbackBatchProvider
+        if settings.batch_provider == "openai":
+            provider = OpenAIBatchProvider(client, settings.batch_poll_seconds)
+        else:
+            provider = LocalBatchProvider(
+                lambda question, transcript: generate_feedback(
+                    question, transcript, client, limiter
+                ),
+                settings.max_concurrency,
+            )
+        batch_channel = await connection.channel()
+        backlog = await batch_channel.declare_queue(QUEUE, passive=True)
+        background.append(drain_backlog(backlog, channel, settings, provider))
+
+    try:
+        await asyncio.gather(
+            asyncio.get_event_loop().create_future(),  # keeps consumer alive
+            *background,
+        )
+    finally:
+        await connection.close()
+        await client.close()
 
 
 if __name__ == "__main__":
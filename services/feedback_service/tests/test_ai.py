@@ -1,5 +1,5 @@
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -29,12 +29,37 @@ async def test_generate_feedback_returns_score() -> None:
     mock_client = AsyncMock()
     mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-    with patch("app.services.ai.AsyncOpenAI", return_value=mock_client):
-        result = await generate_feedback(
-            "What is polymorphism?", "It means multiple forms...", "fake-key"
-        )
+    result = await generate_feedback(
+        "What is polymorphism?", "It means multiple forms...", mock_client
+    )
 
     assert isinstance(result, FeedbackScore)
     assert result.score == 7
     assert result.overall_impression == "Good answer with clear structure."
     assert len(result.strengths) == 2
+
+
+@pytest.mark.asyncio
+async def test_generate_feedback_streams_pieces_then_validates_the_whole() -> None:
+    text = json.dumps(_MOCK_FEEDBACK)
+    pieces = [text[:10], "", text[10:40], text[40:]]
+
+    async def stream():
+        for piece in pieces:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = piece
+            yield chunk
+
+    mock_client = AsyncMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=stream())
+    received: list[str] = []
+
+    async def on_delta(piece: str) -> None:
+        received.append(piece)
+
+    result = await generate_feedback("Q?", "A.", mock_client, on_delta=on_delta)
+
+    assert mock_client.chat.completions.create.await_args.kwargs["stream"] is True
+    assert received == [text[:10], text[10:40], text[40:]]
+    assert result.score == 7
@@ -0,0 +1,90 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import openai
+import pytest
+
+from mock_interview_shared.schemas.messages import FeedbackScore
+from app.services.batch import (
+    BatchItem,
+    BatchItemError,
+    LocalBatchProvider,
+    OpenAIBatchProvider,
+)
+
+_SCORE = FeedbackScore(
+    overall_impression="Solid.",
+    strengths=["Clear"],
+    areas_for_improvement=["Depth"],
+    suggestions=["Use STAR"],
+    score=7,
+)
+
+_ITEMS = [BatchItem(f"{n}:interview-{n}", "Q?", f"answer {n}") for n in range(4)]
+
+
+def _output_line(custom_id: str, status: int, content: str | None = None) -> str:
+    body = {"choices": [{"message": {"content": content}}]} if content is not None else {}
+    return json.dumps(
+        {"custom_id": custom_id, "response": {"status_code": status, "body": body}, "error": None}
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_provider_grades_every_item() -> None:
+    async def generate(question: str, transcript: str) -> FeedbackScore:
+        if transcript == "answer 2":
+            raise openai.OpenAIError("boom")
+        return _SCORE
+
+    results = await LocalBatchProvider(generate, concurrency=2).run(_ITEMS)
+
+    assert results["0:interview-0"] == _SCORE
+    assert isinstance(results["2:interview-2"], BatchItemError)
+    assert results["2:interview-2"].retryable
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_submits_jsonl_and_maps_results_back() -> None:
+    client = MagicMock()
+    client.files.create = AsyncMock(return_value=SimpleNamespace(id="file-in"))
+    client.batches.create = AsyncMock(
+        return_value=SimpleNamespace(id="batch-1", status="validating")
+    )
+    client.batches.retrieve = AsyncMock(
+        return_value=SimpleNamespace(
+            id="batch-1", status="expired", output_file_id="file-out", error_file_id="file-err"
+        )
+    )
+    files = {
+        "file-out": "\n".join(
+            [
+                _output_line("0:interview-0", 200, _SCORE.model_dump_json()),
+                _output_line("1:interview-1", 200, "not json"),
+            ]
+        ),
+        "file-err": "\n".join(
+            [_output_line("2:interview-2", 400), _output_line("3:interview-3", 429)]
+        )
+        + "\n",
+    }
+    client.files.content = AsyncMock(
+        side_effect=lambda file_id: SimpleNamespace(text=files[file_id])
+    )
+
+    provider = OpenAIBatchProvider(client, poll_interval=0)
+    results = await provider.run(_ITEMS + [BatchItem("4:interview-4", "Q?", "never ran")])
+
+    upload = client.files.create.await_args.kwargs["file"][1].decode().splitlines()
+    first = json.loads(upload[0])
+    assert first["custom_id"] == "0:interview-0"
+    assert first["url"] == "/v1/chat/completions"
+    assert "answer 0" in first["body"]["messages"][1]["content"]
+    assert client.batches.create.await_args.kwargs["input_file_id"] == "file-in"
+
+    assert results["0:interview-0"] == _SCORE
+    assert results["1:interview-1"].retryable  # unparseable reply
+    assert not results["2:interview-2"].retryable  # 400: would fail again
+    assert results["3:interview-3"].retryable  # 429
+    assert str(results["4:interview-4"]) == "batch expired"
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mock_interview_shared.schemas.messages import FeedbackScore
+from app.services.feedback_cache import (
+    CachedFeedback,
+    FeedbackCache,
+    SQLiteFeedbackBackend,
+    feedback_cache_key,
+)
+
+_SCORE = FeedbackScore(
+    overall_impression="Solid.",
+    strengths=["Clear"],
+    areas_for_improvement=["Depth"],
+    suggestions=["Use STAR"],
+    score=7,
+)
+
+
+class _DictBackend:
+    def __init__(self) -> None:
+        self.entries: dict[str, CachedFeedback] = {}
+
+    async def get(self, key: str) -> CachedFeedback | None:
+        return self.entries.get(key)
+
+    async def put(self, key: str, entry: CachedFeedback) -> None:
+        self.entries[key] = entry
+
+
+def test_key_ignores_case_and_whitespace_but_not_content() -> None:
+    key = feedback_cache_key("What is polymorphism?", "Many  forms.\n")
+    assert feedback_cache_key("What is polymorphism?", "many forms.") == key
+    assert feedback_cache_key("What is polymorphism?", "many forms!") != key
+    assert feedback_cache_key("What is inheritance?", "many forms.") != key
+    with patch("app.services.feedback_cache.PROMPT_VERSION", "2"):
+        assert feedback_cache_key("What is polymorphism?", "many forms.") != key
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_generation_and_reports_saved_time_per_question() -> None:
+    cache = FeedbackCache(_DictBackend(), ttl=60)
+    generate = AsyncMock(return_value=_SCORE)
+
+    first = await cache.get_or_generate("Q1?", "An answer", generate)
+    second = await cache.get_or_generate("Q1?", "an answer ", generate)
+    await cache.get_or_generate("Q2?", "An answer", generate)
+
+    assert first == second == _SCORE
+    assert generate.await_count == 2
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 2
+    assert stats["questions"]["Q1?"]["hit_ratio"] == 0.5
+    assert stats["questions"]["Q2?"]["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_regenerated() -> None:
+    backend = _DictBackend()
+    cache = FeedbackCache(backend, ttl=60)
+    key = feedback_cache_key("Q?", "A")
+    backend.entries[key] = CachedFeedback(_SCORE.model_dump_json(), time.time() - 61, 2.0)
+    generate = AsyncMock(return_value=_SCORE)
+
+    await cache.get_or_generate("Q?", "A", generate)
+
+    generate.assert_awaited_once()
+    assert backend.entries[key].stored_at > time.time() - 5
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_refreshing_in_background() -> None:
+    backend = _DictBackend()
+    cache = FeedbackCache(backend, ttl=60, stale_ttl=600)
+    key = feedback_cache_key("Q?", "A")
+    stale = _SCORE.model_copy(update={"score": 3})
+    backend.entries[key] = CachedFeedback(stale.model_dump_json(), time.time() - 120, 2.0)
+    generate = AsyncMock(return_value=_SCORE)
+
+    served = await cache.get_or_generate("Q?", "A", generate)
+    assert served.score == 3
+    await asyncio.sleep(0)  # let the refresh run
+    await asyncio.sleep(0)
+
+    generate.assert_awaited_once()
+    assert FeedbackScore.model_validate_json(backend.entries[key].feedback).score == 7
+    assert cache.stats()["questions"]["Q?"]["stale_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_call() -> None:
+    cache = FeedbackCache(_DictBackend(), ttl=60)
+    calls = 0
+
+    async def generate() -> FeedbackScore:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _SCORE
+
+    results = await asyncio.gather(*(cache.get_or_generate("Q?", "A", generate) for _ in range(5)))
+
+    assert calls == 1
+    assert all(result == _SCORE for result in results)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_backend_bounds_size_and_age(tmp_path) -> None:
+    now = time.time()
+    entry_size = len(json.dumps(CachedFeedback(_SCORE.model_dump_json(), now, 1.5).__dict__))
+    backend = SQLiteFeedbackBackend(
+        str(tmp_path / "f.sqlite3"), max_bytes=entry_size * 2, max_age=3600
+    )
+
+    await backend.put("old", CachedFeedback(_SCORE.model_dump_json(), now - 7200, 1.0))
+    await backend.put("a", CachedFeedback(_SCORE.model_dump_json(), now, 1.5))
+    assert await backend.get("old") is None  # past max_age
+    await backend.put("b", CachedFeedback(_SCORE.model_dump_json(), now, 1.0))
+    await backend.get("a")
+    await backend.put("c", CachedFeedback(_SCORE.model_dump_json(), now, 1.0))
+
+    assert await backend.get("b") is None  # least recently used
+    hit = await backend.get("a")
+    assert hit is not None and hit.latency == 1.5
+    assert await backend.get("c") is not None
+    backend.close()
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,11 +9,42 @@ class Settings(BaseSettings):
     jwt_secret: str  # no default — must be set via env or .env file
     jwt_algorithm: str = "HS256"
     jwt_expire_days: int = 2
+    password_hash_workers: int = 4
+    user_cache_ttl_seconds: float = 60.0
+    user_cache_max_entries: int = 10_000
+    cache_redis_url: str | None = None  # shared cache backend; in-process LRU when unset
+    attempted_cache_ttl_seconds: float = 300.0
     file_storage_path: str = "./storage"
+    max_upload_bytes: int = 25 * 1024 * 1024  # Whisper's per-file limit
     internal_api_secret: str  # no default — must be set via env or .env file
     openai_api_key: str  # no default — must be set via env or .env file
     cors_origins: list[str] = ["http://localhost:3000", "http://localhost:3001"]
     port: int = 8000
+    # Serve questions from an in-process catalog, checked for changes every refresh_seconds
+    question_catalog_enabled: bool = True
+    question_catalog_refresh_seconds: float = 60.0
+    # Browser/CDN freshness for anonymous question responses, and how many to keep serialized
+    question_cache_max_age: int = 60
+    question_response_cache_entries: int = 1024
+    # "text" uses the Mongo text index; "memory" an in-process inverted index of the catalog
+    question_search_backend: Literal["text", "memory"] = "text"
+    # Long-lived publisher channels shared by all requests, and how long to wait for a confirm
+    mq_publisher_channels: int = 4
+    mq_confirm_timeout_seconds: float = 5.0
+    # Outbox relay: rows per batch, idle poll interval, and how long a claimed batch is leased
+    outbox_batch_size: int = 100
+    outbox_poll_seconds: float = 1.0
+    outbox_lease_seconds: float = 30.0
+    results_consumer_enabled: bool = True
+    results_prefetch_count: int = 10
+    # "rabbitmq" fans SSE events out to every replica; "memory" is single-process only
+    sse_broadcast_backend: Literal["memory", "rabbitmq"] = "rabbitmq"
+    # Per-subscriber event buffer, and what to do when a slow client fills it
+    sse_queue_size: int = 32
+    sse_slow_consumer_policy: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+    # Recent events kept per interview for Last-Event-ID replay
+    sse_replay_size: int = 50
+    sse_replay_ttl_seconds: float = 300.0
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
@@ -1,76 +1,99 @@
-import asyncio
 from typing import Optional
 
-from fastapi import Depends, HTTPException, Request, status
+from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 
 from .config import settings
+from .models.question import Question
 from .models.user import User
-from .services.auth import decode_token
+from .services.attempts import AttemptedQuestionsCache
+from .services.auth import PasswordHasher, decode_token
+from .services.cache import create_cache_backend
+from .services.catalog import QuestionCatalog
+from .services.http_cache import ResponseBodyCache
+from .services.outbox import Outbox
+from .services.search import QuestionSearchIndex
+from .services.sse import ConnectionManager, next_interview_event_id
+from .services.user_cache import UserCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 _optional_oauth2 = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
+cache_backend = create_cache_backend(settings.cache_redis_url, settings.user_cache_max_entries)
+user_cache = UserCache(cache_backend, settings.user_cache_ttl_seconds)
+attempted_cache = AttemptedQuestionsCache(cache_backend, settings.attempted_cache_ttl_seconds)
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = decode_token(token, settings.jwt_secret, settings.jwt_algorithm)
-        email: str | None = payload.get("email")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    user = await User.find_one(User.email == email)
-    if user is None:
-        raise credentials_exception
-    return user
 
+async def resolve_token_user(token: str) -> User | None:
+    """Return the user a bearer token belongs to, or None if the token is not valid.
 
-async def get_optional_user(token: Optional[str] = Depends(_optional_oauth2)) -> Optional[User]:
-    if token is None:
-        return None
-    try:
-        payload = decode_token(token, settings.jwt_secret, settings.jwt_algorithm)
-        email: str | None = payload.get("email")
+    Served from user_cache when possible, skipping both JWT decoding and the Mongo
+    lookup; on a miss the token is decoded and the result cached.
+    """
+    email = await user_cache.get_email_for_token(token)
+    if email is None:
+        try:
+            payload = decode_token(token, settings.jwt_secret, settings.jwt_algorithm)
+        except JWTError:
+            return None
+        email = payload.get("email")
         if email is None:
             return None
-        return await User.find_one(User.email == email)
-    except JWTError:
-        return None
-
-
-async def get_mq_channel(request: Request):
-    connection = request.app.state.mq_connection
-    channel = await connection.channel()
-    try:
-        yield channel
-    finally:
-        await channel.close()
+        await user_cache.remember_token(token, email, payload.get("exp"))
 
+    user = await user_cache.get_user(email)
+    if user is None:
+        user = await User.find_one(User.email == email)
+        if user is not None:
+            await user_cache.set_user(user)
+    return user
 
-class ConnectionManager:
-    """SSE connection manager — one asyncio.Queue per interview_id."""
-
-    def __init__(self) -> None:
-        self._queues: dict[str, asyncio.Queue] = {}
-
-    def connect(self, interview_id: str, queue: asyncio.Queue) -> None:
-        self._queues[interview_id] = queue
-
-    def disconnect(self, interview_id: str) -> None:
-        self._queues.pop(interview_id, None)
 
-    async def send(self, interview_id: str, data: dict) -> None:
-        queue = self._queues.get(interview_id)
-        if queue is not None:
-            await queue.put(data)
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+    user = await resolve_token_user(token)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
 
 
-manager = ConnectionManager()
+async def get_optional_user(token: Optional[str] = Depends(_optional_oauth2)) -> Optional[User]:
+    if token is None:
+        return None
+    return await resolve_token_user(token)
+
+
+outbox = Outbox(
+    batch_size=settings.outbox_batch_size,
+    poll_interval=settings.outbox_poll_seconds,
+    lease_seconds=settings.outbox_lease_seconds,
+)
+
+
+manager = ConnectionManager(
+    settings.sse_queue_size,
+    settings.sse_slow_consumer_policy,
+    replay_size=settings.sse_replay_size,
+    replay_ttl_seconds=settings.sse_replay_ttl_seconds,
+    event_ids=next_interview_event_id,
+)
+password_hasher = PasswordHasher(settings.password_hash_workers)
+question_index = QuestionSearchIndex()
+question_catalog = QuestionCatalog(question_index)
+question_responses = ResponseBodyCache(settings.question_response_cache_entries)
+
+
+async def find_question_by_slug(slug: str) -> Question | None:
+    """Look a question up by slug, from question_catalog when loaded.
+
+    A catalog miss still falls through to Mongo, so a question added since the
+    last refresh is found.
+    """
+    question = question_catalog.get_by_slug(slug) if question_catalog.loaded else None
+    if question is None:
+        question = await Question.find_one(Question.slug == slug)
+    return question
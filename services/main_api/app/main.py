@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncGenerator
 
 import beanie
@@ -9,12 +10,18 @@ from motor.motor_asyncio import AsyncIOMotorClient
 from mock_interview_shared.mq.client import declare_queues, get_connection
 
 from .config import settings
+from .dependencies import manager, outbox, password_hasher, question_catalog, question_index
 from .logging_config import CorrelationIDMiddleware, configure_logging
+from .middleware import ContentLengthLimitMiddleware
 from .models.interview import Interview
+from .models.outbox import OutboxMessage
 from .models.question import Question
 from .models.session import InterviewSession
 from .models.user import User
 from .routers import auth, internal, interviews, questions, realtime
+from .services.broadcast import RabbitMQBroadcast
+from .services.channel_pool import ChannelPool
+from .services.results_consumer import start_results_consumer
 
 configure_logging()
 
@@ -26,21 +33,58 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     db_name = settings.mongo_uri.rsplit("/", 1)[-1].split("?")[0]
     await beanie.init_beanie(
         database=motor_client[db_name],
-        document_models=[User, Question, Interview, InterviewSession],
+        document_models=[User, Question, Interview, InterviewSession, OutboxMessage],
     )
 
+    catalog_refresher = None
+    if settings.question_catalog_enabled:
+        # Also builds question_index, which the catalog keeps in step with its snapshot
+        await question_catalog.refresh()
+        catalog_refresher = asyncio.create_task(
+            question_catalog.run_refresher(settings.question_catalog_refresh_seconds)
+        )
+    elif settings.question_search_backend == "memory":
+        await question_index.rebuild()
+
     mq_connection = await get_connection(settings.rabbitmq_uri)
     app.state.mq_connection = mq_connection
     # Declare all queues once at startup so publishers never silently drop messages
     _channel = await mq_connection.channel()
     await declare_queues(_channel)
     await _channel.close()
+    app.state.publisher = ChannelPool(
+        mq_connection,
+        size=settings.mq_publisher_channels,
+        confirm_timeout=settings.mq_confirm_timeout_seconds,
+    )
+    # Publishes jobs recorded in the outbox, so requests never wait on the broker
+    await outbox.start(app.state.publisher)
+
+    if settings.sse_broadcast_backend == "rabbitmq":
+        await manager.use_backend(RabbitMQBroadcast(mq_connection))
+
+    # Drain worker results straight from RabbitMQ instead of waiting for HTTP callbacks
+    results_channel = None
+    if settings.results_consumer_enabled:
+        results_channel = await start_results_consumer(
+            mq_connection, settings.results_prefetch_count
+        )
 
     yield
 
     # ── Shutdown ─────────────────────────────────────────────────────────
+    if catalog_refresher is not None:
+        catalog_refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await catalog_refresher
+    if results_channel is not None:
+        await results_channel.close()
+    await manager.close()
+    await outbox.stop()
+    await app.state.publisher.close()
     await mq_connection.close()
     motor_client.close()
+    password_hasher.shutdown()
 
 
 app = FastAPI(title="Mock Interview API", version="2.0.0", lifespan=lifespan)
@@ -53,6 +97,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(CorrelationIDMiddleware)
+app.add_middleware(
+    ContentLengthLimitMiddleware,
+    path="/api/interviews/submit-recording",
+    # Room for the multipart boundaries, part headers and the question_id field
+    max_bytes=settings.max_upload_bytes + 64 * 1024,
+    detail="Recording exceeds the maximum upload size",
+)
 
 # Routers
 app.include_router(auth.router, prefix="/api")
@@ -0,0 +1,28 @@
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp
+
+
+class ContentLengthLimitMiddleware(BaseHTTPMiddleware):
+    """Answer 413 to requests on `path` that declare a body larger than max_bytes.
+
+    Starlette reads a multipart body in full (spooling files to disk) before the
+    endpoint runs, so a size check there can only discard an upload that has
+    already arrived. This one looks at Content-Length before any of the body is
+    read. A body sent without one (chunked) still arrives in full, and
+    LocalFileStorage.save() rejects it afterwards.
+    """
+
+    def __init__(self, app: ASGIApp, path: str, max_bytes: int, detail: str) -> None:
+        super().__init__(app)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.detail = detail
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        if request.url.path == self.path:
+            declared = request.headers.get("content-length", "")
+            if declared.isdigit() and int(declared) > self.max_bytes:
+                return JSONResponse({"detail": self.detail}, status_code=413)
+        return await call_next(request)
@@ -1,6 +1,8 @@
 from datetime import datetime, UTC
+from typing import ClassVar
 from beanie import Document, Link
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel
 from mock_interview_shared.schemas.enums import InterviewStatus
 from mock_interview_shared.schemas.messages import FeedbackScore
 from .user import User
@@ -11,10 +13,20 @@ class Interview(Document):
     user: Link[User]
     question: Link[Question]
     audio_url: str
+    audio_sha256: str | None = None
     audio_transcript: str | None = None
     feedback: FeedbackScore | str | None = None
     status: InterviewStatus = InterviewStatus.PENDING
+    # Last SSE event id handed out for this interview, see next_interview_event_id
+    event_seq: int = 0
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
     class Settings:
         name = "interviews"
+        indexes: ClassVar[list[IndexModel]] = [
+            # Serves the per-user attempted-questions distinct without touching documents
+            IndexModel(
+                [("user.$id", ASCENDING), ("question.$id", ASCENDING)],
+                name="interview_user_question",
+            ),
+        ]
@@ -0,0 +1,37 @@
+from datetime import UTC, datetime
+from typing import ClassVar
+
+from beanie import Document, PydanticObjectId
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+
+class OutboxMessage(Document):
+    """A broker message recorded alongside the state change that caused it.
+
+    The outbox relay publishes pending rows (sent_at is None) and stamps sent_at
+    once the broker has confirmed them. While a relay is working on a row it holds
+    a lease (claim_token / claimed_until) so replicas don't publish it twice.
+    """
+
+    routing_key: str
+    body: str
+    # Only publish once this interview exists; see Outbox.relay_once
+    interview_id: PydanticObjectId | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    sent_at: datetime | None = None
+    attempts: int = 0
+    last_error: str | None = None
+    claim_token: str | None = None
+    claimed_until: datetime | None = None
+
+    class Settings:
+        name = "outbox"
+        indexes: ClassVar[list[IndexModel]] = [
+            # Pending rows, oldest first
+            IndexModel([("sent_at", ASCENDING), ("created_at", ASCENDING)], name="outbox_pending"),
+            # Sent rows are only kept for a week of debugging; pending rows (null) never expire
+            IndexModel(
+                [("sent_at", ASCENDING)], expireAfterSeconds=7 * 24 * 3600, name="outbox_sent_ttl"
+            ),
+        ]
@@ -1,4 +1,7 @@
+from typing import ClassVar
+
 from beanie import Document, Indexed
+from pymongo import ASCENDING, TEXT, IndexModel
 from mock_interview_shared.schemas.enums import Difficulty, Category
 
 
@@ -13,3 +16,26 @@ class Question(Document):
 
     class Settings:
         name = "questions"
+        indexes: ClassVar[list[IndexModel]] = [
+            # Ranked full-text search; topic matches count three times as much as body text
+            IndexModel(
+                [("topic", TEXT), ("text", TEXT)],
+                weights={"topic": 3, "text": 1},
+                name="question_text_search",
+            ),
+            # Listing filters on category and/or difficulty and pages by (topic, _id)
+            IndexModel(
+                [
+                    ("category", ASCENDING),
+                    ("difficulty", ASCENDING),
+                    ("topic", ASCENDING),
+                    ("_id", ASCENDING),
+                ],
+                name="question_category_difficulty_topic",
+            ),
+            IndexModel(
+                [("difficulty", ASCENDING), ("topic", ASCENDING), ("_id", ASCENDING)],
+                name="question_difficulty_topic",
+            ),
+            IndexModel([("topic", ASCENDING), ("_id", ASCENDING)], name="question_topic"),
+        ]
@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ..config import settings
-from ..dependencies import get_current_user
+from ..dependencies import get_current_user, password_hasher, user_cache
 from ..models.user import User
 from ..schemas.auth import LoginRequest, RegisterRequest, TokenResponse, UserResponse
-from ..services.auth import create_token, hash_password, verify_password
+from ..services.auth import create_token
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -19,9 +19,11 @@ async def register(body: RegisterRequest) -> TokenResponse:
         )
     user = User(
         email=body.email,
-        hashed_password=hash_password(body.password),
+        hashed_password=await password_hasher.hash(body.password),
     )
     await user.insert()
+    # An earlier account under this email may still be cached
+    await user_cache.invalidate_user(user.email)
     token = create_token(
         body.email,
         settings.jwt_secret,
@@ -34,7 +36,7 @@ async def register(body: RegisterRequest) -> TokenResponse:
 @router.post("/login", response_model=TokenResponse)
 async def login(body: LoginRequest) -> TokenResponse:
     user = await User.find_one(User.email == body.email)
-    if user is None or not verify_password(body.password, user.hashed_password):
+    if user is None or not await password_hasher.verify(body.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -1,28 +1,36 @@
-from fastapi import APIRouter, Header, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, Request, status
 from bson import ObjectId
 
-from mock_interview_shared.schemas.enums import InterviewStatus, MessageType
-from mock_interview_shared.schemas.messages import FeedbackResult, TranscriptResult
-
 from ..config import settings
-from ..dependencies import manager
+from ..dependencies import (
+    manager,
+    outbox,
+    password_hasher,
+    question_catalog,
+    question_responses,
+)
 from ..models.interview import Interview
 from ..schemas.interviews import InternalResultRequest
+from ..services.results import apply_result
 
 router = APIRouter(prefix="/internal", tags=["internal"])
 
 
-@router.post("/submit-result", status_code=status.HTTP_200_OK)
-async def submit_result(
-    body: InternalResultRequest,
-    x_internal_secret: str = Header(..., alias="X-Internal-Secret"),
-) -> dict:
+def _check_internal_secret(x_internal_secret: str) -> None:
     if x_internal_secret != settings.internal_api_secret:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Forbidden",
         )
 
+
+@router.post("/submit-result", status_code=status.HTTP_200_OK)
+async def submit_result(
+    body: InternalResultRequest,
+    x_internal_secret: str = Header(..., alias="X-Internal-Secret"),
+) -> dict:
+    _check_internal_secret(x_internal_secret)
+
     if not ObjectId.is_valid(body.interview_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -36,27 +44,22 @@ async def submit_result(
             detail="Interview not found",
         )
 
-    if body.type == MessageType.TRANSCRIPT:
-        assert isinstance(body, TranscriptResult)
-        interview.audio_transcript = body.transcript
-        interview.status = InterviewStatus.PROCESSING
-        await interview.save()
-
-    elif body.type == MessageType.FEEDBACK:
-        assert isinstance(body, FeedbackResult)
-        interview.feedback = body.feedback
-        interview.status = InterviewStatus.DONE
-        await interview.save()
-
-        payload = {
-            "type": "feedback",
-            "interview_id": body.interview_id,
-            "feedback": (
-                body.feedback.model_dump()
-                if hasattr(body.feedback, "model_dump")
-                else body.feedback
-            ),
-        }
-        await manager.send(body.interview_id, payload)
+    await apply_result(interview, body)
 
     return {"message": "acknowledged"}
+
+
+@router.get("/metrics", status_code=status.HTTP_200_OK)
+async def metrics(
+    request: Request,
+    x_internal_secret: str = Header(..., alias="X-Internal-Secret"),
+) -> dict:
+    _check_internal_secret(x_internal_secret)
+    return {
+        "password_hasher": password_hasher.stats(),
+        "publisher": request.app.state.publisher.stats(),
+        "outbox": outbox.stats(),
+        "sse": manager.stats(),
+        "question_catalog": question_catalog.stats(),
+        "question_responses": question_responses.stats(),
+    }
@@ -2,23 +2,48 @@ import asyncio
 import json
 from typing import AsyncGenerator
 
-from beanie import WriteRules
+from beanie import Link, PydanticObjectId, WriteRules
 from bson import ObjectId
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Request,
+    UploadFile,
+    status,
+)
 from fastapi.responses import StreamingResponse
+from mock_interview_shared.schemas.enums import InterviewStatus
 
 from ..config import settings
-from ..dependencies import get_current_user, get_mq_channel, manager
+from ..dependencies import (
+    attempted_cache,
+    find_question_by_slug,
+    get_current_user,
+    manager,
+    outbox,
+)
 from ..models.interview import Interview
-from ..models.question import Question
 from ..models.user import User
 from ..schemas.interviews import FeedbackResponse, InterviewFeedback, SubmitRecordingResponse
-from ..services.files import LocalFileStorage
-from ..services.mq_publisher import publish_transcript_request
+from ..services.files import LocalFileStorage, UploadTooLargeError
+from ..services.mq_publisher import enqueue_transcript_request
+from ..services.results import failure_event, feedback_event
+from ..services.sse import Subscription
 
 router = APIRouter(prefix="/interviews", tags=["interviews"])
 
-_file_storage = LocalFileStorage(settings.file_storage_path)
+_file_storage = LocalFileStorage(settings.file_storage_path, settings.max_upload_bytes)
+
+
+def _owner_id(interview: Interview) -> str:
+    # Without fetch_links the user is still an unresolved Link holding a DBRef
+    if isinstance(interview.user, Link):
+        return str(interview.user.ref.id)
+    return str(interview.user.id)
 
 
 @router.post("/submit-recording", response_model=SubmitRecordingResponse)
@@ -27,32 +52,43 @@ async def submit_recording(
     question_id: str = Form(...),
     audio_response: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
-    channel=Depends(get_mq_channel),
 ) -> SubmitRecordingResponse:
-    question = await Question.find_one(Question.slug == question_id.lower())
+    question = await find_question_by_slug(question_id.lower())
     if question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Question not found",
         )
 
-    filename = await _file_storage.save(audio_response)
+    try:
+        stored = await _file_storage.save(audio_response)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail="Recording exceeds the maximum upload size",
+        )
 
     interview = Interview(
+        id=PydanticObjectId(),
         user=current_user,  # type: ignore[arg-type]
         question=question,  # type: ignore[arg-type]
-        audio_url=filename,
+        audio_url=stored.filename,
+        audio_sha256=stored.sha256,
     )
-    await interview.insert(link_rule=WriteRules.DO_NOTHING)
-
-    await publish_transcript_request(
-        channel=channel,
-        interview_id=str(interview.id),
-        recording_path=filename,
+    # Job first, interview second: the relay holds the job until the interview exists,
+    # and drops it if the interview never appears, so the two cannot diverge
+    await enqueue_transcript_request(
+        outbox,
+        interview_id=interview.id,  # type: ignore[arg-type]
+        recording_path=stored.filename,
+        audio_sha256=stored.sha256,
         question_text=question.text,
         difficulty=question.difficulty,
         category=question.category,
     )
+    await interview.insert(link_rule=WriteRules.DO_NOTHING)
+    outbox.wake()
+    await attempted_cache.record_attempt(current_user.id, question.id)  # type: ignore[arg-type]
 
     return SubmitRecordingResponse(message="success", interview=str(interview.id))
 
@@ -76,10 +112,7 @@ async def get_interview_feedback(
         )
 
     # Ensure user owns this interview
-    interview_user_id = (
-        str(interview.user.id) if hasattr(interview.user, "id") else str(interview.user)
-    )
-    if interview_user_id != str(current_user.id):
+    if _owner_id(interview) != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Interview does not belong to current user",
@@ -110,8 +143,7 @@ async def get_interview_feedback(
 
 
 async def _sse_event_generator(
-    interview_id: str,
-    queue: asyncio.Queue,
+    subscription: Subscription,
     request: Request,
 ) -> AsyncGenerator[str, None]:
     try:
@@ -119,15 +151,30 @@ async def _sse_event_generator(
             if await request.is_disconnected():
                 break
             try:
-                data = await asyncio.wait_for(queue.get(), timeout=15.0)
-                yield f"data: {json.dumps(data)}\n\n"
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=15.0)
+                if event is None:
+                    # Disconnected by the slow-consumer policy; the client will reconnect
+                    break
+                if event["id"] is not None:
+                    yield f"id: {event['id']}\n"
+                yield f"data: {json.dumps(event['data'])}\n\n"
             except asyncio.TimeoutError:
                 # Send keep-alive comment
                 yield ": keep-alive\n\n"
     except asyncio.CancelledError:
         pass
     finally:
-        manager.disconnect(interview_id)
+        manager.disconnect(subscription)
+
+
+def _parse_event_id(last_event_id: str | None) -> int | None:
+    """The Last-Event-ID header as an id, or None when missing or not one of ours."""
+    if not last_event_id:
+        return None
+    try:
+        return int(last_event_id)
+    except ValueError:
+        return None
 
 
 @router.get("/{id}/stream")
@@ -135,6 +182,7 @@ async def stream_interview(
     id: str,
     request: Request,
     current_user: User = Depends(get_current_user),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
 ) -> StreamingResponse:
     if not ObjectId.is_valid(id):
         raise HTTPException(
@@ -149,20 +197,30 @@ async def stream_interview(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Interview not found",
         )
-    interview_user_id = (
-        str(interview.user.id) if hasattr(interview.user, "id") else str(interview.user)
-    )
-    if interview_user_id != str(current_user.id):
+    if _owner_id(interview) != str(current_user.id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Interview does not belong to current user",
         )
 
-    queue: asyncio.Queue = asyncio.Queue()
-    manager.connect(id, queue)
+    resume_after = _parse_event_id(last_event_id)
+    subscription = manager.connect(id, resume_after)
+    if (
+        interview.status == InterviewStatus.DONE
+        and resume_after is None
+        and subscription.replayed == 0
+    ):
+        # Feedback landed before this client connected and is no longer buffered
+        manager.push_snapshot(subscription, feedback_event(id, interview.feedback))
+    elif (
+        interview.status == InterviewStatus.FAILED
+        and resume_after is None
+        and subscription.replayed == 0
+    ):
+        manager.push_snapshot(subscription, failure_event(id))
 
     return StreamingResponse(
-        _sse_event_generator(id, queue, request),
+        _sse_event_generator(subscription, request),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
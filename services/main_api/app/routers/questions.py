@@ -1,13 +1,33 @@
+import asyncio
+import base64
 import math
-from typing import Optional
+from collections.abc import Awaitable, Callable
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from beanie.operators import In
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel
 
-from ..dependencies import get_optional_user
-from ..models.interview import Interview
+from ..config import settings
+from ..dependencies import (
+    attempted_cache,
+    find_question_by_slug,
+    get_optional_user,
+    question_catalog,
+    question_index,
+    question_responses,
+)
 from ..models.question import Question
 from ..models.user import User
 from ..schemas.questions import PaginationMeta, QuestionListResponse, QuestionResponse
+from ..services.http_cache import (
+    body_etag,
+    etag_matches,
+    json_response,
+    make_etag,
+    not_modified,
+)
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
@@ -26,14 +46,152 @@ def _question_to_response(q: Question, has_attempted: bool = False) -> QuestionR
     )
 
 
+def _encode_cursor(q: Question) -> str:
+    return base64.urlsafe_b64encode(f"{q.id}:{q.topic}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, ObjectId]:
+    try:
+        question_id, topic = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return topic, ObjectId(question_id)
+    except (ValueError, InvalidId) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
+async def _find_page(
+    filter_dict: dict, sort: dict, skip: int, limit: int
+) -> tuple[list[Question], int]:
+    """Fetch one page and the total match count in a single $facet round trip.
+
+    $match and $sort come before the $facet so the server can walk an index in order;
+    stages inside a $facet never use indexes.
+    """
+    # Beanie prepends the $match for filter_dict
+    pipeline = [
+        {"$sort": sort},
+        {
+            "$facet": {
+                "items": [{"$skip": skip}, {"$limit": limit}],
+                "total": [{"$count": "n"}],
+            }
+        },
+    ]
+    [result] = await Question.find(filter_dict).aggregate(pipeline).to_list()
+    questions = [Question.model_validate(doc) for doc in result["items"]]
+    total = result["total"][0]["n"] if result["total"] else 0
+    return questions, total
+
+
+def _text_search(filter_dict: dict, search: str) -> tuple[dict, dict]:
+    """Filter and sort for a $text query: best matches first, then (topic, _id) for ties.
+
+    Served by the question_text_search index.
+    """
+    query = {**filter_dict, "$text": {"$search": search}}
+    sort = {"score": {"$meta": "textScore"}, "topic": 1, "_id": 1}
+    return query, sort
+
+
+async def _seek_page(
+    filter_dict: dict, after: tuple[str, ObjectId], limit: int
+) -> tuple[list[Question], int]:
+    """Keyset page: seek past (topic, _id) on the index instead of skipping.
+
+    The page and the total count are independent queries, so they run concurrently.
+    """
+    topic, question_id = after
+    seek_filter = {
+        **filter_dict,
+        "$or": [{"topic": {"$gt": topic}}, {"topic": topic, "_id": {"$gt": question_id}}],
+    }
+    questions, total = await asyncio.gather(
+        Question.find(seek_filter).sort("topic", "_id").limit(limit).to_list(),
+        Question.find(filter_dict).count(),
+    )
+    return questions, total
+
+
+def _public_cache_control() -> str:
+    return f"public, max-age={settings.question_cache_max_age}"
+
+
+async def _serve_anonymous(
+    request: Request,
+    key: tuple,
+    render: Callable[[], Awaitable[BaseModel]],
+    from_catalog: bool = True,
+) -> Response:
+    """Serve a response that depends only on `key` and the question data.
+
+    With the catalog loaded the ETag comes from the catalog fingerprint, so a
+    revalidation is answered before any work, and rendered bodies are kept in
+    question_responses so repeat hits skip the query and serialization entirely.
+    That only holds if `render` reads the catalog: pass from_catalog=False when it
+    queries Mongo, and the ETag is taken from the body instead.
+    """
+    if not (from_catalog and question_catalog.loaded):
+        body = (await render()).model_dump_json().encode()
+        return _conditional(request, body, _public_cache_control())
+
+    fingerprint = question_catalog.fingerprint
+    etag = make_etag(fingerprint, *key)
+    if etag_matches(request, etag):
+        return not_modified(etag, _public_cache_control())
+    entry = question_responses.get(fingerprint, key)
+    if entry is None:
+        body = (await render()).model_dump_json().encode()
+        entry = question_responses.put(fingerprint, key, body, etag)
+    return json_response(entry.body, entry.etag, _public_cache_control())
+
+
+def _conditional(request: Request, body: bytes, cache_control: str) -> Response:
+    etag = body_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_control)
+    return json_response(body, etag, cache_control)
+
+
 @router.get("", response_model=QuestionListResponse)
 async def list_questions(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    category: Optional[str] = Query(None),
-    difficulty: Optional[str] = Query(None),
-    search: Optional[str] = Query(None),
-    current_user: Optional[User] = Depends(get_optional_user),
+    category: str | None = Query(None),
+    difficulty: str | None = Query(None),
+    search: str | None = Query(None),
+    after: str | None = Query(None, description="Keyset cursor from pagination.next_cursor"),
+    current_user: User | None = Depends(get_optional_user),
+) -> Response:
+    if after and search:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor pagination is not supported together with search",
+        )
+
+    async def render() -> QuestionListResponse:
+        return await _list_questions(page, limit, category, difficulty, search, after, current_user)
+
+    if current_user is None:
+        key = ("list", page, limit, category, difficulty, search, after)
+        # Mongo's $text search ranks from the collection, not the catalog snapshot
+        from_catalog = not search or settings.question_search_backend == "memory"
+        return await _serve_anonymous(request, key, render, from_catalog)
+    # has_attempted makes this user's copy private; the ETag still spares re-downloads
+    body = (await render()).model_dump_json().encode()
+    return _conditional(request, body, "private, no-cache")
+
+
+async def _list_questions(
+    page: int,
+    limit: int,
+    category: str | None,
+    difficulty: str | None,
+    search: str | None,
+    after: str | None,
+    current_user: User | None,
 ) -> QuestionListResponse:
     # Build pymongo filter dict
     filter_dict: dict = {}
@@ -41,28 +199,48 @@ async def list_questions(
         filter_dict["category"] = category
     if difficulty:
         filter_dict["difficulty"] = difficulty
-    if search:
-        filter_dict["$or"] = [
-            {"topic": {"$regex": search, "$options": "i"}},
-            {"text": {"$regex": search, "$options": "i"}},
-        ]
 
     skip = (page - 1) * limit
+    next_cursor: str | None = None
 
-    questions = await Question.find(filter_dict).sort("topic").skip(skip).limit(limit).to_list()
-    total = await Question.find(filter_dict).count()
+    if search and settings.question_search_backend == "memory":
+        ranked_ids = question_index.search(search, category=category, difficulty=difficulty)
+        total = len(ranked_ids)
+        page_ids = ranked_ids[skip : skip + limit]
+        if question_catalog.loaded:
+            found = [question_catalog.get(qid) for qid in page_ids]
+            questions = [q for q in found if q is not None]
+        else:
+            object_ids = [ObjectId(qid) for qid in page_ids]
+            by_id = {q.id: q for q in await Question.find(In(Question.id, object_ids)).to_list()}
+            questions = [by_id[oid] for oid in object_ids if oid in by_id]
+    elif search:
+        query, sort = _text_search(filter_dict, search)
+        questions, total = await _find_page(query, sort, skip, limit)
+    else:
+        # One extra row tells us whether a next page exists
+        if question_catalog.loaded:
+            questions, total = question_catalog.page(
+                category,
+                difficulty,
+                skip=skip,
+                limit=limit + 1,
+                after=_decode_cursor(after) if after else None,
+            )
+        elif after:
+            questions, total = await _seek_page(filter_dict, _decode_cursor(after), limit + 1)
+        else:
+            questions, total = await _find_page(
+                filter_dict, {"topic": 1, "_id": 1}, skip, limit + 1
+            )
+        if len(questions) > limit:
+            questions = questions[:limit]
+            next_cursor = _encode_cursor(questions[-1])
 
     # Build has_attempted map if user is logged in
     attempted_ids: set[str] = set()
     if current_user and questions:
-        q_ids = [q.id for q in questions]
-        interviews = await Interview.find(
-            {"question.$id": {"$in": q_ids}, "user.$id": current_user.id},
-            fetch_links=True,
-        ).to_list()
-        for interview in interviews:
-            if isinstance(interview.question, Question):
-                attempted_ids.add(str(interview.question.id))
+        attempted_ids = await attempted_cache.get(current_user.id)  # type: ignore[arg-type]
 
     responses = [_question_to_response(q, str(q.id) in attempted_ids) for q in questions]
 
@@ -73,16 +251,20 @@ async def list_questions(
             page=page,
             limit=limit,
             pages=math.ceil(total / limit) if total else 0,
+            next_cursor=next_cursor,
         ),
     )
 
 
 @router.get("/{slug}", response_model=QuestionResponse)
-async def get_question(slug: str) -> QuestionResponse:
-    question = await Question.find_one(Question.slug == slug.lower())
-    if question is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Question not found",
-        )
-    return _question_to_response(question)
+async def get_question(request: Request, slug: str) -> Response:
+    async def render() -> QuestionResponse:
+        question = await find_question_by_slug(slug.lower())
+        if question is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Question not found",
+            )
+        return _question_to_response(question)
+
+    return await _serve_anonymous(request, ("question", slug.lower()), render)
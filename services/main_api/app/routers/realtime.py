@@ -2,37 +2,21 @@ import json
 
 from beanie import WriteRules
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
-from jose import JWTError
 
 from ..config import settings
+from ..dependencies import attempted_cache, find_question_by_slug, resolve_token_user
 from ..models.interview import Interview
-from ..models.question import Question
 from ..models.session import InterviewSession
 from ..models.user import User
-from ..services.auth import decode_token
 from ..services.realtime_proxy import run_proxy_session
 
 router = APIRouter(prefix="/interviews", tags=["realtime"])
 
 
 async def _get_ws_user(token: str | None, websocket: WebSocket) -> User | None:
-    if not token:
-        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
-        return None
-    try:
-        payload = decode_token(token, settings.jwt_secret, settings.jwt_algorithm)
-        email: str | None = payload.get("email")
-        if email is None:
-            await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
-            return None
-    except JWTError:
-        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
-        return None
-
-    user = await User.find_one(User.email == email)
+    user = await resolve_token_user(token) if token else None
     if user is None:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
-        return None
     return user
 
 
@@ -48,7 +32,7 @@ async def live_interview(
     if user is None:
         return
 
-    question = await Question.find_one(Question.slug == question_slug)
+    question = await find_question_by_slug(question_slug)
     if question is None:
         await websocket.send_text(json.dumps({"type": "error", "detail": "Question not found"}))
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
@@ -68,6 +52,7 @@ async def live_interview(
         audio_url="",
     )
     await interview.insert(link_rule=WriteRules.DO_NOTHING)
+    await attempted_cache.record_attempt(user.id, question.id)  # type: ignore[arg-type]
 
     await websocket.send_text(
         json.dumps({"type": "session_created", "session_id": str(interview.id)})
@@ -80,7 +65,7 @@ async def live_interview(
             interview=interview,
             question=question,
             openai_api_key=settings.openai_api_key,
-            mq_connection=websocket.app.state.mq_connection,
+            publisher=websocket.app.state.publisher,
         )
     except WebSocketDisconnect:
         pass
@@ -1,6 +1,11 @@
 from typing import Annotated, Union
 from pydantic import BaseModel, Field
-from mock_interview_shared.schemas.messages import TranscriptResult, FeedbackResult
+from mock_interview_shared.schemas.messages import (
+    FailureResult,
+    FeedbackDelta,
+    FeedbackResult,
+    TranscriptResult,
+)
 from mock_interview_shared.schemas.enums import InterviewStatus
 from mock_interview_shared.schemas.messages import FeedbackScore
 
@@ -25,6 +30,6 @@ class FeedbackResponse(BaseModel):
 
 # Discriminated union for internal result — matches on the `type` field
 InternalResultRequest = Annotated[
-    Union[TranscriptResult, FeedbackResult],
+    Union[TranscriptResult, FeedbackResult, FeedbackDelta, FailureResult],
     Field(discriminator="type"),
 ]
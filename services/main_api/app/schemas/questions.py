@@ -19,6 +19,8 @@ class PaginationMeta(BaseModel):
     page: int
     limit: int
     pages: int
+    # Opaque keyset cursor for the next page; pass it back as ?after= (None on the last page)
+    next_cursor: str | None = None
 
 
 class QuestionListResponse(BaseModel):
@@ -0,0 +1,61 @@
+import json
+
+from beanie import PydanticObjectId
+
+from ..models.interview import Interview
+from .cache import CacheBackend
+
+
+def _attempted_key(user_id: PydanticObjectId | str) -> str:
+    return f"attempted:{user_id}"
+
+
+async def load_attempted_question_ids(user_id: PydanticObjectId) -> set[str]:
+    """Ids of every question the user has an interview for.
+
+    A distinct over the interview_user_question index: no $lookup and no documents
+    are fetched, only the index keys.
+    """
+    question_ids = await Interview.distinct("question.$id", {"user.$id": user_id})
+    return {str(question_id) for question_id in question_ids}
+
+
+class AttemptedQuestionsCache:
+    """Caches each user's set of attempted question ids for the question listing.
+
+    record_attempt() adds to a cached set in place when an interview is created, so
+    the next listing needs no query at all. The update is read-modify-write, so two
+    replicas recording for the same user at once can lose one id; the TTL bounds how
+    long such a miss lasts.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, user_id: PydanticObjectId) -> set[str]:
+        raw = await self.backend.get(_attempted_key(user_id))
+        if raw is not None:
+            return set(json.loads(raw))
+        attempted = await load_attempted_question_ids(user_id)
+        await self._store(user_id, attempted)
+        return attempted
+
+    async def record_attempt(
+        self, user_id: PydanticObjectId | str, question_id: PydanticObjectId | str
+    ) -> None:
+        raw = await self.backend.get(_attempted_key(user_id))
+        if raw is None:
+            # Nothing cached: the next get() loads a set that already includes it
+            return
+        attempted = set(json.loads(raw))
+        attempted.add(str(question_id))
+        await self._store(user_id, attempted)
+
+    async def invalidate(self, user_id: PydanticObjectId | str) -> None:
+        await self.backend.delete(_attempted_key(user_id))
+
+    async def _store(self, user_id: PydanticObjectId | str, attempted: set[str]) -> None:
+        await self.backend.set(
+            _attempted_key(user_id), json.dumps(sorted(attempted)), self.ttl_seconds
+        )
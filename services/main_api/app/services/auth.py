@@ -1,4 +1,9 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Any
+
 from passlib.context import CryptContext
 from jose import jwt, JWTError  # noqa: F401 — re-exported for callers
 
@@ -13,6 +18,54 @@ def verify_password(plain: str, hashed: str) -> bool:
     return _pwd_context.verify(plain, hashed)
 
 
+class PasswordHasher:
+    """Runs bcrypt in a dedicated, size-limited thread pool.
+
+    Each hash/verify costs ~100-300 ms of CPU; on the event loop that stalls every
+    other request, SSE keep-alive and realtime proxy on the worker. bcrypt releases
+    the GIL, so the pool also hashes in parallel. Calls beyond max_workers wait in
+    the executor queue, which stats() reports.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+        self._peak_queued = 0
+        self._completed = 0
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="bcrypt")
+        self._in_flight += 1
+        self._peak_queued = max(self._peak_queued, self._in_flight - self.max_workers)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._run(verify_password, plain, hashed)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "max_workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.max_workers),
+            "peak_queued": self._peak_queued,
+            "completed": self._completed,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
 def create_token(email: str, secret: str, algorithm: str, expire_days: int) -> str:
     expire = datetime.utcnow() + timedelta(days=expire_days)
     payload = {"sub": email, "email": email, "exp": expire}
@@ -0,0 +1,91 @@
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+import aio_pika
+from aio_pika.abc import (
+    AbstractChannel,
+    AbstractExchange,
+    AbstractIncomingMessage,
+    AbstractRobustConnection,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fanout exchange every main_api replica binds a private queue to
+EVENTS_EXCHANGE = "interview_events"
+
+Deliver = Callable[[str, dict], Awaitable[None]]
+
+
+class BroadcastBackend(Protocol):
+    """Carries SSE events to whichever process holds the subscriber's connection."""
+
+    async def start(self, deliver: Deliver) -> None: ...
+    async def publish(self, interview_id: str, data: dict) -> None: ...
+    async def stop(self) -> None: ...
+
+
+class InMemoryBroadcast:
+    """Delivers straight to this process — correct only for a single worker, and tests."""
+
+    def __init__(self, deliver: Deliver | None = None) -> None:
+        self._deliver = deliver
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, interview_id: str, data: dict) -> None:
+        if self._deliver is not None:
+            await self._deliver(interview_id, data)
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+
+class RabbitMQBroadcast:
+    """Fans events out to every replica through a RabbitMQ fanout exchange.
+
+    Each process consumes from its own exclusive, auto-delete queue, so whichever
+    replica ingests a result reaches the one holding the SSE connection. Events are
+    transient: messages are non-persistent and consumed without acks.
+    """
+
+    def __init__(self, connection: AbstractRobustConnection) -> None:
+        self._connection = connection
+        self._channel: AbstractChannel | None = None
+        self._exchange: AbstractExchange | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._channel = await self._connection.channel()
+        self._exchange = await self._channel.declare_exchange(
+            EVENTS_EXCHANGE, aio_pika.ExchangeType.FANOUT, durable=True
+        )
+        queue = await self._channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(self._exchange)
+
+        async def on_message(message: AbstractIncomingMessage) -> None:
+            try:
+                envelope = json.loads(message.body)
+                await deliver(envelope["interview_id"], envelope["data"])
+            except (ValueError, KeyError, TypeError) as exc:
+                # Not JSON, or not an {"interview_id", "data"} envelope
+                logger.warning("Dropping malformed broadcast event: %s", exc)
+
+        await queue.consume(on_message, no_ack=True)
+
+    async def publish(self, interview_id: str, data: dict) -> None:
+        if self._exchange is None:
+            raise RuntimeError("RabbitMQBroadcast.publish called before start()")
+        body = json.dumps({"interview_id": interview_id, "data": data}).encode()
+        await self._exchange.publish(
+            aio_pika.Message(body=body, content_type="application/json"),
+            routing_key="",
+        )
+
+    async def stop(self) -> None:
+        if self._channel is not None:
+            await self._channel.close()
+        self._channel = None
+        self._exchange = None
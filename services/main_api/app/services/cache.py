@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class CacheBackend(Protocol):
+    """Minimal string key/value store with per-entry TTL."""
+
+    async def get(self, key: str) -> str | None: ...
+    async def set(self, key: str, value: str, ttl: float) -> None: ...
+    async def delete(self, *keys: str) -> None: ...
+    async def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU with TTL; the default backend and the one used in tests."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """Shared backend over any redis.asyncio-compatible client (Redis, Valkey, KeyDB...)."""
+
+    def __init__(self, client: Any, prefix: str = "mock-interview:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def get(self, key: str) -> str | None:
+        value = await self._client.get(self._prefix + key)
+        if value is None:
+            return None
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._client.set(self._prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self._prefix + key for key in keys))
+
+    async def clear(self) -> None:
+        async for key in self._client.scan_iter(match=self._prefix + "*"):
+            await self._client.delete(key)
+
+
+def create_cache_backend(redis_url: str | None, max_entries: int) -> CacheBackend:
+    """Return a Redis backend when a URL is configured, otherwise an in-memory LRU."""
+    if not redis_url:
+        return InMemoryCacheBackend(max_entries)
+    try:
+        import redis.asyncio as redis_asyncio  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise RuntimeError(
+            "CACHE_REDIS_URL is set but the 'redis' package is not installed"
+        ) from exc
+    return RedisCacheBackend(redis_asyncio.from_url(redis_url))
@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import itertools
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any
+
+from bson import ObjectId
+
+from ..models.question import Question
+from .search import QuestionSearchIndex
+
+logger = logging.getLogger(__name__)
+
+SortKey = tuple[str, ObjectId]
+
+# Per-collection edit counters, bumped by scripts/seed_questions.py whenever it
+# changes a question. Edits leave the count and newest _id alone, so without this
+# the refresher would never notice them.
+VERSIONS_COLLECTION = "collection_versions"
+
+
+def _value(enum_or_str: object) -> str:
+    return str(getattr(enum_or_str, "value", enum_or_str))
+
+
+def _sort_key(question: Question) -> SortKey:
+    return (question.topic, question.id)  # type: ignore[return-value]
+
+
+@dataclass
+class _View:
+    """Questions matching one (category, difficulty) filter, in (topic, _id) order."""
+
+    keys: list[SortKey] = field(default_factory=list)
+    questions: list[Question] = field(default_factory=list)
+
+
+@dataclass
+class _Snapshot:
+    fingerprint: str
+    by_id: dict[str, Question]
+    by_slug: dict[str, Question]
+    views: dict[tuple[str | None, str | None], _View]
+    search_index: QuestionSearchIndex | None
+
+
+async def bump_question_version(database: Any) -> None:
+    """Record that questions were edited, so every replica's refresher reloads them."""
+    await database[VERSIONS_COLLECTION].update_one(
+        {"_id": Question.Settings.name}, {"$inc": {"version": 1}}, upsert=True
+    )
+
+
+async def _source_version() -> tuple[int, ObjectId | None, int]:
+    """(count, newest _id, edit counter) of the questions collection: three indexed reads."""
+    collection = Question.get_pymongo_collection()
+    count = await collection.count_documents({})
+    newest = await collection.find_one({}, {"_id": 1}, sort=[("_id", -1)])
+    edits = await collection.database[VERSIONS_COLLECTION].find_one({"_id": Question.Settings.name})
+    return (
+        count,
+        newest["_id"] if newest else None,
+        edits["version"] if edits else 0,
+    )
+
+
+class QuestionCatalog:
+    """In-process copy of the question bank, indexed by id, slug and filter.
+
+    Questions are near-static seed data, so they are loaded once at startup and
+    kept current by run_refresher(). Every (category, difficulty) combination the
+    listing accepts, including "any", is materialised as a pre-sorted view, so a
+    page is a slice (or a bisect for keyset cursors) with no I/O.
+
+    Until load() or refresh() has run, `loaded` is False and callers should go to
+    Mongo. Returned Question objects are shared: treat them as read-only.
+    """
+
+    def __init__(self, search_index: QuestionSearchIndex | None = None) -> None:
+        self.search_index = search_index
+        self.version = 0
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the current snapshot; identical on every replica with the same data."""
+        return self._fingerprint
+
+    def load(self, questions: list[Question]) -> bool:
+        """Swap in a new snapshot; returns False if it matches the current one."""
+        snapshot = self._prepare(questions)
+        if snapshot is None:
+            return False
+        self._install(snapshot)
+        return True
+
+    def _prepare(self, questions: list[Question]) -> _Snapshot | None:
+        """Build a snapshot without touching live state, so it can run in a thread."""
+        ordered = sorted(questions, key=_sort_key)
+        fingerprint = hashlib.sha256(
+            b"\n".join(q.model_dump_json().encode() for q in ordered)
+        ).hexdigest()
+        if self.loaded and fingerprint == self._fingerprint:
+            return None
+
+        views: dict[tuple[str | None, str | None], _View] = {}
+        for question in ordered:
+            category, difficulty = _value(question.category), _value(question.difficulty)
+            for view_key in itertools.product((category, None), (difficulty, None)):
+                view = views.setdefault(view_key, _View())
+                view.keys.append(_sort_key(question))
+                view.questions.append(question)
+
+        search_index = None
+        if self.search_index is not None:
+            search_index = QuestionSearchIndex()
+            search_index.build(ordered)
+        return _Snapshot(
+            fingerprint=fingerprint,
+            by_id={str(q.id): q for q in ordered},
+            by_slug={q.slug: q for q in ordered},
+            views=views,
+            search_index=search_index,
+        )
+
+    def _install(self, snapshot: _Snapshot) -> None:
+        # Plain rebinds with no awaits in between, so on the event loop readers see
+        # either the old snapshot or the new one, never a mix
+        self._by_id = snapshot.by_id
+        self._by_slug = snapshot.by_slug
+        self._views = snapshot.views
+        if self.search_index is not None and snapshot.search_index is not None:
+            self.search_index.replace(snapshot.search_index)
+        self._fingerprint = snapshot.fingerprint
+        self.loaded = True
+        self.version += 1
+
+    def clear(self) -> None:
+        self.loaded = False
+        self._fingerprint = ""
+        self._source: tuple[int, ObjectId | None, int] | None = None
+        self._by_id: dict[str, Question] = {}
+        self._by_slug: dict[str, Question] = {}
+        self._views: dict[tuple[str | None, str | None], _View] = {}
+
+    async def refresh(self) -> bool:
+        """Re-read every question; the snapshot is rebuilt in a worker thread."""
+        # Taken before the read, so a write racing it shows up as a change next time
+        self._source = await _source_version()
+        questions = await Question.find_all().to_list()
+        snapshot = await asyncio.to_thread(self._prepare, questions)
+        if snapshot is None:
+            return False
+        self._install(snapshot)
+        logger.info("Question catalog loaded: %d questions (v%d)", len(self), self.version)
+        return True
+
+    async def refresh_if_changed(self) -> bool:
+        """Refresh only if the collection's count, newest _id or edit counter moved."""
+        if self._source is not None and await _source_version() == self._source:
+            return False
+        return await self.refresh()
+
+    def get(self, question_id: str) -> Question | None:
+        return self._by_id.get(question_id)
+
+    def get_by_slug(self, slug: str) -> Question | None:
+        return self._by_slug.get(slug)
+
+    def page(
+        self,
+        category: str | None = None,
+        difficulty: str | None = None,
+        skip: int = 0,
+        limit: int = 10,
+        after: SortKey | None = None,
+    ) -> tuple[list[Question], int]:
+        """Return one page in (topic, _id) order and the total number of matches."""
+        view = self._views.get((category, difficulty))
+        if view is None:
+            return [], 0
+        start = bisect_right(view.keys, after) if after is not None else skip
+        return view.questions[start : start + limit], len(view.questions)
+
+    async def run_refresher(self, interval: float) -> None:
+        """Check for changes every `interval` seconds until cancelled.
+
+        Each tick is a cheap version probe; the collection is only re-read when the
+        probe moved, and the snapshot only swapped (and `version` bumped) when its
+        fingerprint changed too. Polling rather than a change stream, because change
+        streams need a replica set and the stock deployment runs a standalone mongod.
+        Errors are logged and the next tick tries again.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.refresh_if_changed()
+            except Exception:
+                logger.exception("Question catalog refresh failed")
+
+    def stats(self) -> dict[str, int]:
+        return {"questions": len(self), "version": self.version}
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import time
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractRobustConnection
+from aio_pika.exceptions import (
+    AMQPChannelError,
+    AMQPConnectionError,
+    AMQPError,
+    ChannelInvalidStateError,
+    DeliveryError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PublishFailedError(Exception):
+    """The broker did not confirm a message: it was nacked, unroutable or timed out."""
+
+
+class _Slot:
+    def __init__(self) -> None:
+        self.channel: AbstractChannel | None = None
+        self.in_flight = 0
+        self.lock = asyncio.Lock()
+
+
+class ChannelPool:
+    """A fixed set of long-lived publisher channels shared by every request.
+
+    Channels are opened lazily with publisher confirms and on_return_raises, so a
+    publish only returns once the broker has taken responsibility for the message,
+    and an unroutable message (no queue bound) raises instead of vanishing.
+
+    Publishes on a channel are not serialised: concurrent messages share the
+    channel and the broker acknowledges them in batches (multiple=True acks), so
+    confirm waiting is amortised across requests. Each publish goes to the slot
+    with the fewest messages awaiting confirmation. A channel that has been closed
+    by a channel-level error is replaced on its next use.
+    """
+
+    def __init__(
+        self,
+        connection: AbstractRobustConnection,
+        size: int = 4,
+        confirm_timeout: float = 5.0,
+    ) -> None:
+        self._connection = connection
+        self.confirm_timeout = confirm_timeout
+        self._slots = [_Slot() for _ in range(size)]
+        self._published = 0
+        self._failed = 0
+        self._replaced_channels = 0
+        self._in_flight_high_water = 0
+        self._confirm_seconds_total = 0.0
+
+    async def publish(self, message: aio_pika.Message, routing_key: str) -> None:
+        """Publish to the default exchange and wait for the broker's confirm.
+
+        Raises PublishFailedError when the message was not confirmed.
+        """
+        slot = min(self._slots, key=lambda s: s.in_flight)
+        slot.in_flight += 1
+        self._in_flight_high_water = max(
+            self._in_flight_high_water, sum(s.in_flight for s in self._slots)
+        )
+        started = time.perf_counter()
+        try:
+            channel = await self._channel(slot)
+            await channel.default_exchange.publish(
+                message, routing_key=routing_key, timeout=self.confirm_timeout
+            )
+        except (AMQPChannelError, ChannelInvalidStateError) as exc:
+            # The channel is unusable now; drop it so the next publish reopens it
+            self._failed += 1
+            await self._discard(slot)
+            raise PublishFailedError(f"channel error publishing to {routing_key!r}: {exc}") from exc
+        except (DeliveryError, AMQPConnectionError, TimeoutError) as exc:
+            self._failed += 1
+            # aiormq's DeliveryError for a nack carries no message and fails str(); name it
+            raise PublishFailedError(
+                f"broker did not confirm {routing_key!r}: {type(exc).__name__}"
+            ) from exc
+        finally:
+            slot.in_flight -= 1
+        self._published += 1
+        self._confirm_seconds_total += time.perf_counter() - started
+
+    async def _channel(self, slot: _Slot) -> AbstractChannel:
+        channel = slot.channel
+        if channel is not None and not channel.is_closed:
+            return channel
+        async with slot.lock:
+            if slot.channel is None or slot.channel.is_closed:
+                if slot.channel is not None:
+                    self._replaced_channels += 1
+                    logger.warning("Replacing closed publisher channel")
+                slot.channel = await self._connection.channel(
+                    publisher_confirms=True, on_return_raises=True
+                )
+            return slot.channel
+
+    async def _discard(self, slot: _Slot) -> None:
+        channel, slot.channel = slot.channel, None
+        if channel is None:
+            return
+        self._replaced_channels += 1
+        if not channel.is_closed:
+            try:
+                await channel.close()
+            except (AMQPError, ChannelInvalidStateError, ConnectionError) as exc:
+                logger.debug("Ignoring error closing broken channel: %s", exc)
+
+    async def close(self) -> None:
+        for slot in self._slots:
+            channel, slot.channel = slot.channel, None
+            if channel is not None and not channel.is_closed:
+                await channel.close()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "size": len(self._slots),
+            "open_channels": sum(
+                1 for s in self._slots if s.channel is not None and not s.channel.is_closed
+            ),
+            "in_flight": sum(s.in_flight for s in self._slots),
+            "in_flight_high_water": self._in_flight_high_water,
+            "published": self._published,
+            "failed": self._failed,
+            "replaced_channels": self._replaced_channels,
+            "avg_confirm_ms": (
+                round(self._confirm_seconds_total / self._published * 1000, 3)
+                if self._published
+                else 0.0
+            ),
+        }
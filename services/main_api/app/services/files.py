@@ -1,27 +1,82 @@
+import asyncio
+import hashlib
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol
+from typing import BinaryIO, Protocol
 
 from fastapi import UploadFile
 
+_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the storage's size limit."""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    filename: str
+    size: int
+    sha256: str
+
 
 class FileStorage(Protocol):
-    async def save(self, file: UploadFile) -> str: ...
+    async def save(self, file: UploadFile) -> StoredFile: ...
     def resolve(self, filename: str) -> str: ...
 
 
+class _Hasher(Protocol):
+    def update(self, data: bytes, /) -> None: ...
+
+
+def _write_chunk(out: BinaryIO, hasher: _Hasher, chunk: bytes) -> None:
+    # hashlib releases the GIL for large buffers, so hashing here stays off the loop too
+    hasher.update(chunk)
+    out.write(chunk)
+
+
 class LocalFileStorage:
-    def __init__(self, base_path: str) -> None:
+    def __init__(
+        self, base_path: str, max_bytes: int | None = None, chunk_size: int = _CHUNK_SIZE
+    ) -> None:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+
+    async def save(self, file: UploadFile) -> StoredFile:
+        """Stream the upload to disk chunk by chunk, hashing it on the way.
+
+        Memory use is bounded by chunk_size regardless of the upload size, and all
+        blocking file I/O runs in a worker thread. Raises UploadTooLargeError once
+        max_bytes is exceeded and removes the partial file. Starlette has spooled
+        the whole upload by now, so this only keeps it out of storage; refusing
+        the transfer itself is ContentLengthLimitMiddleware's job.
+        """
+        if self.max_bytes is not None and file.size is not None and file.size > self.max_bytes:
+            raise UploadTooLargeError(f"Upload of {file.size} bytes exceeds {self.max_bytes}")
 
-    async def save(self, file: UploadFile) -> str:
         ext = Path(file.filename or "audio").suffix or ".webm"
         filename = f"{uuid.uuid4()}{ext}"
         dest = self.base_path / filename
-        content = await file.read()
-        dest.write_bytes(content)
-        return filename
+        hasher = hashlib.sha256()
+        size = 0
+
+        out = await asyncio.to_thread(dest.open, "wb")
+        try:
+            while chunk := await file.read(self.chunk_size):
+                size += len(chunk)
+                if self.max_bytes is not None and size > self.max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds {self.max_bytes} bytes")
+                await asyncio.to_thread(_write_chunk, out, hasher, chunk)
+        except BaseException:
+            await asyncio.to_thread(out.close)
+            await asyncio.to_thread(dest.unlink, True)
+            raise
+        await asyncio.to_thread(out.close)
+
+        return StoredFile(filename=filename, size=size, sha256=hasher.hexdigest())
 
     def resolve(self, filename: str) -> str:
         return str(self.base_path / filename)
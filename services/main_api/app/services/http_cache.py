@@ -0,0 +1,93 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Strong ETag over the given parts; equal inputs give equal tags on every replica."""
+    digest = hashlib.sha256("\x1f".join(map(str, parts)).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match names `etag` (weak comparison, as RFC 9110 asks)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def _headers(etag: str, cache_control: str) -> dict[str, str]:
+    # Authorization switches a listing between shared and personalised payloads
+    return {"ETag": etag, "Cache-Control": cache_control, "Vary": "Authorization"}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_headers(etag, cache_control))
+
+
+def json_response(body: bytes, etag: str, cache_control: str) -> Response:
+    return Response(
+        content=body, media_type="application/json", headers=_headers(etag, cache_control)
+    )
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    body: bytes
+    etag: str
+
+
+class ResponseBodyCache:
+    """Serialized response bodies for one catalog snapshot, bounded LRU.
+
+    Entries are tied to the fingerprint they were rendered from: the first get()
+    or put() with a new fingerprint drops everything cached for the old one.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._fingerprint: str | None = None
+        self._entries: OrderedDict[Hashable, CachedBody] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, fingerprint: str, key: Hashable) -> CachedBody | None:
+        self._check_fingerprint(fingerprint)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(self, fingerprint: str, key: Hashable, body: bytes, etag: str) -> CachedBody:
+        self._check_fingerprint(fingerprint)
+        entry = CachedBody(body, etag)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._fingerprint = None
+        self._entries.clear()
+
+    def _check_fingerprint(self, fingerprint: str) -> None:
+        if fingerprint != self._fingerprint:
+            self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self._entries), "hits": self._hits, "misses": self._misses}
@@ -1,31 +1,30 @@
-import aio_pika
-from aio_pika.abc import AbstractChannel
+from beanie import PydanticObjectId
 from mock_interview_shared.schemas.messages import TranscriptRequest
 from mock_interview_shared.schemas.enums import Difficulty, Category
 
+from .outbox import Outbox
 
-async def publish_transcript_request(
-    channel: AbstractChannel,
-    interview_id: str,
+
+async def enqueue_transcript_request(
+    outbox: Outbox,
+    interview_id: PydanticObjectId,
     recording_path: str,
     question_text: str,
     difficulty: Difficulty | None = None,
     category: Category | None = None,
+    audio_sha256: str | None = None,
 ) -> None:
+    """Record a transcript job in the outbox; the relay publishes it once the interview exists."""
     request = TranscriptRequest(
-        interview=interview_id,
+        interview=str(interview_id),
         recording_path=recording_path,
+        audio_sha256=audio_sha256,
         question=question_text,
         difficulty=difficulty,
         category=category,
     )
-    body = request.model_dump_json(by_alias=True).encode()
-    message = aio_pika.Message(
-        body=body,
-        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-        content_type="application/json",
-    )
-    await channel.default_exchange.publish(
-        message,
-        routing_key="transcript_processing",
+    await outbox.enqueue(
+        "transcript_processing",
+        request.model_dump_json(by_alias=True),
+        interview_id=interview_id,
     )
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import aio_pika
+from beanie import PydanticObjectId
+from beanie.operators import In
+
+from ..models.interview import Interview
+from ..models.outbox import OutboxMessage
+from .channel_pool import ChannelPool
+
+logger = logging.getLogger(__name__)
+
+
+def _aware(value: datetime) -> datetime:
+    # Mongo hands datetimes back naive (but UTC)
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _claimable(now: datetime) -> dict:
+    return {"sent_at": None, "$or": [{"claimed_until": None}, {"claimed_until": {"$lt": now}}]}
+
+
+class Outbox:
+    """Transactional outbox for broker messages, plus the relay that drains it.
+
+    A request records its message with enqueue() as part of the same logical step
+    as the document it concerns, then returns without waiting on the broker. The
+    relay task publishes pending rows in batches through the ChannelPool, so
+    confirms for a batch are awaited together, and marks them sent; a failed
+    publish is retried with backoff. Delivery is at-least-once: a crash between
+    the confirm and marking the row sent republishes it.
+
+    Rows carrying an interview_id are only published once that interview exists,
+    so callers write the outbox row first and the interview second: if the process
+    dies in between, the orphaned row is dropped after orphan_grace_seconds and no
+    interview is ever left waiting on a job that was never queued.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 30.0,
+        orphan_grace_seconds: float = 60.0,
+    ) -> None:
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._relayed = 0
+        self._failed = 0
+        self._orphaned = 0
+        self._last_batch = 0
+        self._lag_seconds = 0.0
+
+    async def enqueue(
+        self,
+        routing_key: str,
+        body: str,
+        interview_id: PydanticObjectId | None = None,
+    ) -> OutboxMessage:
+        row = OutboxMessage(routing_key=routing_key, body=body, interview_id=interview_id)
+        await row.insert()
+        return row
+
+    def wake(self) -> None:
+        """Ask the relay to run now instead of at its next poll."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def start(self, publisher: ChannelPool) -> None:
+        # Created here so it binds to the loop the relay actually runs on
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(publisher, self._wake))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+        self._wake = None
+
+    async def _run(self, publisher: ChannelPool, wake: asyncio.Event) -> None:
+        while True:
+            wake.clear()
+            try:
+                sent = await self.relay_once(publisher)
+            except Exception:
+                logger.exception("Outbox relay pass failed")
+                sent = 0
+            if sent >= self.batch_size:
+                continue  # Backlog: go straight on to the next batch
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(wake.wait(), self.poll_interval)
+
+    async def relay_once(self, publisher: ChannelPool) -> int:
+        """Claim, publish and mark one batch of pending rows; returns how many were sent."""
+        now = datetime.now(UTC)
+        oldest = await OutboxMessage.find({"sent_at": None}).sort("created_at").first_or_none()
+        self._lag_seconds = (now - _aware(oldest.created_at)).total_seconds() if oldest else 0.0
+
+        rows = await self._claim(now)
+        self._last_batch = len(rows)
+        if not rows:
+            return 0
+
+        rows = await self._drop_orphans(rows, now)
+        results = await asyncio.gather(
+            *(publisher.publish(self._amqp_message(row), row.routing_key) for row in rows),
+            return_exceptions=True,
+        )
+
+        sent_ids = [
+            row.id for row, result in zip(rows, results) if not isinstance(result, BaseException)
+        ]
+        if sent_ids:
+            await OutboxMessage.find(In(OutboxMessage.id, sent_ids)).update(
+                {"$set": {"sent_at": datetime.now(UTC), "claim_token": None, "claimed_until": None}}
+            )
+        for row, result in zip(rows, results):
+            if isinstance(result, BaseException):
+                await self._record_failure(row, result)
+        self._relayed += len(sent_ids)
+        return len(sent_ids)
+
+    async def _claim(self, now: datetime) -> list[OutboxMessage]:
+        candidates = (
+            await OutboxMessage.find(_claimable(now))
+            .sort("created_at")
+            .limit(self.batch_size)
+            .to_list()
+        )
+        if not candidates:
+            return []
+        # Lease the batch; rows another replica claimed in the meantime don't match
+        token = uuid4().hex
+        await OutboxMessage.find(
+            {**_claimable(now), "_id": {"$in": [row.id for row in candidates]}}
+        ).update(
+            {
+                "$set": {
+                    "claim_token": token,
+                    "claimed_until": now + timedelta(seconds=self.lease_seconds),
+                }
+            }
+        )
+        return await OutboxMessage.find({"claim_token": token}).sort("created_at").to_list()
+
+    async def _drop_orphans(self, rows: list[OutboxMessage], now: datetime) -> list[OutboxMessage]:
+        wanted = [row.interview_id for row in rows if row.interview_id is not None]
+        if not wanted:
+            return rows
+        existing = set(await Interview.distinct("_id", {"_id": {"$in": wanted}}))
+        publishable: list[OutboxMessage] = []
+        for row in rows:
+            if row.interview_id is None or row.interview_id in existing:
+                publishable.append(row)
+                continue
+            age = (now - _aware(row.created_at)).total_seconds()
+            if age > self.orphan_grace_seconds:
+                # The interview was never written: retire the row without publishing
+                self._orphaned += 1
+                logger.warning(
+                    "Dropping outbox row %s: interview %s missing", row.id, row.interview_id
+                )
+                await row.set(
+                    {"sent_at": now, "last_error": "interview missing", "claim_token": None}
+                )
+            else:
+                # Its interview insert is probably still in flight; retry on the next pass
+                await row.set({"claim_token": None, "claimed_until": None})
+        return publishable
+
+    async def _record_failure(self, row: OutboxMessage, exc: BaseException) -> None:
+        self._failed += 1
+        attempts = row.attempts + 1
+        backoff = min(self.lease_seconds, 2.0**attempts)
+        logger.warning("Outbox publish of %s failed (attempt %d): %s", row.id, attempts, exc)
+        await row.set(
+            {
+                "attempts": attempts,
+                "last_error": str(exc),
+                "claim_token": None,
+                "claimed_until": datetime.now(UTC) + timedelta(seconds=backoff),
+            }
+        )
+
+    @staticmethod
+    def _amqp_message(row: OutboxMessage) -> aio_pika.Message:
+        return aio_pika.Message(
+            body=row.body.encode(),
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            content_type="application/json",
+            # Lets consumers recognise an at-least-once redelivery
+            message_id=str(row.id),
+        )
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "lag_seconds": round(self._lag_seconds, 3),
+            "relayed": self._relayed,
+            "failed": self._failed,
+            "orphaned": self._orphaned,
+            "last_batch": self._last_batch,
+        }
@@ -4,7 +4,6 @@ import json
 import logging
 
 import aio_pika
-from aio_pika.abc import AbstractRobustConnection
 from fastapi import WebSocket, WebSocketDisconnect
 from websockets.asyncio.client import connect as ws_connect
 
@@ -14,6 +13,7 @@ from mock_interview_shared.schemas.messages import FeedbackRequest
 from ..models.interview import Interview
 from ..models.question import Question
 from ..models.session import InterviewSession, SessionMessage
+from .channel_pool import ChannelPool
 
 logger = logging.getLogger(__name__)
 
@@ -30,29 +30,25 @@ _SYSTEM_PROMPT = (
 
 
 async def _publish_feedback(
-    mq_connection: AbstractRobustConnection,
+    publisher: ChannelPool,
     interview_id: str,
     question: Question,
     transcript: str,
 ) -> None:
-    channel = await mq_connection.channel()
-    try:
-        request = FeedbackRequest(
-            interview=interview_id,
-            transcript=transcript,
-            question=question.text,
-            difficulty=question.difficulty,
-            category=question.category,
-        )
-        body = request.model_dump_json(by_alias=True).encode()
-        msg = aio_pika.Message(
-            body=body,
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-            content_type="application/json",
-        )
-        await channel.default_exchange.publish(msg, routing_key="feedback_processing")
-    finally:
-        await channel.close()
+    request = FeedbackRequest(
+        interview=interview_id,
+        transcript=transcript,
+        question=question.text,
+        difficulty=question.difficulty,
+        category=question.category,
+    )
+    body = request.model_dump_json(by_alias=True).encode()
+    msg = aio_pika.Message(
+        body=body,
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        content_type="application/json",
+    )
+    await publisher.publish(msg, routing_key="feedback_processing")
 
 
 async def run_proxy_session(
@@ -61,7 +57,7 @@ async def run_proxy_session(
     interview: Interview,
     question: Question,
     openai_api_key: str,
-    mq_connection: AbstractRobustConnection,
+    publisher: ChannelPool,
 ) -> None:
     accumulated: list[SessionMessage] = []
     headers = {
@@ -173,6 +169,6 @@ async def run_proxy_session(
     if accumulated:
         transcript = "\n".join(f"{m.role}: {m.content}" for m in accumulated)
         try:
-            await _publish_feedback(mq_connection, str(interview.id), question, transcript)
+            await _publish_feedback(publisher, str(interview.id), question, transcript)
         except Exception as exc:
             logger.error("Failed to publish feedback request: %s", exc)
@@ -0,0 +1,86 @@
+from mock_interview_shared.schemas.enums import InterviewStatus, MessageType
+from mock_interview_shared.schemas.messages import (
+    FailureResult,
+    FeedbackDelta,
+    FeedbackResult,
+    FeedbackScore,
+    TranscriptResult,
+)
+
+from ..dependencies import manager
+from ..models.interview import Interview
+
+
+def feedback_event(interview_id: str, feedback: FeedbackScore | str | None) -> dict:
+    """SSE payload announcing an interview's feedback."""
+    return {
+        "type": "feedback",
+        "interview_id": interview_id,
+        "feedback": feedback.model_dump() if hasattr(feedback, "model_dump") else feedback,
+    }
+
+
+def feedback_delta_event(delta: FeedbackDelta) -> dict:
+    """SSE payload carrying the next piece of feedback text while it is generated."""
+    return {
+        "type": "feedback.delta",
+        "interview_id": delta.interview_id,
+        "attempt": delta.attempt,
+        "seq": delta.seq,
+        "delta": delta.delta,
+    }
+
+
+async def relay_feedback_delta(delta: FeedbackDelta) -> None:
+    """Pass a delta straight to SSE listeners; deltas are neither stored nor replayed."""
+    await manager.send(delta.interview_id, feedback_delta_event(delta), replay=False)
+
+
+def failure_event(interview_id: str) -> dict:
+    """SSE payload announcing that an interview could not be processed."""
+    return {"type": "failure", "interview_id": interview_id}
+
+
+async def apply_result(
+    interview: Interview,
+    result: TranscriptResult | FeedbackResult | FeedbackDelta | FailureResult,
+) -> None:
+    """Apply a worker result to its interview and notify any SSE listener.
+
+    Results for one interview can be handled concurrently, so each one is a single
+    filtered update of its own fields rather than a read-modify-save of the document.
+    """
+    if result.type == MessageType.TRANSCRIPT:
+        assert isinstance(result, TranscriptResult)
+        await Interview.find_one(Interview.id == interview.id).update(
+            {"$set": {"audio_transcript": result.transcript}}
+        )
+        # Feedback may have landed first; don't move a finished interview back
+        await Interview.find_one(
+            Interview.id == interview.id, Interview.status != InterviewStatus.DONE
+        ).update({"$set": {"status": InterviewStatus.PROCESSING}})
+
+    elif result.type == MessageType.FEEDBACK:
+        assert isinstance(result, FeedbackResult)
+        await Interview.find_one(Interview.id == interview.id).update(
+            {"$set": {"feedback": result.feedback, "status": InterviewStatus.DONE}}
+        )
+
+        await manager.send(
+            result.interview_id, feedback_event(result.interview_id, result.feedback)
+        )
+
+    elif result.type == MessageType.FEEDBACK_DELTA:
+        assert isinstance(result, FeedbackDelta)
+        await relay_feedback_delta(result)
+
+    elif result.type == MessageType.FAILURE:
+        assert isinstance(result, FailureResult)
+        update = await Interview.find_one(
+            Interview.id == interview.id, Interview.status != InterviewStatus.DONE
+        ).update({"$set": {"status": InterviewStatus.FAILED}})
+        if not update.matched_count:
+            # A late failure from a redelivered job; the feedback already landed
+            return
+
+        await manager.send(result.interview_id, failure_event(result.interview_id))
@@ -0,0 +1,61 @@
+import logging
+
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractRobustConnection
+from bson import ObjectId
+from mock_interview_shared.schemas.enums import MessageType
+from mock_interview_shared.schemas.messages import FeedbackDelta
+from pydantic import TypeAdapter, ValidationError
+
+from ..models.interview import Interview
+from ..schemas.interviews import InternalResultRequest
+from .results import apply_result, relay_feedback_delta
+
+logger = logging.getLogger(__name__)
+
+RESULTS_QUEUE = "results_to_main_api"
+
+_result_adapter: TypeAdapter[InternalResultRequest] = TypeAdapter(InternalResultRequest)
+
+
+async def handle_result_message(message: AbstractIncomingMessage) -> None:
+    """Consume one worker result — same transitions as POST /internal/submit-result."""
+    async with message.process(requeue=False):
+        try:
+            result = _result_adapter.validate_json(message.body)
+        except ValidationError as exc:
+            logger.error("Discarding malformed result message: %s", exc)
+            return
+
+        if result.type == MessageType.FEEDBACK_DELTA:
+            # Many per interview and only for live listeners: skip the database
+            assert isinstance(result, FeedbackDelta)
+            await relay_feedback_delta(result)
+            return
+
+        if not ObjectId.is_valid(result.interview_id):
+            logger.error("Discarding result with invalid interview id %s", result.interview_id)
+            return
+
+        interview = await Interview.get(ObjectId(result.interview_id))
+        if interview is None:
+            logger.warning("Discarding result for unknown interview %s", result.interview_id)
+            return
+
+        await apply_result(interview, result)
+        logger.info("Applied %s result for interview %s", result.type, result.interview_id)
+
+
+async def start_results_consumer(
+    connection: AbstractRobustConnection, prefetch_count: int
+) -> AbstractChannel:
+    """Open a dedicated channel and start draining the results queue.
+
+    prefetch_count bounds how many unacked results are in flight at once, so a burst
+    of worker output queues up in RabbitMQ instead of piling onto the event loop.
+    Closing the returned channel stops the consumer.
+    """
+    channel = await connection.channel()
+    await channel.set_qos(prefetch_count=prefetch_count)
+    queue = await channel.declare_queue(RESULTS_QUEUE, durable=True)
+    await queue.consume(handle_result_message)
+    return channel
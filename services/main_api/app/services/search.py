@@ -0,0 +1,108 @@
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+
+from ..models.question import Question
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Same relative weights as the Mongo text index on Question
+FIELD_WEIGHTS = {"topic": 3.0, "text": 1.0}
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class _Entry:
+    category: str
+    difficulty: str
+    topic: str
+
+
+class QuestionSearchIndex:
+    """In-process inverted index over the question bank, ranked by weighted TF-IDF.
+
+    Meant for deployments where the whole catalog fits in memory: a search is a few
+    dict lookups instead of a Mongo round trip. Query terms are OR-ed, like Mongo's
+    $text, and results are ordered by score, then topic.
+    """
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[str, float]] = {}
+        self._entries: dict[str, _Entry] = {}
+        self._doc_terms: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def build(self, questions: list[Question]) -> None:
+        self._postings = {}
+        self._entries = {}
+        self._doc_terms = {}
+        for question in questions:
+            self.add(question)
+
+    def replace(self, other: "QuestionSearchIndex") -> None:
+        """Take over the contents of `other`, e.g. an index built off the event loop."""
+        self._postings, self._entries, self._doc_terms = (
+            other._postings,
+            other._entries,
+            other._doc_terms,
+        )
+
+    def add(self, question: Question) -> None:
+        question_id = str(question.id)
+        self.remove(question_id)
+        self._entries[question_id] = _Entry(
+            category=str(getattr(question.category, "value", question.category)),
+            difficulty=str(getattr(question.difficulty, "value", question.difficulty)),
+            topic=question.topic,
+        )
+        weights: Counter[str] = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(getattr(question, field)):
+                weights[term] += weight
+        for term, weight in weights.items():
+            self._postings.setdefault(term, {})[question_id] = weight
+        self._doc_terms[question_id] = list(weights)
+
+    def remove(self, question_id: str) -> None:
+        if self._entries.pop(question_id, None) is None:
+            return
+        for term in self._doc_terms.pop(question_id, []):
+            docs = self._postings[term]
+            docs.pop(question_id, None)
+            if not docs:
+                del self._postings[term]
+
+    def search(
+        self,
+        query: str,
+        category: str | None = None,
+        difficulty: str | None = None,
+    ) -> list[str]:
+        """Return matching question ids, best match first."""
+        total = len(self._entries)
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + total / len(docs))
+            for question_id, weight in docs.items():
+                scores[question_id] = scores.get(question_id, 0.0) + weight * idf
+
+        matches = [
+            question_id
+            for question_id in scores
+            if (category is None or self._entries[question_id].category == category)
+            and (difficulty is None or self._entries[question_id].difficulty == difficulty)
+        ]
+        matches.sort(key=lambda qid: (-scores[qid], self._entries[qid].topic))
+        return matches
+
+    async def rebuild(self) -> None:
+        self.build(await Question.find_all().to_list())
@@ -0,0 +1,184 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from typing import Literal
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from ..models.interview import Interview
+from .broadcast import BroadcastBackend, InMemoryBroadcast
+
+SlowConsumerPolicy = Literal["drop_oldest", "disconnect"]
+
+# Returns the next event id for an interview; ids only need to grow along one interview
+EventIds = Callable[[str], Awaitable[int]]
+
+
+async def next_interview_event_id(interview_id: str) -> int:
+    """Number an interview's events from a counter on its document.
+
+    Every replica increments the same counter, so ids grow along each interview's
+    stream whichever replica raised the event, and Last-Event-ID replay can filter
+    by id without trusting replica clocks.
+    """
+    document = await Interview.get_pymongo_collection().find_one_and_update(
+        {"_id": ObjectId(interview_id)},
+        {"$inc": {"event_seq": 1}},
+        projection={"event_seq": 1},
+        return_document=ReturnDocument.AFTER,
+    )
+    # Deleted in the meantime: nobody can subscribe to it any more
+    return document["event_seq"] if document is not None else 0
+
+
+class Subscription:
+    """One SSE client's bounded event queue. A None item means "closed by the server".
+
+    Queued events are {"id": int | None, "data": dict}; `replayed` counts the
+    buffered events that were queued when the subscription was opened.
+    """
+
+    def __init__(self, interview_id: str, maxsize: int) -> None:
+        self.interview_id = interview_id
+        self.queue: asyncio.Queue[dict | None] = asyncio.Queue(maxsize)
+        self.replayed = 0
+
+
+class ConnectionManager:
+    """SSE connection manager — any number of bounded subscriptions per interview_id.
+
+    send() stamps each event with an id from `event_ids` (by default a counter in this
+    process) and goes through a BroadcastBackend, so an event raised on any replica
+    reaches the process holding the subscriber; delivery into local queues happens
+    in _deliver. Every delivered event is also kept in a
+    short-lived per-interview ring buffer, which connect() replays from a client's
+    Last-Event-ID so events raised before (re)connecting are not lost.
+
+    When a subscriber's queue is full, the slow-consumer policy either drops its
+    oldest pending event or disconnects it, so a stalled reader cannot grow memory.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 32,
+        policy: SlowConsumerPolicy = "drop_oldest",
+        replay_size: int = 50,
+        replay_ttl_seconds: float = 300.0,
+        replay_max_interviews: int = 10_000,
+        event_ids: EventIds | None = None,
+    ) -> None:
+        self.max_queue_size = max_queue_size
+        self.policy = policy
+        self.replay_size = replay_size
+        self.replay_ttl_seconds = replay_ttl_seconds
+        self.replay_max_interviews = replay_max_interviews
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        # interview_id -> (last update, recent events), oldest update first
+        self._history: OrderedDict[str, tuple[float, deque[dict]]] = OrderedDict()
+        self._backend: BroadcastBackend = InMemoryBroadcast(self._deliver)
+        self._event_ids = event_ids or self._next_local_event_id
+        self._last_event_id = 0
+        self._dropped_events = 0
+        self._disconnected_slow_consumers = 0
+        self._queue_high_water = 0
+
+    async def use_backend(self, backend: BroadcastBackend) -> None:
+        await backend.start(self._deliver)
+        self._backend = backend
+
+    async def close(self) -> None:
+        await self._backend.stop()
+        self._backend = InMemoryBroadcast(self._deliver)
+
+    def connect(self, interview_id: str, last_event_id: int | None = None) -> Subscription:
+        """Subscribe to an interview, first queueing buffered events after last_event_id."""
+        subscription = Subscription(interview_id, self.max_queue_size)
+        # Never replay more than fits, so replay alone can't trip the slow-consumer policy
+        for event in self._replay(interview_id, last_event_id)[-self.max_queue_size :]:
+            self._offer(subscription, event)
+            subscription.replayed += 1
+        self._subscriptions.setdefault(interview_id, set()).add(subscription)
+        return subscription
+
+    def disconnect(self, subscription: Subscription) -> None:
+        subscribers = self._subscriptions.get(subscription.interview_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscriptions[subscription.interview_id]
+
+    async def send(self, interview_id: str, data: dict, replay: bool = True) -> None:
+        """Broadcast an event; with replay=False it carries no id and is not buffered."""
+        event_id = await self._event_ids(interview_id) if replay else None
+        await self._backend.publish(interview_id, {"id": event_id, "data": data})
+
+    def push_snapshot(self, subscription: Subscription, data: dict) -> None:
+        """Queue a state snapshot for one subscriber; it carries no id and is not buffered."""
+        self._offer(subscription, {"id": None, "data": data})
+
+    async def _next_local_event_id(self, interview_id: str) -> int:
+        self._last_event_id += 1
+        return self._last_event_id
+
+    async def _deliver(self, interview_id: str, event: dict) -> None:
+        self._record(interview_id, event)
+        for subscription in list(self._subscriptions.get(interview_id, ())):
+            self._offer(subscription, event)
+
+    def _record(self, interview_id: str, event: dict) -> None:
+        if self.replay_size <= 0 or event["id"] is None:
+            return
+        now = time.monotonic()
+        entry = self._history.pop(interview_id, None)
+        events = entry[1] if entry is not None else deque(maxlen=self.replay_size)
+        events.append(event)
+        self._history[interview_id] = (now, events)
+        self._prune_history(now)
+
+    def _replay(self, interview_id: str, last_event_id: int | None) -> list[dict]:
+        self._prune_history(time.monotonic())
+        entry = self._history.get(interview_id)
+        if entry is None:
+            return []
+        return [e for e in entry[1] if last_event_id is None or e["id"] > last_event_id]
+
+    def _prune_history(self, now: float) -> None:
+        while self._history:
+            interview_id, (updated_at, _) = next(iter(self._history.items()))
+            expired = now - updated_at > self.replay_ttl_seconds
+            if not expired and len(self._history) <= self.replay_max_interviews:
+                break
+            del self._history[interview_id]
+
+    def _offer(self, subscription: Subscription, event: dict) -> None:
+        queue = subscription.queue
+        if queue.full():
+            if self.policy == "disconnect":
+                self._disconnect_slow(subscription)
+                return
+            queue.get_nowait()
+            self._dropped_events += 1
+        queue.put_nowait(event)
+        self._queue_high_water = max(self._queue_high_water, queue.qsize())
+
+    def _disconnect_slow(self, subscription: Subscription) -> None:
+        queue = subscription.queue
+        self._dropped_events += queue.qsize() + 1
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+        self._disconnected_slow_consumers += 1
+        self.disconnect(subscription)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "interviews": len(self._subscriptions),
+            "active_subscribers": sum(len(subs) for subs in self._subscriptions.values()),
+            "dropped_events": self._dropped_events,
+            "disconnected_slow_consumers": self._disconnected_slow_consumers,
+            "queue_high_water": self._queue_high_water,
+            "replay_buffered_interviews": len(self._history),
+        }
@@ -0,0 +1,62 @@
+import hashlib
+import json
+import time
+
+from ..models.user import User
+from .cache import CacheBackend
+
+
+def _token_key(token: str) -> str:
+    # Never use the raw bearer token as a cache key
+    return "token:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+def _email_key(email: str) -> str:
+    return "user:" + email
+
+
+class UserCache:
+    """Caches decoded token → email and email → User for authenticated requests.
+
+    Token entries never outlive the JWT's own expiry, so a cached token is only
+    trusted while decode_token would still accept it. Call invalidate_user()
+    after creating, changing or deleting a user, and invalidate_token() to revoke a
+    token early.
+
+    The password hash is never written to the cache (it may be a shared Redis), so
+    cached users come back with an empty hashed_password: read the user from Mongo
+    to check a password, and never save() a cached one.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    async def get_email_for_token(self, token: str) -> str | None:
+        return await self.backend.get(_token_key(token))
+
+    async def remember_token(self, token: str, email: str, expires_at: float | None) -> None:
+        ttl = self.ttl_seconds
+        if expires_at is not None:
+            ttl = min(ttl, expires_at - time.time())
+        if ttl > 0:
+            await self.backend.set(_token_key(token), email, ttl)
+
+    async def get_user(self, email: str) -> User | None:
+        raw = await self.backend.get(_email_key(email))
+        if raw is None:
+            return None
+        return User.model_validate({**json.loads(raw), "hashed_password": ""})
+
+    async def set_user(self, user: User) -> None:
+        profile = user.model_dump_json(exclude={"hashed_password"})
+        await self.backend.set(_email_key(user.email), profile, self.ttl_seconds)
+
+    async def invalidate_user(self, email: str) -> None:
+        await self.backend.delete(_email_key(email))
+
+    async def invalidate_token(self, token: str) -> None:
+        await self.backend.delete(_token_key(token))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
@@ -0,0 +1,73 @@
+"""Measure event-loop lag while bcrypt logins run inline vs. in the hashing pool.
+
+    uv run python scripts/bench_password_hashing.py --logins 32 --workers 4
+
+A probe task sleeps in short intervals and records how late it wakes up; that
+overshoot is the latency every other coroutine on the worker would see.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Ensure the app package is importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.services.auth import PasswordHasher, hash_password, verify_password
+
+_PROBE_INTERVAL = 0.005
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(_PROBE_INTERVAL)
+        lags.append(time.perf_counter() - start - _PROBE_INTERVAL)
+
+
+async def _inline_login(password: str, hashed: str) -> bool:
+    # What routers/auth.py used to do: bcrypt directly on the event loop
+    return verify_password(password, hashed)
+
+
+async def _run(label: str, logins: int, login) -> None:  # type: ignore[no-untyped-def]
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    await asyncio.sleep(_PROBE_INTERVAL * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    p99 = lags_ms[int(len(lags_ms) * 0.99) - 1] if len(lags_ms) > 1 else lags_ms[0]
+    print(
+        f"{label:<10} logins={logins:<4} wall={elapsed:6.2f}s  "
+        f"loop lag: median={statistics.median(lags_ms):7.1f}ms  "
+        f"p99={p99:7.1f}ms  max={lags_ms[-1]:7.1f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    hashed = hash_password("benchmark-password")
+    hasher = PasswordHasher(args.workers)
+
+    await _run("inline", args.logins, lambda: _inline_login("benchmark-password", hashed))
+    await _run("pooled", args.logins, lambda: hasher.verify("benchmark-password", hashed))
+    print(f"pool stats: {hasher.stats()}")
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""Compare question listing strategies on a large collection.
+
+    uv run python scripts/bench_question_listing.py --size 100000 --pages 1 100 1000 5000
+
+For each page depth this times:
+  find+count  the old two queries, sort("topic").skip().limit() plus count()
+  facet       one $facet aggregation returning the page and the total
+  keyset      seeking past the previous page's last (topic, _id) via a cursor
+
+Seeds synthetic questions into a scratch database on the server in MONGO_URI
+(dropped afterwards), with the indexes declared on Question.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Ensure the app package is importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import beanie
+from mock_interview_shared.schemas.enums import Category, Difficulty
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.config import settings
+from app.models.question import Question
+from app.routers.questions import _find_page, _seek_page
+
+_LIMIT = 10
+_FILTER = {"category": Category.BEHAVIORAL.value}
+
+
+async def _seed(size: int) -> None:
+    rng = random.Random(size)
+    categories = list(Category)
+    difficulties = list(Difficulty)
+    batch: list[Question] = []
+    for i in range(size):
+        batch.append(
+            Question(
+                topic=f"Topic {rng.randrange(size):07d}",
+                text="Synthetic benchmark question",
+                difficulty=rng.choice(difficulties),
+                category=rng.choice(categories),
+                slug=f"bench-{i}",
+            )
+        )
+        if len(batch) == 5000:
+            await Question.insert_many(batch)
+            batch = []
+    if batch:
+        await Question.insert_many(batch)
+
+
+async def _find_and_count(skip: int) -> None:
+    await Question.find(_FILTER).sort("topic", "_id").skip(skip).limit(_LIMIT).to_list()
+    await Question.find(_FILTER).count()
+
+
+async def _facet(skip: int) -> None:
+    await _find_page(_FILTER, {"topic": 1, "_id": 1}, skip, _LIMIT)
+
+
+async def _time(label: str, run, repeat: int) -> None:  # type: ignore[no-untyped-def]
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    print(f"    {label:<11} median={statistics.median(timings):8.2f}ms  max={max(timings):8.2f}ms")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database", default="mock_interview_listing_bench")
+    args = parser.parse_args()
+
+    motor_client: AsyncIOMotorClient = AsyncIOMotorClient(settings.mongo_uri)
+    database = motor_client[args.database]
+    try:
+        await motor_client.drop_database(args.database)
+        await beanie.init_beanie(database=database, document_models=[Question])
+        started = time.perf_counter()
+        await _seed(args.size)
+        print(f"Seeded {args.size} questions in {time.perf_counter() - started:.1f}s")
+
+        for page in args.pages:
+            skip = (page - 1) * _LIMIT
+            print(f"  page {page}")
+            await _time("find+count", lambda skip=skip: _find_and_count(skip), args.repeat)
+            await _time("facet", lambda skip=skip: _facet(skip), args.repeat)
+            if skip:
+                # The cursor a client would hold after reading the previous page
+                previous = (
+                    await Question.find(_FILTER).sort("topic", "_id").skip(skip - 1).first_or_none()
+                )
+                if previous is not None:
+                    after = (previous.topic, previous.id)
+                    await _time(
+                        "keyset",
+                        lambda after=after: _seek_page(_FILTER, after, _LIMIT),
+                        args.repeat,
+                    )
+    finally:
+        await motor_client.drop_database(args.database)
+        motor_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,137 @@
+"""Compare question search strategies: unanchored $regex vs. $text vs. the in-memory index.
+
+    uv run python scripts/bench_question_search.py --sizes 1000 10000 100000
+
+Seeds synthetic questions into a scratch database on the server in MONGO_URI
+(dropped afterwards), then times the same set of queries against each backend.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Ensure the app package is importable when run as a script
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import beanie
+from mock_interview_shared.schemas.enums import Category, Difficulty
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from app.config import settings
+from app.models.question import Question
+from app.routers.questions import _text_search
+from app.services.search import QuestionSearchIndex
+
+_WORDS = [
+    "conflict",
+    "team",
+    "leadership",
+    "deadline",
+    "failure",
+    "success",
+    "design",
+    "scale",
+    "cache",
+    "database",
+    "latency",
+    "customer",
+    "feedback",
+    "mentor",
+    "priority",
+    "tradeoff",
+    "outage",
+    "migration",
+    "review",
+    "goal",
+]
+_QUERIES = ["conflict", "team leadership", "database migration", "outage", "mentor goal"]
+_PAGE_SIZE = 10
+
+
+def _synthetic(n: int) -> list[Question]:
+    rng = random.Random(n)
+    categories = list(Category)
+    difficulties = list(Difficulty)
+    return [
+        Question(
+            topic=" ".join(rng.sample(_WORDS, 2)).title(),
+            text=" ".join(rng.choices(_WORDS, k=20)),
+            difficulty=rng.choice(difficulties),
+            category=rng.choice(categories),
+            slug=f"bench-{i}",
+        )
+        for i in range(n)
+    ]
+
+
+async def _regex(query: str) -> int:
+    pattern = {"$regex": re.escape(query), "$options": "i"}
+    flt = {"$or": [{"topic": pattern}, {"text": pattern}]}
+    await Question.find(flt).sort("topic").limit(_PAGE_SIZE).to_list()
+    return await Question.find(flt).count()
+
+
+async def _text(query: str) -> int:
+    # The same query and sort the questions router sends
+    flt, sort = _text_search({}, query)
+    await Question.find(flt).aggregate([{"$sort": sort}, {"$limit": _PAGE_SIZE}]).to_list()
+    return await Question.find(flt).count()
+
+
+def _memory(index: QuestionSearchIndex):  # type: ignore[no-untyped-def]
+    async def run(query: str) -> int:
+        return len(index.search(query))
+
+    return run
+
+
+async def _time(label: str, search, repeat: int) -> None:  # type: ignore[no-untyped-def]
+    timings: list[float] = []
+    for _ in range(repeat):
+        for query in _QUERIES:
+            started = time.perf_counter()
+            await search(query)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    print(
+        f"  {label:<8} median={statistics.median(timings):8.2f}ms  "
+        f"p95={timings[int(len(timings) * 0.95) - 1]:8.2f}ms  max={timings[-1]:8.2f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--database", default="mock_interview_search_bench")
+    args = parser.parse_args()
+
+    motor_client: AsyncIOMotorClient = AsyncIOMotorClient(settings.mongo_uri)
+    database = motor_client[args.database]
+    try:
+        for size in args.sizes:
+            await motor_client.drop_database(args.database)
+            await beanie.init_beanie(database=database, document_models=[Question])
+            questions = _synthetic(size)
+            await Question.insert_many(questions)
+
+            started = time.perf_counter()
+            index = QuestionSearchIndex()
+            index.build(questions)
+            print(f"{size} questions (index build {time.perf_counter() - started:.2f}s)")
+
+            await _time("regex", _regex, args.repeat)
+            await _time("text", _text, args.repeat)
+            await _time("memory", _memory(index), args.repeat)
+    finally:
+        await motor_client.drop_database(args.database)
+        motor_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
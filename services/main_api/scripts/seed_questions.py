@@ -1,51 +1,257 @@
+"""Upsert the question bank from a JSON, JSON Lines or XLSX file.
+
+    uv run python scripts/seed_questions.py                      # bundled seed/questions.json
+    uv run python scripts/seed_questions.py "../../data-sheet/QUESTIONS DATASHEET - 1.xlsx"
+    uv run python scripts/seed_questions.py bank.jsonl --dry-run # show what would change
+
+Rows are streamed from the file, never loaded all at once, and written as unordered
+UpdateOne(upsert=True) batches keyed by slug: one round trip per batch rather than
+two per question. Only the fields present in a row are written.
+"""
+
+import argparse
 import asyncio
 import json
+import re
 import sys
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 # Ensure the app package is importable when run as a script
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import beanie
-from motor.motor_asyncio import AsyncIOMotorClient
+from mock_interview_shared.schemas.enums import Category
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pydantic import ValidationError
+from pymongo import UpdateOne
 
 from app.config import settings
 from app.models.question import Question
+from app.services.catalog import bump_question_version
 
 _SEED_FILE = Path(__file__).resolve().parent / "seed" / "questions.json"
 
+# Column headers used by the question datasheet, mapped onto Question fields
+_HEADER_ALIASES = {"question": "text", "title": "topic"}
+_DIFFICULTY_ALIASES = {"e": "easy", "m": "medium", "h": "hard"}
+_SEPARATORS = re.compile(r"[\s,]*")
+
+
+@dataclass
+class SeedCounts:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    invalid: int = 0
+
+
+# ── Readers ───────────────────────────────────────────────────────────────
+
+
+def _iter_json_array(path: Path, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Yield the elements of a top-level JSON array, reading the file in chunks."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer = f.read(chunk_size)
+        while buffer.isspace():  # leading whitespace may span whole chunks
+            buffer = f.read(chunk_size)
+        buffer = buffer.lstrip()
+        if not buffer.startswith("["):
+            raise ValueError(f"{path}: expected a JSON array of questions")
+        pos = 1
+        while True:
+            pos = _SEPARATORS.match(buffer, pos).end()  # type: ignore[union-attr]
+            if buffer.startswith("]", pos):
+                return
+            try:
+                row, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            yield row
+
+
+def _iter_json_lines(path: Path) -> Iterator[dict]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _iter_xlsx(path: Path) -> Iterator[dict]:
+    """Yield one dict per sheet row, keyed by the lower-cased header row."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)  # type: ignore[union-attr]
+        headers = [str(h).strip().lower() if h is not None else "" for h in next(rows, ())]
+        for values in rows:
+            if any(v is not None for v in values):
+                yield {h: v for h, v in zip(headers, values) if h and v is not None}
+    finally:
+        workbook.close()
+
+
+def iter_rows(path: Path) -> Iterator[dict]:
+    suffix = path.suffix.lower()
+    if suffix == ".xlsx":
+        return _iter_xlsx(path)
+    if suffix in (".jsonl", ".ndjson"):
+        return _iter_json_lines(path)
+    return _iter_json_array(path)
+
+
+# ── Normalisation ─────────────────────────────────────────────────────────
+
+
+def _slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
 
-def _load_rows() -> list[dict]:
-    with open(_SEED_FILE) as f:
-        return json.load(f)
+
+def to_document(row: dict, default_category: Category) -> dict:
+    """Validate a raw row as a Question and return the fields to $set, keyed by name.
+
+    Accepts both the seed-file field names and the datasheet's headers (QUESTION,
+    TITLE, E/M/H difficulty, free-text CATEGORY falling back to default_category).
+    """
+    if not isinstance(row, dict):
+        raise TypeError(f"expected an object, got {type(row).__name__}")
+    fields = {_HEADER_ALIASES.get(str(k).lower(), str(k).lower()): v for k, v in row.items()}
+    fields = {k: v for k, v in fields.items() if k in Question.model_fields}
+    if isinstance(fields.get("difficulty"), str):
+        difficulty = fields["difficulty"].strip().lower()
+        fields["difficulty"] = _DIFFICULTY_ALIASES.get(difficulty, difficulty)
+    category = str(fields.get("category") or "").strip().lower()
+    known = {c.value for c in Category}
+    fields["category"] = category if category in known else default_category.value
+    if not fields.get("slug") and fields.get("topic"):
+        fields["slug"] = _slugify(str(fields["topic"]))
+    elif fields.get("slug"):
+        fields["slug"] = str(fields["slug"]).lower()
+
+    question = Question.model_validate(fields)
+    return question.model_dump(mode="json", exclude_unset=True, exclude={"id", "revision_id"})
+
+
+# ── Writing ───────────────────────────────────────────────────────────────
+
+
+async def _upsert(collection: AsyncIOMotorCollection, batch: dict[str, dict]) -> SeedCounts:
+    operations = [
+        UpdateOne({"slug": slug}, {"$set": document}, upsert=True)
+        for slug, document in batch.items()
+    ]
+    result = await collection.bulk_write(operations, ordered=False)
+    return SeedCounts(
+        inserted=result.upserted_count,
+        updated=result.modified_count,
+        unchanged=result.matched_count - result.modified_count,
+    )
+
+
+async def _diff(collection: AsyncIOMotorCollection, batch: dict[str, dict]) -> SeedCounts:
+    counts = SeedCounts()
+    existing = {
+        doc["slug"]: doc
+        async for doc in collection.find({"slug": {"$in": list(batch)}}, {"_id": 0})
+    }
+    for slug, document in batch.items():
+        current = existing.get(slug)
+        if current is None:
+            counts.inserted += 1
+            print(f"  + {slug}")
+            continue
+        changes = {k: (current.get(k), v) for k, v in document.items() if current.get(k) != v}
+        if not changes:
+            counts.unchanged += 1
+            continue
+        counts.updated += 1
+        print(f"  ~ {slug}")
+        for field, (old, new) in changes.items():
+            print(f"      {field}: {old!r} -> {new!r}")
+    return counts
+
+
+async def seed(
+    collection: AsyncIOMotorCollection,
+    rows: Iterator[dict],
+    batch_size: int,
+    default_category: Category,
+    dry_run: bool = False,
+) -> SeedCounts:
+    totals = SeedCounts()
+    apply = _diff if dry_run else _upsert
+
+    async def flush(batch: dict[str, dict]) -> None:
+        counts = await apply(collection, batch)
+        totals.inserted += counts.inserted
+        totals.updated += counts.updated
+        totals.unchanged += counts.unchanged
+
+    # Keyed by slug: a repeated slug within a batch keeps the last row, so one
+    # unordered batch never races two upserts for the same document
+    batch: dict[str, dict] = {}
+    for number, row in enumerate(rows, start=1):
+        try:
+            document = to_document(row, default_category)
+        except (ValidationError, ValueError, TypeError) as exc:
+            totals.invalid += 1
+            print(f"  ! row {number} skipped: {exc}".splitlines()[0])
+            continue
+        batch[document["slug"]] = document
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = {}
+    if batch:
+        await flush(batch)
+    if not dry_run and (totals.inserted or totals.updated):
+        # Running APIs reload their question catalog on their next refresh tick
+        await bump_question_version(collection.database)
+    return totals
 
 
 async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="?", type=Path, default=_SEED_FILE)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="print the diff, write nothing")
+    parser.add_argument(
+        "--default-category",
+        type=Category,
+        default=Category.BEHAVIORAL,
+        help="category for rows whose category is missing or not a known value",
+    )
+    args = parser.parse_args()
+
     motor_client: AsyncIOMotorClient = AsyncIOMotorClient(settings.mongo_uri)
     db_name = settings.mongo_uri.rsplit("/", 1)[-1].split("?")[0]
+    # Creates the unique slug index the upserts are keyed on
     await beanie.init_beanie(
         database=motor_client[db_name],
         document_models=[Question],
     )
+    collection = motor_client[db_name][Question.Settings.name]
+
+    print(f"\n{'Diffing' if args.dry_run else 'Seeding'} questions from {args.path}\n")
+    started = time.perf_counter()
+    counts = await seed(
+        collection, iter_rows(args.path), args.batch_size, args.default_category, args.dry_run
+    )
+    elapsed = time.perf_counter() - started
 
-    rows = _load_rows()
-    print(f"\nLoaded {len(rows)} question(s) from seed file\n")
-
-    upserted = 0
-    for row in rows:
-        slug = row["slug"]
-        existing = await Question.find_one(Question.slug == slug)
-        if existing:
-            for field, value in row.items():
-                setattr(existing, field, value)
-            await existing.save()
-            print(f"  Updated : {slug}")
-        else:
-            await Question(**row).insert()
-            print(f"  Inserted: {slug}")
-            upserted += 1
-
-    print(f"\nDone — {upserted} inserted, {len(rows) - upserted} updated")
+    verb = "would be " if args.dry_run else ""
+    print(
+        f"\nDone in {elapsed:.2f}s — {counts.inserted} {verb}inserted, "
+        f"{counts.updated} {verb}updated, {counts.unchanged} unchanged, "
+        f"{counts.invalid} invalid"
+    )
     motor_client.close()
 
 
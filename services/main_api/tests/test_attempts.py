@@ -0,0 +1,73 @@
+from beanie import WriteRules
+from mock_interview_shared.schemas.enums import Category, Difficulty
+
+
+async def _seed(email: str, slugs: list[str]):
+    from app.models.question import Question
+    from app.models.user import User
+
+    user = User(email=email, hashed_password="x")
+    await user.insert()
+    questions = []
+    for slug in slugs:
+        question = Question(
+            topic=slug,
+            text="Tell me about it",
+            difficulty=Difficulty.EASY,
+            category=Category.BEHAVIORAL,
+            slug=slug,
+        )
+        await question.insert()
+        questions.append(question)
+    return user, questions
+
+
+async def _attempt(user, question) -> None:
+    from app.models.interview import Interview
+
+    interview = Interview(user=user, question=question, audio_url="a.webm")
+    await interview.insert(link_rule=WriteRules.DO_NOTHING)
+
+
+async def test_load_attempted_question_ids_is_per_user(init_db) -> None:
+    from app.services.attempts import load_attempted_question_ids
+
+    alice, (q1, q2, _) = await _seed("alice@example.com", ["a-1", "a-2", "a-3"])
+    bob, _ = await _seed("bob@example.com", [])
+    await _attempt(alice, q1)
+    await _attempt(alice, q1)
+    await _attempt(alice, q2)
+    await _attempt(bob, q2)
+
+    assert await load_attempted_question_ids(alice.id) == {str(q1.id), str(q2.id)}
+    assert await load_attempted_question_ids(bob.id) == {str(q2.id)}
+
+
+async def test_cache_serves_repeat_reads_and_records_attempts(init_db) -> None:
+    from app.services.attempts import AttemptedQuestionsCache
+    from app.services.cache import InMemoryCacheBackend
+
+    user, (q1, q2) = await _seed("carol@example.com", ["c-1", "c-2"])
+    await _attempt(user, q1)
+    cache = AttemptedQuestionsCache(InMemoryCacheBackend(100), ttl_seconds=60)
+
+    assert await cache.get(user.id) == {str(q1.id)}
+
+    # Inserted behind the cache's back: still served from the cached set
+    await _attempt(user, q2)
+    assert await cache.get(user.id) == {str(q1.id)}
+
+    await cache.record_attempt(user.id, q2.id)
+    assert await cache.get(user.id) == {str(q1.id), str(q2.id)}
+
+
+async def test_record_attempt_without_cached_set_is_noop(init_db) -> None:
+    from app.services.attempts import AttemptedQuestionsCache
+    from app.services.cache import InMemoryCacheBackend
+
+    backend = InMemoryCacheBackend(100)
+    cache = AttemptedQuestionsCache(backend, ttl_seconds=60)
+
+    await cache.record_attempt("000000000000000000000000", "111111111111111111111111")
+
+    assert len(backend) == 0
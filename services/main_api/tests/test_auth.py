@@ -72,3 +72,23 @@ async def test_profile_authenticated(async_client: AsyncClient) -> None:
 async def test_profile_unauthenticated(async_client: AsyncClient) -> None:
     resp = await async_client.get("/api/auth/profile")
     assert resp.status_code == 401
+
+
+async def test_password_hasher_offloads_and_reports_stats() -> None:
+    import asyncio
+
+    from app.services.auth import PasswordHasher
+
+    hasher = PasswordHasher(max_workers=2)
+    try:
+        hashes = await asyncio.gather(*(hasher.hash(f"pw-{i}") for i in range(4)))
+        assert await hasher.verify("pw-0", hashes[0])
+        assert not await hasher.verify("wrong", hashes[0])
+        stats = hasher.stats()
+    finally:
+        hasher.shutdown()
+
+    assert stats["max_workers"] == 2
+    assert stats["in_flight"] == 0
+    assert stats["completed"] == 6
+    assert stats["peak_queued"] == 2
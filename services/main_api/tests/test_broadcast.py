@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import aio_pika
+
+from app.dependencies import ConnectionManager
+from app.services.broadcast import EVENTS_EXCHANGE, RabbitMQBroadcast
+
+
+class _FakeFanoutBroker:
+    """Routes every published message to every bound consumer, like a fanout exchange."""
+
+    def __init__(self) -> None:
+        self.consumers: list = []
+        self.declared: list[tuple[str, object]] = []
+
+    def connection(self) -> MagicMock:
+        broker = self
+        exchange = MagicMock()
+
+        async def publish(message: aio_pika.Message, routing_key: str) -> None:
+            for consumer in list(broker.consumers):
+                incoming = MagicMock()
+                incoming.body = message.body
+                await consumer(incoming)
+
+        exchange.publish = publish
+
+        async def declare_exchange(name: str, kind: object, **kwargs: object) -> MagicMock:
+            broker.declared.append((name, kind))
+            return exchange
+
+        async def consume(callback, no_ack: bool = False) -> None:  # type: ignore[no-untyped-def]
+            assert no_ack is True
+            broker.consumers.append(callback)
+
+        queue = MagicMock()
+        queue.bind = AsyncMock()
+        queue.consume = consume
+
+        channel = MagicMock()
+        channel.declare_exchange = declare_exchange
+        channel.declare_queue = AsyncMock(return_value=queue)
+        channel.close = AsyncMock()
+
+        conn = MagicMock()
+        conn.channel = AsyncMock(return_value=channel)
+        return conn
+
+
+async def test_event_sent_on_one_replica_reaches_subscriber_on_another() -> None:
+    broker = _FakeFanoutBroker()
+    replica_a = ConnectionManager()
+    replica_b = ConnectionManager()
+    await replica_a.use_backend(RabbitMQBroadcast(broker.connection()))
+    await replica_b.use_backend(RabbitMQBroadcast(broker.connection()))
+
+    subscription = replica_b.connect("interview-1")
+
+    await replica_a.send("interview-1", {"type": "feedback", "score": 9})
+
+    assert subscription.queue.get_nowait()["data"] == {"type": "feedback", "score": 9}
+    assert broker.declared[0] == (EVENTS_EXCHANGE, aio_pika.ExchangeType.FANOUT)
+
+    await replica_a.close()
+    await replica_b.close()
+
+
+async def test_malformed_broadcast_is_dropped() -> None:
+    broker = _FakeFanoutBroker()
+    manager = ConnectionManager()
+    await manager.use_backend(RabbitMQBroadcast(broker.connection()))
+
+    for body in (b"not json", b"[1]", b'{"data": {}}'):
+        bad = MagicMock()
+        bad.body = body
+        await broker.consumers[0](bad)  # must not raise
+
+    await manager.close()
+
+
+async def test_close_reverts_to_in_memory_delivery() -> None:
+    broker = _FakeFanoutBroker()
+    manager = ConnectionManager()
+    await manager.use_backend(RabbitMQBroadcast(broker.connection()))
+    await manager.close()
+
+    subscription = manager.connect("interview-2")
+    await manager.send("interview-2", {"type": "feedback"})
+
+    assert subscription.queue.get_nowait()["data"] == {"type": "feedback"}
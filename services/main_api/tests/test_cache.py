@@ -0,0 +1,103 @@
+from unittest.mock import AsyncMock, patch
+
+from httpx import AsyncClient
+
+from app.services.cache import InMemoryCacheBackend
+from tests.conftest import make_auth_headers
+
+
+async def test_in_memory_backend_evicts_least_recently_used() -> None:
+    backend = InMemoryCacheBackend(max_entries=2)
+    await backend.set("a", "1", ttl=60)
+    await backend.set("b", "2", ttl=60)
+    assert await backend.get("a") == "1"  # touch "a" so "b" becomes LRU
+    await backend.set("c", "3", ttl=60)
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == "1"
+    assert await backend.get("c") == "3"
+
+
+async def test_in_memory_backend_expires_entries() -> None:
+    backend = InMemoryCacheBackend(max_entries=10)
+    await backend.set("k", "v", ttl=60)
+    with patch("app.services.cache.time.monotonic", return_value=10**12):
+        assert await backend.get("k") is None
+    assert len(backend) == 0
+
+
+async def test_authenticated_requests_skip_user_lookup_when_cached(
+    async_client: AsyncClient,
+) -> None:
+    from app.models.user import User
+
+    await User(email="cached@example.com", hashed_password="x").insert()
+    headers = make_auth_headers("cached@example.com")
+
+    first = await async_client.get("/api/auth/profile", headers=headers)
+    assert first.status_code == 200
+
+    with patch.object(User, "find_one", new=AsyncMock(return_value=None)) as find_one:
+        second = await async_client.get("/api/auth/profile", headers=headers)
+
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    find_one.assert_not_called()
+
+
+async def test_cached_user_leaves_out_the_password_hash(async_client: AsyncClient) -> None:
+    from app.dependencies import cache_backend, user_cache
+    from app.models.user import User
+
+    user = User(email="hash@example.com", hashed_password="$2b$12$secret-hash")
+    await user.insert()
+    await user_cache.set_user(user)
+
+    assert "secret-hash" not in await cache_backend.get("user:hash@example.com")
+    cached = await user_cache.get_user("hash@example.com")
+    assert cached is not None
+    assert cached.id == user.id
+    assert cached.hashed_password == ""
+
+
+async def test_register_drops_a_stale_cached_user(async_client: AsyncClient) -> None:
+    from app.dependencies import user_cache
+    from app.models.user import User
+
+    stale = User(email="again@example.com", hashed_password="x")
+    await stale.insert()
+    await user_cache.set_user(stale)
+    await stale.delete()
+
+    resp = await async_client.post(
+        "/api/auth/register", json={"email": "again@example.com", "password": "s3cret-pass"}
+    )
+
+    assert resp.status_code == 201
+    assert await user_cache.get_user("again@example.com") is None
+
+
+async def test_invalidate_user_forces_fresh_lookup(async_client: AsyncClient) -> None:
+    from app.dependencies import user_cache
+    from app.models.user import User
+
+    user = User(email="stale@example.com", hashed_password="x")
+    await user.insert()
+    headers = make_auth_headers("stale@example.com")
+    assert (await async_client.get("/api/auth/profile", headers=headers)).status_code == 200
+
+    await user.delete()
+    await user_cache.invalidate_user("stale@example.com")
+
+    resp = await async_client.get("/api/auth/profile", headers=headers)
+    assert resp.status_code == 401
+
+
+async def test_invalid_token_is_not_cached(async_client: AsyncClient) -> None:
+    from app.dependencies import user_cache
+
+    resp = await async_client.get(
+        "/api/auth/profile", headers={"Authorization": "Bearer not-a-jwt"}
+    )
+    assert resp.status_code == 401
+    assert await user_cache.get_email_for_token("not-a-jwt") is None
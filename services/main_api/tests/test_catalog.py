@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from bson import ObjectId
+from mock_interview_shared.schemas.enums import Category, Difficulty
+
+
+def _question(topic: str, **kwargs):
+    from app.models.question import Question
+
+    defaults: dict = {
+        "id": ObjectId(),
+        "topic": topic,
+        "text": "Tell me about it",
+        "difficulty": Difficulty.EASY,
+        "category": Category.BEHAVIORAL,
+        "slug": topic.lower().replace(" ", "-"),
+    }
+    defaults.update(kwargs)
+    return Question.model_construct(**defaults)
+
+
+def test_page_filters_and_orders_by_topic() -> None:
+    from app.services.catalog import QuestionCatalog
+
+    catalog = QuestionCatalog()
+    catalog.load(
+        [
+            _question("charlie"),
+            _question("alpha"),
+            _question("bravo", difficulty=Difficulty.HARD),
+            _question("delta", category=Category.TECHNICAL),
+        ]
+    )
+
+    page, total = catalog.page(limit=2)
+    assert ([q.topic for q in page], total) == (["alpha", "bravo"], 4)
+    page, total = catalog.page(skip=2, limit=2)
+    assert [q.topic for q in page] == ["charlie", "delta"]
+
+    page, total = catalog.page(category="behavioral", difficulty="easy")
+    assert ([q.topic for q in page], total) == (["alpha", "charlie"], 2)
+    assert catalog.page(category="technical", difficulty="hard") == ([], 0)
+
+
+def test_page_seeks_past_keyset_cursor() -> None:
+    from app.services.catalog import QuestionCatalog
+
+    first, second, third = (_question(name) for name in ["same", "same", "zulu"])
+    catalog = QuestionCatalog()
+    catalog.load([third, second, first])
+    ordered = sorted([first, second], key=lambda q: q.id)
+
+    page, _ = catalog.page(limit=10, after=(ordered[0].topic, ordered[0].id))
+
+    assert page == [ordered[1], third]
+
+
+def test_lookups_and_unchanged_reload() -> None:
+    from app.services.catalog import QuestionCatalog
+    from app.services.search import QuestionSearchIndex
+
+    question = _question("Conflict resolution")
+    index = QuestionSearchIndex()
+    catalog = QuestionCatalog(index)
+
+    assert catalog.load([question]) is True
+    assert catalog.get_by_slug("conflict-resolution") is question
+    assert catalog.get(str(question.id)) is question
+    assert index.search("conflict") == [str(question.id)]
+
+    assert catalog.load([question]) is False
+    assert catalog.version == 1
+    assert catalog.load([question.model_copy(update={"text": "Edited"})]) is True
+    assert catalog.version == 2
+
+
+async def test_refresh_reads_questions_from_mongo(init_db) -> None:
+    from app.models.question import Question
+    from app.services.catalog import QuestionCatalog
+
+    await Question(
+        topic="Seeded",
+        text="From the database",
+        difficulty=Difficulty.MEDIUM,
+        category=Category.BEHAVIORAL,
+        slug="seeded",
+    ).insert()
+    catalog = QuestionCatalog()
+
+    assert await catalog.refresh() is True
+    assert catalog.loaded
+    assert catalog.get_by_slug("seeded") is not None
+    assert await catalog.refresh() is False
+
+
+async def test_refresh_if_changed_skips_the_read_until_the_collection_moves(init_db) -> None:
+    from app.models.question import Question
+    from app.services.catalog import QuestionCatalog, bump_question_version
+
+    question = await Question(
+        topic="Seeded",
+        text="From the database",
+        difficulty=Difficulty.MEDIUM,
+        category=Category.BEHAVIORAL,
+        slug="seeded",
+    ).insert()
+    catalog = QuestionCatalog()
+    await catalog.refresh()
+
+    with patch.object(Question, "find_all", wraps=Question.find_all) as find_all:
+        assert await catalog.refresh_if_changed() is False
+        find_all.assert_not_called()
+
+    # An in-place edit moves neither the count nor the newest _id; the seed script's
+    # version bump is what makes it visible
+    await Question.get_pymongo_collection().update_one(
+        {"_id": question.id}, {"$set": {"text": "Edited"}}
+    )
+    assert await catalog.refresh_if_changed() is False
+    await bump_question_version(Question.get_pymongo_collection().database)
+    assert await catalog.refresh_if_changed() is True
+    assert catalog.get_by_slug("seeded").text == "Edited"
+
+
+async def test_refresher_keeps_running_after_an_unexpected_error() -> None:
+    from app.services.catalog import QuestionCatalog
+
+    catalog = QuestionCatalog()
+    calls = 0
+
+    async def flaky() -> bool:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("bad document")
+        if calls == 3:
+            raise asyncio.CancelledError
+        return False
+
+    with (
+        patch.object(catalog, "refresh_if_changed", new=flaky),
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await catalog.run_refresher(0)
+
+    assert calls == 3
@@ -0,0 +1,92 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import aio_pika
+import pytest
+from aio_pika.exceptions import ChannelClosed, DeliveryError
+
+from app.services.channel_pool import ChannelPool, PublishFailedError
+
+
+class _FakeChannel:
+    def __init__(self, publish_side_effect=None, delay: float = 0.0) -> None:
+        self.is_closed = False
+        self.published: list[str] = []
+        self._delay = delay
+
+        async def publish(message, routing_key, timeout=None):
+            await asyncio.sleep(self._delay)
+            if publish_side_effect is not None:
+                raise publish_side_effect
+            self.published.append(routing_key)
+
+        self.default_exchange = MagicMock()
+        self.default_exchange.publish = publish
+        self.close = AsyncMock(side_effect=self._close)
+
+    async def _close(self) -> None:
+        self.is_closed = True
+
+
+def _connection(*channels: _FakeChannel) -> MagicMock:
+    connection = MagicMock()
+    connection.channel = AsyncMock(side_effect=list(channels))
+    return connection
+
+
+def _message() -> aio_pika.Message:
+    return aio_pika.Message(body=b"{}")
+
+
+async def test_sequential_publishes_reuse_one_confirming_channel() -> None:
+    channel = _FakeChannel()
+    connection = _connection(channel)
+    pool = ChannelPool(connection, size=2)
+
+    for _ in range(3):
+        await pool.publish(_message(), routing_key="transcript_processing")
+
+    connection.channel.assert_awaited_once_with(publisher_confirms=True, on_return_raises=True)
+    assert channel.published == ["transcript_processing"] * 3
+    assert pool.stats()["published"] == 3
+
+
+async def test_concurrent_publishes_spread_across_channels() -> None:
+    first, second = _FakeChannel(delay=0.01), _FakeChannel(delay=0.01)
+    pool = ChannelPool(_connection(first, second), size=2)
+
+    await asyncio.gather(*(pool.publish(_message(), routing_key="q") for _ in range(4)))
+
+    assert len(first.published) == 2 and len(second.published) == 2
+    stats = pool.stats()
+    assert stats["in_flight_high_water"] == 4
+    assert stats["in_flight"] == 0
+    assert stats["open_channels"] == 2
+
+
+async def test_channel_error_replaces_channel() -> None:
+    broken = _FakeChannel(publish_side_effect=ChannelClosed(404, "NOT_FOUND"))
+    healthy = _FakeChannel()
+    pool = ChannelPool(_connection(broken, healthy), size=1)
+
+    with pytest.raises(PublishFailedError):
+        await pool.publish(_message(), routing_key="q")
+    await pool.publish(_message(), routing_key="q")
+
+    assert broken.is_closed
+    assert healthy.published == ["q"]
+    assert pool.stats()["replaced_channels"] == 1
+    assert pool.stats()["failed"] == 1
+
+
+@pytest.mark.parametrize("error", [DeliveryError(None, None), TimeoutError()])
+async def test_unconfirmed_publish_raises_but_keeps_channel(error: Exception) -> None:
+    channel = _FakeChannel(publish_side_effect=error)
+    connection = _connection(channel)
+    pool = ChannelPool(connection, size=1)
+
+    with pytest.raises(PublishFailedError):
+        await pool.publish(_message(), routing_key="q")
+
+    assert not channel.is_closed
+    assert pool.stats()["replaced_channels"] == 0
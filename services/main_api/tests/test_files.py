@@ -0,0 +1,44 @@
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.services.files import LocalFileStorage, UploadTooLargeError
+
+
+async def test_save_streams_file_and_hashes_content(tmp_path) -> None:
+    content = b"a" * 2500 + b"b" * 10
+    storage = LocalFileStorage(str(tmp_path), chunk_size=1024)
+
+    stored = await storage.save(UploadFile(io.BytesIO(content), filename="answer.mp3"))
+
+    assert stored.filename.endswith(".mp3")
+    assert stored.size == len(content)
+    assert stored.sha256 == hashlib.sha256(content).hexdigest()
+    assert (tmp_path / stored.filename).read_bytes() == content
+
+
+async def test_save_defaults_extension_to_webm(tmp_path) -> None:
+    storage = LocalFileStorage(str(tmp_path))
+    stored = await storage.save(UploadFile(io.BytesIO(b"x"), filename=None))
+    assert stored.filename.endswith(".webm")
+
+
+async def test_save_aborts_when_limit_exceeded_and_removes_partial_file(tmp_path) -> None:
+    storage = LocalFileStorage(str(tmp_path), max_bytes=1500, chunk_size=1024)
+
+    with pytest.raises(UploadTooLargeError):
+        await storage.save(UploadFile(io.BytesIO(b"z" * 4096), filename="big.webm"))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_save_rejects_declared_size_before_reading(tmp_path) -> None:
+    storage = LocalFileStorage(str(tmp_path), max_bytes=10)
+    upload = UploadFile(io.BytesIO(b"small"), filename="a.webm", size=11)
+
+    with pytest.raises(UploadTooLargeError):
+        await storage.save(upload)
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+from app.services.http_cache import ResponseBodyCache, body_etag, etag_matches, make_etag
+
+
+def _request(if_none_match: str | None) -> MagicMock:
+    request = MagicMock()
+    request.headers = {"if-none-match": if_none_match} if if_none_match is not None else {}
+    return request
+
+
+def test_etags_are_deterministic_and_quoted() -> None:
+    assert make_etag("abc", 1, None) == make_etag("abc", 1, None)
+    assert make_etag("abc", 1) != make_etag("abc", 2)
+    assert body_etag(b"{}").startswith('"') and body_etag(b"{}").endswith('"')
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcard() -> None:
+    etag = make_etag("x")
+
+    assert etag_matches(_request(etag), etag)
+    assert etag_matches(_request(f'"other", W/{etag}'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request('"other"'), etag)
+    assert not etag_matches(_request(None), etag)
+
+
+def test_body_cache_resets_on_new_fingerprint_and_evicts_lru() -> None:
+    cache = ResponseBodyCache(max_entries=2)
+    cache.put("v1", "a", b"A", '"a"')
+    cache.put("v1", "b", b"B", '"b"')
+    assert cache.get("v1", "a") is not None
+    cache.put("v1", "c", b"C", '"c"')
+
+    assert cache.get("v1", "b") is None  # least recently used
+    assert cache.get("v1", "a").body == b"A"  # type: ignore[union-attr]
+    assert cache.get("v2", "a") is None
+    assert cache.stats() == {"entries": 0, "hits": 2, "misses": 2}
@@ -141,3 +141,16 @@ async def test_submit_result_not_found(async_client: AsyncClient) -> None:
         },
     )
     assert resp.status_code == 404
+
+
+async def test_metrics_requires_secret(async_client: AsyncClient) -> None:
+    resp = await async_client.get("/api/internal/metrics", headers=BAD_HEADERS)
+    assert resp.status_code == 403
+
+
+async def test_metrics_reports_password_hasher(async_client: AsyncClient) -> None:
+    resp = await async_client.get("/api/internal/metrics", headers=INTERNAL_HEADERS)
+    assert resp.status_code == 200
+    stats = resp.json()["password_hasher"]
+    assert stats["max_workers"] >= 1
+    assert stats["queued"] == 0
@@ -1,9 +1,12 @@
 import io
+import json
 from unittest.mock import AsyncMock, patch
 
 from httpx import AsyncClient
 from mock_interview_shared.schemas.enums import Category, Difficulty
 
+from app.config import settings
+from app.services.files import StoredFile
 from tests.conftest import make_auth_headers
 
 
@@ -54,7 +57,7 @@ async def test_submit_recording_creates_interview(async_client: AsyncClient) ->
 
     with patch(
         "app.routers.interviews._file_storage.save",
-        new=AsyncMock(return_value="fake-audio.webm"),
+        new=AsyncMock(return_value=StoredFile("fake-audio.webm", 10, "0" * 64)),
     ):
         resp = await async_client.post(
             "/api/interviews/submit-recording",
@@ -69,6 +72,58 @@ async def test_submit_recording_creates_interview(async_client: AsyncClient) ->
     assert len(body["interview"]) == 24
 
 
+async def test_submit_recording_records_job_in_outbox(async_client: AsyncClient) -> None:
+    from app.main import app
+    from app.models.outbox import OutboxMessage
+
+    user = await _seed_user("outbox@example.com")
+    await _seed_question("outbox-q")
+
+    with patch(
+        "app.routers.interviews._file_storage.save",
+        new=AsyncMock(return_value=StoredFile("fake-audio.webm", 10, "0" * 64)),
+    ):
+        resp = await async_client.post(
+            "/api/interviews/submit-recording",
+            data={"question_id": "outbox-q"},
+            files={"audio_response": ("test.webm", io.BytesIO(b"fake audio"), "audio/webm")},
+            headers=make_auth_headers(user.email),
+        )
+
+    assert resp.status_code == 200
+    interview_id = resp.json()["interview"]
+    row = await OutboxMessage.find_one()
+    assert row is not None
+    assert row.routing_key == "transcript_processing"
+    assert str(row.interview_id) == interview_id
+    job = json.loads(row.body)
+    assert job["recording_path"] == "fake-audio.webm"
+    assert job["audio_sha256"] == "0" * 64
+    assert row.sent_at is None
+    # The request itself never touches the broker
+    app.state.mock_channel.default_exchange.publish.assert_not_awaited()
+
+
+async def test_submit_recording_rejects_oversized_upload(async_client: AsyncClient) -> None:
+    from app.models.interview import Interview
+    from app.services.files import LocalFileStorage
+
+    user = await _seed_user("toolarge@example.com")
+    await _seed_question("toolarge-q")
+
+    storage = LocalFileStorage(settings.file_storage_path, max_bytes=4)
+    with patch("app.routers.interviews._file_storage", storage):
+        resp = await async_client.post(
+            "/api/interviews/submit-recording",
+            data={"question_id": "toolarge-q"},
+            files={"audio_response": ("test.webm", io.BytesIO(b"too many bytes"), "audio/webm")},
+            headers=make_auth_headers(user.email),
+        )
+
+    assert resp.status_code == 413
+    assert await Interview.find_all().count() == 0
+
+
 async def test_get_feedback_pending(async_client: AsyncClient) -> None:
     user = await _seed_user("pending@example.com")
     question = await _seed_question("pending-q")
@@ -108,3 +163,109 @@ async def test_get_feedback_invalid_id(async_client: AsyncClient) -> None:
         headers=make_auth_headers(user.email),
     )
     assert resp.status_code == 400
+
+
+async def _read_sse(response, frames: int) -> str:
+    chunks = []
+    async for chunk in response.body_iterator:
+        chunks.append(chunk)
+        if len(chunks) >= frames:
+            break
+    await response.body_iterator.aclose()
+    return "".join(chunks)
+
+
+async def test_stream_emits_current_state_when_already_done(init_db) -> None:
+    from unittest.mock import MagicMock
+
+    from mock_interview_shared.schemas.enums import InterviewStatus
+    from mock_interview_shared.schemas.messages import FeedbackScore
+
+    from app.routers.interviews import stream_interview
+
+    user = await _seed_user("done-stream@example.com")
+    question = await _seed_question("done-stream-q")
+    interview = await _seed_interview(user, question)
+    interview.status = InterviewStatus.DONE
+    interview.feedback = FeedbackScore(
+        overall_impression="Good",
+        strengths=["s"],
+        areas_for_improvement=["a"],
+        suggestions=["x"],
+        score=7,
+    )
+    await interview.save()
+
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+    response = await stream_interview(str(interview.id), request, user, last_event_id=None)
+    body = await _read_sse(response, 1)
+
+    assert body.startswith("data: ")
+    assert '"score": 7' in body
+
+
+async def test_stream_replays_missed_events_after_last_event_id(init_db) -> None:
+    from unittest.mock import MagicMock
+
+    from app.dependencies import manager
+    from app.routers.interviews import stream_interview
+
+    user = await _seed_user("replay-stream@example.com")
+    question = await _seed_question("replay-stream-q")
+    interview = await _seed_interview(user, question)
+    await manager.send(str(interview.id), {"type": "first"})
+    await manager.send(str(interview.id), {"type": "second"})
+    first_id = manager.connect(str(interview.id)).queue.get_nowait()["id"]
+
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+    response = await stream_interview(str(interview.id), request, user, last_event_id=str(first_id))
+    body = await _read_sse(response, 2)
+
+    assert body.startswith("id: ")
+    assert '"second"' in body
+    assert '"first"' not in body
+
+
+async def test_event_ids_count_up_per_interview_across_replicas(init_db) -> None:
+    from app.services.sse import ConnectionManager, next_interview_event_id
+
+    user = await _seed_user("event-ids@example.com")
+    interview = await _seed_interview(user, await _seed_question("event-ids-q"))
+    other = await _seed_interview(user, await _seed_question("event-ids-other-q"))
+    # Two replicas share the counter on the interview document, whatever their clocks say
+    replicas = [ConnectionManager(event_ids=next_interview_event_id) for _ in range(2)]
+    first, second = (replica.connect(str(interview.id)) for replica in replicas)
+    elsewhere = replicas[1].connect(str(other.id))
+
+    await replicas[0].send(str(interview.id), {"n": 0})
+    await replicas[1].send(str(interview.id), {"n": 1})
+    await replicas[1].send(str(other.id), {"n": 0})
+    await replicas[0].send(str(interview.id), {"n": 2})
+
+    assert [first.queue.get_nowait()["id"] for _ in range(2)] == [1, 3]
+    assert second.queue.get_nowait()["id"] == 2
+    assert elsewhere.queue.get_nowait()["id"] == 1
+    resumed = replicas[0].connect(str(interview.id), last_event_id=1)
+    assert [resumed.queue.get_nowait()["data"]["n"] for _ in range(resumed.replayed)] == [2]
+
+
+async def test_stream_ignores_a_malformed_last_event_id(init_db) -> None:
+    from unittest.mock import MagicMock
+
+    from app.dependencies import manager
+    from app.routers.interviews import stream_interview
+
+    user = await _seed_user("bad-event-id@example.com")
+    interview = await _seed_interview(user, await _seed_question("bad-event-id-q"))
+    await manager.send(str(interview.id), {"type": "first"})
+
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(return_value=False)
+    # "²" passes str.isdigit() but int() rejects it
+    for header in ("²", "not-an-id"):
+        response = await stream_interview(str(interview.id), request, user, last_event_id=header)
+        body = await _read_sse(response, 2)
+
+        assert '"first"' in body
@@ -0,0 +1,30 @@
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware import ContentLengthLimitMiddleware
+
+
+def _app(received: list[int]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ContentLengthLimitMiddleware, path="/upload", max_bytes=10, detail="Too big")
+
+    @app.post("/upload")
+    @app.post("/other")
+    async def upload(request: Request) -> dict:
+        received.append(len(await request.body()))
+        return {}
+
+    return app
+
+
+async def test_declared_oversized_body_is_refused_before_it_is_read() -> None:
+    received: list[int] = []
+    async with AsyncClient(transport=ASGITransport(app=_app(received)), base_url="http://t") as c:
+        refused = await c.post("/upload", content=b"x" * 11)
+        accepted = await c.post("/upload", content=b"x" * 10)
+        elsewhere = await c.post("/other", content=b"x" * 11)
+
+    assert (refused.status_code, refused.json()) == (413, {"detail": "Too big"})
+    assert accepted.status_code == 200
+    assert elsewhere.status_code == 200
+    assert received == [10, 11]
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, UTC
+from unittest.mock import AsyncMock
+
+from beanie import PydanticObjectId, WriteRules
+from mock_interview_shared.schemas.enums import Category, Difficulty
+
+
+async def _seed_interview():
+    from app.models.interview import Interview
+    from app.models.question import Question
+    from app.models.user import User
+
+    user = User(email="outbox@example.com", hashed_password="x")
+    await user.insert()
+    question = Question(
+        topic="Outbox",
+        text="Tell me about it",
+        difficulty=Difficulty.EASY,
+        category=Category.BEHAVIORAL,
+        slug="outbox",
+    )
+    await question.insert()
+    interview = Interview(id=PydanticObjectId(), user=user, question=question, audio_url="a.webm")
+    await interview.insert(link_rule=WriteRules.DO_NOTHING)
+    return interview
+
+
+async def test_relay_publishes_pending_rows_and_marks_them_sent(init_db) -> None:
+    from app.models.outbox import OutboxMessage
+    from app.services.outbox import Outbox
+
+    interview = await _seed_interview()
+    outbox = Outbox()
+    await outbox.enqueue("transcript_processing", '{"n": 1}', interview.id)
+    await outbox.enqueue("feedback_processing", '{"n": 2}')
+    publisher = AsyncMock()
+
+    assert await outbox.relay_once(publisher) == 2
+
+    assert publisher.publish.await_count == 2
+    message, routing_key = publisher.publish.await_args_list[0].args
+    assert routing_key == "transcript_processing"
+    assert message.body == b'{"n": 1}'
+    rows = await OutboxMessage.find_all().to_list()
+    assert all(row.sent_at is not None and row.claim_token is None for row in rows)
+    assert message.message_id == str(rows[0].id)
+
+    # Nothing left to send
+    assert await outbox.relay_once(publisher) == 0
+    assert publisher.publish.await_count == 2
+    assert outbox.stats()["relayed"] == 2
+
+
+async def test_failed_publish_is_retried_after_backoff(init_db) -> None:
+    from app.models.outbox import OutboxMessage
+    from app.services.channel_pool import PublishFailedError
+    from app.services.outbox import Outbox
+
+    outbox = Outbox()
+    await outbox.enqueue("feedback_processing", "{}")
+    publisher = AsyncMock()
+    publisher.publish.side_effect = PublishFailedError("nacked")
+
+    assert await outbox.relay_once(publisher) == 0
+
+    row = await OutboxMessage.find_one()
+    assert row.sent_at is None
+    assert row.attempts == 1
+    assert row.last_error == "nacked"
+    assert row.claimed_until is not None
+    # Backed off: the next pass doesn't pick it up again straight away
+    assert await outbox.relay_once(publisher) == 0
+    assert publisher.publish.await_count == 1
+
+    await row.set({"claimed_until": datetime.now(UTC) - timedelta(seconds=1)})
+    publisher.publish.side_effect = None
+    assert await outbox.relay_once(publisher) == 1
+    assert outbox.stats()["failed"] == 1
+
+
+async def test_rows_for_missing_interviews_wait_then_are_dropped(init_db) -> None:
+    from app.models.outbox import OutboxMessage
+    from app.services.outbox import Outbox
+
+    outbox = Outbox(orphan_grace_seconds=60)
+    row = await outbox.enqueue("transcript_processing", "{}", PydanticObjectId())
+    publisher = AsyncMock()
+
+    # Within the grace period the interview insert may still be on its way
+    assert await outbox.relay_once(publisher) == 0
+    row = await OutboxMessage.get(row.id)
+    assert row.sent_at is None and row.claim_token is None
+
+    await row.set({"created_at": datetime.now(UTC) - timedelta(minutes=5)})
+    assert await outbox.relay_once(publisher) == 0
+    row = await OutboxMessage.get(row.id)
+    assert row.sent_at is not None
+    assert row.last_error == "interview missing"
+    publisher.publish.assert_not_awaited()
+    assert outbox.stats()["orphaned"] == 1
+
+
+async def test_stats_report_lag_of_oldest_pending_row(init_db) -> None:
+    from app.services.outbox import Outbox
+
+    outbox = Outbox()
+    row = await outbox.enqueue("feedback_processing", "{}")
+    await row.set({"created_at": datetime.now(UTC) - timedelta(seconds=30)})
+    publisher = AsyncMock()
+
+    await outbox.relay_once(publisher)
+
+    stats = outbox.stats()
+    assert 29 <= stats["lag_seconds"] < 60
+    assert stats["last_batch"] == 1
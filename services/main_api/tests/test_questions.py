@@ -56,6 +56,51 @@ async def test_list_questions_filter_by_difficulty(async_client: AsyncClient) ->
     assert body["questions"][0]["difficulty"] == "easy"
 
 
+async def test_list_questions_offset_pages_are_ordered(async_client: AsyncClient) -> None:
+    for name in ["delta", "alpha", "charlie", "bravo"]:
+        await _seed_question(slug=f"offset-{name}", topic=name)
+
+    resp = await async_client.get("/api/questions?page=2&limit=3")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [q["topic"] for q in body["questions"]] == ["delta"]
+    assert body["pagination"] == {
+        "total": 4,
+        "page": 2,
+        "limit": 3,
+        "pages": 2,
+        "next_cursor": None,
+    }
+
+
+async def test_list_questions_keyset_pagination(async_client: AsyncClient) -> None:
+    # Two questions share a topic so the _id tiebreak is exercised
+    for i, topic in enumerate(["b", "a", "c", "b", "d"]):
+        await _seed_question(slug=f"keyset-{i}", topic=topic)
+
+    seen: list[str] = []
+    resp = await async_client.get("/api/questions?limit=2")
+    while True:
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["pagination"]["total"] == 5
+        seen.extend(q["topic"] for q in body["questions"])
+        cursor = body["pagination"]["next_cursor"]
+        if cursor is None:
+            break
+        resp = await async_client.get(f"/api/questions?limit=2&after={cursor}")
+
+    assert seen == ["a", "b", "b", "c", "d"]
+
+
+async def test_list_questions_rejects_bad_cursor(async_client: AsyncClient) -> None:
+    resp = await async_client.get("/api/questions?after=not-a-cursor")
+    assert resp.status_code == 400
+
+    resp = await async_client.get("/api/questions?after=abc&search=x")
+    assert resp.status_code == 400
+
+
 async def test_get_question_by_slug(async_client: AsyncClient) -> None:
     await _seed_question(slug="my-slug", topic="My topic", text="Tell me about yourself")
     resp = await async_client.get("/api/questions/my-slug")
@@ -69,3 +114,185 @@ async def test_get_question_by_slug(async_client: AsyncClient) -> None:
 async def test_get_question_not_found(async_client: AsyncClient) -> None:
     resp = await async_client.get("/api/questions/nonexistent-slug")
     assert resp.status_code == 404
+
+
+async def test_list_questions_search_with_in_memory_index(async_client: AsyncClient) -> None:
+    from unittest.mock import patch
+
+    from app.dependencies import question_index
+
+    await _seed_question(slug="conflict", topic="Conflict", text="Handling a disagreement")
+    await _seed_question(slug="teamwork", topic="Teamwork", text="A conflict in your team")
+    await _seed_question(slug="goals", topic="Goals", text="Where do you see yourself?")
+    await question_index.rebuild()
+
+    with patch("app.routers.questions.settings.question_search_backend", "memory"):
+        resp = await async_client.get("/api/questions?search=conflict")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["pagination"]["total"] == 2
+    assert [q["slug"] for q in body["questions"]] == ["conflict", "teamwork"]
+
+
+async def test_list_questions_marks_attempted_for_user(async_client: AsyncClient) -> None:
+    from beanie import WriteRules
+
+    from app.models.interview import Interview
+    from app.models.user import User
+    from tests.conftest import make_auth_headers
+
+    user = User(email="attempts@example.com", hashed_password="x")
+    await user.insert()
+    done = await _seed_question(slug="attempted", topic="Attempted")
+    await _seed_question(slug="fresh", topic="Fresh")
+    interview = Interview(user=user, question=done, audio_url="a.webm")
+    await interview.insert(link_rule=WriteRules.DO_NOTHING)
+
+    resp = await async_client.get("/api/questions", headers=make_auth_headers(user.email))
+    assert resp.status_code == 200
+    flags = {q["slug"]: q["has_attempted"] for q in resp.json()["questions"]}
+    assert flags == {"attempted": True, "fresh": False}
+
+    resp = await async_client.get("/api/questions")
+    assert not any(q["has_attempted"] for q in resp.json()["questions"])
+
+
+async def test_questions_served_from_loaded_catalog(async_client: AsyncClient) -> None:
+    from app.dependencies import question_catalog
+    from app.models.question import Question
+
+    await _seed_question(slug="cached-b", topic="B")
+    await _seed_question(slug="cached-a", topic="A")
+    await question_catalog.refresh()
+
+    # Deleted behind the catalog's back: still served until the next refresh
+    await Question.find_all().delete()
+
+    resp = await async_client.get("/api/questions?limit=1")
+    body = resp.json()
+    assert [q["slug"] for q in body["questions"]] == ["cached-a"]
+    assert body["pagination"]["total"] == 2
+    resp = await async_client.get(
+        f"/api/questions?limit=1&after={body['pagination']['next_cursor']}"
+    )
+    assert [q["slug"] for q in resp.json()["questions"]] == ["cached-b"]
+
+    resp = await async_client.get("/api/questions/cached-b")
+    assert resp.status_code == 200
+    assert resp.json()["topic"] == "B"
+
+
+async def test_anonymous_listing_is_shareable_and_revalidates(async_client: AsyncClient) -> None:
+    from app.dependencies import question_catalog, question_responses
+
+    await _seed_question(slug="etag-q", topic="ETag")
+    await question_catalog.refresh()
+
+    resp = await async_client.get("/api/questions")
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert resp.headers["cache-control"].startswith("public, max-age=")
+    assert "Authorization" in resp.headers["vary"]
+
+    resp = await async_client.get("/api/questions", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    # A repeat hit is served from the pre-rendered body
+    resp = await async_client.get("/api/questions")
+    assert resp.json()["questions"][0]["slug"] == "etag-q"
+    assert question_responses.stats()["hits"] == 1
+
+    await _seed_question(slug="etag-q2", topic="ETag two")
+    await question_catalog.refresh()
+    resp = await async_client.get("/api/questions", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
+    assert resp.json()["pagination"]["total"] == 2
+
+
+async def test_text_search_etag_follows_mongo_not_the_catalog(async_client: AsyncClient) -> None:
+    from unittest.mock import AsyncMock, patch
+
+    from app.dependencies import question_catalog, question_responses
+    from app.services.http_cache import body_etag
+
+    first = await _seed_question(slug="first", topic="First")
+    await question_catalog.refresh()
+    # Added behind the catalog's back: Mongo's text search already sees it
+    second = await _seed_question(slug="second", topic="Second")
+    find_page = AsyncMock(side_effect=[([first], 1), ([first, second], 2)])
+    hits = question_responses.stats()["hits"]
+
+    with patch("app.routers.questions._find_page", new=find_page):
+        before = await async_client.get("/api/questions?search=interview")
+        after = await async_client.get(
+            "/api/questions?search=interview", headers={"If-None-Match": before.headers["etag"]}
+        )
+
+    assert after.status_code == 200
+    assert after.json()["pagination"]["total"] == 2
+    assert after.headers["etag"] == body_etag(after.content)
+    assert question_responses.stats()["hits"] == hits
+
+
+def test_text_search_ranks_by_score_then_topic() -> None:
+    from app.routers.questions import _text_search
+
+    filters = {"category": "behavioral"}
+    query, sort = _text_search(filters, "team conflict")
+
+    assert query == {"category": "behavioral", "$text": {"$search": "team conflict"}}
+    assert filters == {"category": "behavioral"}
+    # textScore first; (topic, _id) keeps ties in a stable order across pages
+    assert list(sort.items()) == [
+        ("score", {"$meta": "textScore"}),
+        ("topic", 1),
+        ("_id", 1),
+    ]
+
+
+async def test_text_search_sends_its_query_and_sort(async_client: AsyncClient) -> None:
+    from unittest.mock import AsyncMock, patch
+
+    from app.routers.questions import _text_search
+
+    find_page = AsyncMock(return_value=([], 0))
+
+    with patch("app.routers.questions._find_page", new=find_page):
+        resp = await async_client.get(
+            "/api/questions?search=team&category=behavioral&difficulty=easy&page=3&limit=5"
+        )
+
+    assert resp.status_code == 200
+    query, sort = _text_search({"category": "behavioral", "difficulty": "easy"}, "team")
+    find_page.assert_awaited_once_with(query, sort, 10, 5)
+
+
+async def test_get_question_not_modified(async_client: AsyncClient) -> None:
+    await _seed_question(slug="etag-slug", topic="Slug")
+
+    resp = await async_client.get("/api/questions/etag-slug")
+    etag = resp.headers["etag"]
+    resp = await async_client.get("/api/questions/ETAG-SLUG", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 304
+
+
+async def test_personalized_listing_is_private(async_client: AsyncClient) -> None:
+    from app.models.user import User
+    from tests.conftest import make_auth_headers
+
+    user = User(email="private@example.com", hashed_password="x")
+    await user.insert()
+    await _seed_question(slug="private-q", topic="Private")
+    headers = make_auth_headers(user.email)
+
+    resp = await async_client.get("/api/questions", headers=headers)
+    assert resp.headers["cache-control"] == "private, no-cache"
+
+    resp = await async_client.get(
+        "/api/questions", headers={**headers, "If-None-Match": resp.headers["etag"]}
+    )
+    assert resp.status_code == 304
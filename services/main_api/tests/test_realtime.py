@@ -112,6 +112,7 @@ async def realtime_db():
     import beanie
     from beanie.odm.utils.init import Initializer
     from app.models.interview import Interview
+    from app.models.outbox import OutboxMessage
     from app.models.question import Question
     from app.models.session import InterviewSession
     from app.models.user import User
@@ -120,7 +121,7 @@ async def realtime_db():
     with patch.object(Initializer, "_load_cached_info", _patched_load_cached_info):
         await beanie.init_beanie(
             database=client["testdb"],
-            document_models=[User, Question, Interview, InterviewSession],
+            document_models=[User, Question, Interview, InterviewSession, OutboxMessage],
         )
     yield client
     await User.find_all().delete()
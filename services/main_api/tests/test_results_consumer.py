@@ -0,0 +1,255 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mock_interview_shared.schemas.enums import Category, Difficulty, InterviewStatus
+
+
+async def _seed_interview(email: str, slug: str):
+    from beanie import WriteRules
+
+    from app.models.interview import Interview
+    from app.models.question import Question
+    from app.models.user import User
+
+    user = User(email=email, hashed_password="x")
+    await user.insert()
+    question = Question(
+        topic="Consumer topic",
+        text="Tell me about a challenge",
+        difficulty=Difficulty.MEDIUM,
+        category=Category.BEHAVIORAL,
+        slug=slug,
+    )
+    await question.insert()
+    interview = Interview(user=user, question=question, audio_url="audio.webm")
+    await interview.insert(link_rule=WriteRules.DO_NOTHING)
+    return interview
+
+
+def _make_message(payload: dict) -> MagicMock:
+    raw = MagicMock()
+    raw.body = json.dumps(payload).encode()
+    raw.process.return_value.__aenter__ = AsyncMock(return_value=None)
+    raw.process.return_value.__aexit__ = AsyncMock(return_value=False)
+    return raw
+
+
+async def test_consumer_applies_transcript_result(init_db) -> None:
+    from app.models.interview import Interview
+    from app.services.results_consumer import handle_result_message
+
+    interview = await _seed_interview("c-transcript@example.com", "c-transcript-q")
+    message = _make_message(
+        {
+            "type": "transcript",
+            "interview": str(interview.id),
+            "transcript": "Hello world",
+            "app_id": "transcript_service",
+            "question": "Tell me about a challenge",
+        }
+    )
+
+    await handle_result_message(message)
+
+    updated = await Interview.get(interview.id)
+    assert updated is not None
+    assert updated.status == InterviewStatus.PROCESSING
+    assert updated.audio_transcript == "Hello world"
+    message.process.assert_called_once_with(requeue=False)
+
+
+async def test_consumer_applies_feedback_and_notifies_sse(init_db) -> None:
+    from app.dependencies import manager
+    from app.models.interview import Interview
+    from app.services.results_consumer import handle_result_message
+
+    interview = await _seed_interview("c-feedback@example.com", "c-feedback-q")
+    subscription = manager.connect(str(interview.id))
+    message = _make_message(
+        {
+            "type": "feedback",
+            "interview": str(interview.id),
+            "feedback": {
+                "overall_impression": "Great job",
+                "strengths": ["clear"],
+                "areas_for_improvement": ["examples"],
+                "suggestions": ["STAR"],
+                "score": 8,
+            },
+            "app_id": "feedback_service",
+        }
+    )
+
+    try:
+        await handle_result_message(message)
+    finally:
+        manager.disconnect(subscription)
+
+    updated = await Interview.get(interview.id)
+    assert updated is not None
+    assert updated.status == InterviewStatus.DONE
+    assert updated.feedback.score == 8  # type: ignore[union-attr]
+    event = subscription.queue.get_nowait()["data"]
+    assert event["type"] == "feedback"
+    assert event["feedback"]["score"] == 8
+
+
+async def test_consumer_marks_interview_failed_and_notifies_sse(init_db) -> None:
+    from app.dependencies import manager
+    from app.models.interview import Interview
+    from app.services.results_consumer import handle_result_message
+
+    interview = await _seed_interview("c-failure@example.com", "c-failure-q")
+    subscription = manager.connect(str(interview.id))
+    message = _make_message(
+        {
+            "type": "failure",
+            "interview": str(interview.id),
+            "error": "RateLimitError: Rate limit reached",
+            "app_id": "feedback_service",
+        }
+    )
+
+    try:
+        await handle_result_message(message)
+    finally:
+        manager.disconnect(subscription)
+
+    updated = await Interview.get(interview.id)
+    assert updated is not None
+    assert updated.status == InterviewStatus.FAILED
+    assert subscription.queue.get_nowait()["data"]["type"] == "failure"
+
+
+async def test_consumer_ignores_failure_after_feedback(init_db) -> None:
+    from app.models.interview import Interview
+    from app.services.results_consumer import handle_result_message
+
+    interview = await _seed_interview("c-late@example.com", "c-late-q")
+    interview.status = InterviewStatus.DONE
+    await interview.save()
+    message = _make_message(
+        {"type": "failure", "interview": str(interview.id), "error": "x", "app_id": "x"}
+    )
+
+    await handle_result_message(message)
+
+    updated = await Interview.get(interview.id)
+    assert updated is not None
+    assert updated.status == InterviewStatus.DONE
+
+
+async def test_consumer_discards_unknown_interview(init_db) -> None:
+    from app.services.results_consumer import handle_result_message
+
+    message = _make_message(
+        {
+            "type": "transcript",
+            "interview": "000000000000000000000000",
+            "transcript": "t",
+            "app_id": "x",
+            "question": "q",
+        }
+    )
+
+    await handle_result_message(message)
+
+    message.process.assert_called_once_with(requeue=False)
+
+
+async def test_consumer_discards_malformed_message(init_db) -> None:
+    from app.services.results_consumer import handle_result_message
+
+    message = _make_message({"type": "unknown"})
+
+    await handle_result_message(message)
+
+    message.process.assert_called_once_with(requeue=False)
+
+
+async def test_consumer_relays_feedback_delta_without_storing_it(init_db) -> None:
+    from app.dependencies import manager
+    from app.models.interview import Interview
+    from app.services.results_consumer import handle_result_message
+
+    interview = await _seed_interview("c-delta@example.com", "c-delta-q")
+    subscription = manager.connect(str(interview.id))
+    message = _make_message(
+        {
+            "type": "feedback.delta",
+            "interview": str(interview.id),
+            "attempt": "a1",
+            "seq": 0,
+            "delta": '{"overall_impression": "Gre',
+            "app_id": "feedback_service",
+        }
+    )
+
+    try:
+        await handle_result_message(message)
+    finally:
+        manager.disconnect(subscription)
+
+    event = subscription.queue.get_nowait()
+    assert event["id"] is None
+    assert event["data"] == {
+        "type": "feedback.delta",
+        "interview_id": str(interview.id),
+        "attempt": "a1",
+        "seq": 0,
+        "delta": '{"overall_impression": "Gre',
+    }
+    # Not buffered for replay, and the interview itself is untouched
+    assert manager.connect(str(interview.id)).replayed == 0
+    updated = await Interview.get(interview.id)
+    assert updated is not None
+    assert updated.status == InterviewStatus.PENDING
+
+
+@pytest.mark.parametrize("first", ["transcript", "feedback"])
+async def test_concurrent_results_keep_each_others_fields(init_db, first: str) -> None:
+    from app.models.interview import Interview
+    from app.services.results_consumer import handle_result_message
+
+    interview = await _seed_interview(f"c-race-{first}@example.com", f"c-race-{first}-q")
+    messages = {
+        "transcript": _make_message(
+            {
+                "type": "transcript",
+                "interview": str(interview.id),
+                "transcript": "Hello world",
+                "app_id": "transcript_service",
+                "question": "Tell me about a challenge",
+            }
+        ),
+        "feedback": _make_message(
+            {
+                "type": "feedback",
+                "interview": str(interview.id),
+                "feedback": "Great job",
+                "app_id": "feedback_service",
+            }
+        ),
+    }
+    second = "feedback" if first == "transcript" else "transcript"
+    # The first handler stalls after its read, so the second one writes in between
+    delays = [0.05, 0.0]
+    get = Interview.get
+
+    async def slow_get(*args, **kwargs):
+        found = await get(*args, **kwargs)
+        await asyncio.sleep(delays.pop(0))
+        return found
+
+    with patch.object(Interview, "get", new=slow_get):
+        await asyncio.gather(
+            handle_result_message(messages[first]), handle_result_message(messages[second])
+        )
+
+    updated = await get(interview.id)
+    assert updated is not None
+    assert updated.status == InterviewStatus.DONE
+    assert updated.audio_transcript == "Hello world"
+    assert updated.feedback == "Great job"
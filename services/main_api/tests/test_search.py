@@ -0,0 +1,65 @@
+from bson import ObjectId
+from mock_interview_shared.schemas.enums import Category, Difficulty
+
+from app.services.search import QuestionSearchIndex, tokenize
+
+
+def _question(topic: str, text: str, **kwargs):
+    from app.models.question import Question
+
+    defaults: dict = {
+        "id": ObjectId(),
+        "topic": topic,
+        "text": text,
+        "difficulty": Difficulty.EASY,
+        "category": Category.BEHAVIORAL,
+        "slug": topic.lower().replace(" ", "-"),
+    }
+    defaults.update(kwargs)
+    return Question.model_construct(**defaults)
+
+
+def test_tokenize_lowercases_and_strips_punctuation() -> None:
+    assert tokenize("Tell me: (a) CONFLICT!") == ["tell", "me", "a", "conflict"]
+
+
+def test_topic_matches_rank_above_body_matches() -> None:
+    body_hit = _question("Teamwork", "Describe a conflict with a coworker")
+    topic_hit = _question("Conflict resolution", "How do you handle disagreements?")
+    index = QuestionSearchIndex()
+    index.build([body_hit, topic_hit])
+
+    assert index.search("conflict") == [str(topic_hit.id), str(body_hit.id)]
+
+
+def test_search_filters_by_category_and_difficulty() -> None:
+    easy = _question("Leadership one", "Lead a team")
+    hard = _question("Leadership two", "Lead a team", difficulty=Difficulty.HARD)
+    technical = _question("Leadership three", "Lead a team", category=Category.TECHNICAL)
+    index = QuestionSearchIndex()
+    index.build([easy, hard, technical])
+
+    assert index.search("leadership", difficulty="hard") == [str(hard.id)]
+    assert index.search("leadership", category="technical") == [str(technical.id)]
+
+
+def test_search_treats_regex_metacharacters_as_plain_text() -> None:
+    index = QuestionSearchIndex()
+    index.build([_question("Strengths", "What are your strengths?")])
+
+    assert index.search("(a+)+$") == []
+    assert len(index.search("strengths.*")) == 1
+
+
+def test_add_replaces_and_remove_drops_question() -> None:
+    question = _question("Failure", "Tell me about a failure")
+    index = QuestionSearchIndex()
+    index.add(question)
+    index.add(question.model_copy(update={"topic": "Success", "text": "A success"}))
+
+    assert index.search("failure") == []
+    assert index.search("success") == [str(question.id)]
+
+    index.remove(str(question.id))
+    assert index.search("success") == []
+    assert len(index) == 0
@@ -0,0 +1,119 @@
+import json
+
+import pytest
+from mock_interview_shared.schemas.enums import Category
+
+
+def _row(n: int, **kwargs) -> dict:
+    row = {
+        "topic": f"Topic {n}",
+        "text": f'Question [{n}], with brackets and a "quote"',
+        "difficulty": "easy",
+        "category": "behavioral",
+    }
+    row.update(kwargs)
+    return row
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_json_array_streams_rows_across_chunk_boundaries(tmp_path, chunk_size: int) -> None:
+    from scripts.seed_questions import _iter_json_array
+
+    rows = [_row(n) for n in range(5)]
+    path = tmp_path / "bank.json"
+    path.write_text("\n  " + json.dumps(rows, indent=2) + "\n", encoding="utf-8")
+
+    assert list(_iter_json_array(path, chunk_size=chunk_size)) == rows
+
+
+def test_json_array_handles_an_empty_array_and_rejects_other_documents(tmp_path) -> None:
+    from scripts.seed_questions import _iter_json_array
+
+    empty = tmp_path / "empty.json"
+    empty.write_text("[ ]", encoding="utf-8")
+    assert list(_iter_json_array(empty, chunk_size=1)) == []
+
+    not_array = tmp_path / "object.json"
+    not_array.write_text(json.dumps({"questions": []}), encoding="utf-8")
+    with pytest.raises(ValueError, match="expected a JSON array"):
+        list(_iter_json_array(not_array))
+
+    truncated = tmp_path / "truncated.json"
+    truncated.write_text(json.dumps([_row(1), _row(2)])[:-20], encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_json_array(truncated, chunk_size=16))
+
+
+def test_json_lines_skips_blank_lines(tmp_path) -> None:
+    from scripts.seed_questions import iter_rows
+
+    path = tmp_path / "bank.jsonl"
+    path.write_text(json.dumps(_row(1)) + "\n\n" + json.dumps(_row(2)) + "\n", encoding="utf-8")
+
+    assert list(iter_rows(path)) == [_row(1), _row(2)]
+
+
+def test_xlsx_rows_are_keyed_by_lowercased_headers(tmp_path) -> None:
+    import openpyxl
+
+    from scripts.seed_questions import iter_rows
+
+    path = tmp_path / "bank.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["QUESTION", "TITLE", "Difficulty", None, "CATEGORY"])
+    sheet.append(["Why us?", "Motivation", "E", "ignored", None])
+    sheet.append([None, None, None, None, None])
+    sheet.append(["Biggest failure?", "Failure", "H", None, "Behavioral"])
+    workbook.save(path)
+
+    assert list(iter_rows(path)) == [
+        {"question": "Why us?", "title": "Motivation", "difficulty": "E"},
+        {
+            "question": "Biggest failure?",
+            "title": "Failure",
+            "difficulty": "H",
+            "category": "Behavioral",
+        },
+    ]
+
+
+def test_to_document_maps_datasheet_headers(init_db) -> None:
+    from scripts.seed_questions import to_document
+
+    document = to_document(
+        {"QUESTION": "Why us?", "TITLE": "Why Us", "DIFFICULTY": "m", "CATEGORY": "misc"},
+        Category.GENERAL,
+    )
+
+    assert document == {
+        "topic": "Why Us",
+        "text": "Why us?",
+        "difficulty": "medium",
+        "category": "general",
+        "slug": "why-us",
+    }
+    with pytest.raises(TypeError):
+        to_document(["not", "an", "object"], Category.GENERAL)  # type: ignore[arg-type]
+
+
+async def test_dry_run_reports_changes_without_writing(init_db, capsys) -> None:
+    from app.models.question import Question
+    from app.services.catalog import VERSIONS_COLLECTION
+    from scripts.seed_questions import seed, to_document
+
+    for row in (_row(1), _row(2)):
+        await Question.model_validate(to_document(row, Category.GENERAL)).insert()
+    collection = Question.get_pymongo_collection()
+    stored = await collection.find({}, {"_id": 0}).to_list(None)
+
+    rows = [_row(1), _row(2, text="Reworded"), _row(3), {"topic": "No text"}, "not a row"]
+    counts = await seed(collection, iter(rows), 2, Category.GENERAL, dry_run=True)
+
+    assert (counts.inserted, counts.updated, counts.unchanged, counts.invalid) == (1, 1, 1, 2)
+    assert await collection.find({}, {"_id": 0}).to_list(None) == stored
+    assert await collection.database[VERSIONS_COLLECTION].count_documents({}) == 0
+    out = capsys.readouterr().out
+    assert "+ topic-3" in out
+    assert "~ topic-2" in out
+    assert "'Reworded'" in out
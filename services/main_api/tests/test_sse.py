@@ -0,0 +1,113 @@
+from app.services.sse import ConnectionManager
+
+
+async def test_every_subscriber_of_an_interview_receives_events() -> None:
+    manager = ConnectionManager()
+    tab_one = manager.connect("iv")
+    tab_two = manager.connect("iv")
+    other = manager.connect("other-iv")
+
+    await manager.send("iv", {"n": 1})
+
+    assert tab_one.queue.get_nowait()["data"] == {"n": 1}
+    assert tab_two.queue.get_nowait()["data"] == {"n": 1}
+    assert other.queue.empty()
+    assert manager.stats()["active_subscribers"] == 3
+
+
+async def test_disconnect_removes_only_that_subscriber() -> None:
+    manager = ConnectionManager(replay_size=0)
+    tab_one = manager.connect("iv")
+    tab_two = manager.connect("iv")
+
+    manager.disconnect(tab_one)
+    await manager.send("iv", {"n": 1})
+
+    assert tab_one.queue.empty()
+    assert tab_two.queue.get_nowait()["data"] == {"n": 1}
+    manager.disconnect(tab_two)
+    assert manager.stats()["interviews"] == 0
+
+
+async def test_drop_oldest_policy_keeps_newest_events() -> None:
+    manager = ConnectionManager(max_queue_size=2, policy="drop_oldest")
+    slow = manager.connect("iv")
+
+    for n in range(4):
+        await manager.send("iv", {"n": n})
+
+    assert [slow.queue.get_nowait()["data"]["n"] for _ in range(2)] == [2, 3]
+    stats = manager.stats()
+    assert stats["dropped_events"] == 2
+    assert stats["queue_high_water"] == 2
+
+
+async def test_disconnect_policy_closes_slow_subscriber() -> None:
+    manager = ConnectionManager(max_queue_size=2, policy="disconnect")
+    slow = manager.connect("iv")
+    fast = manager.connect("iv")
+
+    await manager.send("iv", {"n": 0})
+    await manager.send("iv", {"n": 1})
+    fast.queue.get_nowait()
+    fast.queue.get_nowait()
+    await manager.send("iv", {"n": 2})
+
+    assert slow.queue.get_nowait() is None
+    assert fast.queue.get_nowait()["data"] == {"n": 2}
+    stats = manager.stats()
+    assert stats["disconnected_slow_consumers"] == 1
+    assert stats["active_subscribers"] == 1
+
+
+async def test_events_carry_increasing_ids() -> None:
+    manager = ConnectionManager()
+    sub = manager.connect("iv")
+
+    await manager.send("iv", {"n": 0})
+    await manager.send("iv", {"n": 1})
+
+    first, second = sub.queue.get_nowait(), sub.queue.get_nowait()
+    assert second["id"] > first["id"]
+
+
+async def test_late_subscriber_gets_buffered_events() -> None:
+    manager = ConnectionManager()
+    await manager.send("iv", {"type": "feedback"})
+
+    late = manager.connect("iv")
+
+    assert late.replayed == 1
+    assert late.queue.get_nowait()["data"] == {"type": "feedback"}
+
+
+async def test_reconnect_replays_only_events_after_last_event_id() -> None:
+    manager = ConnectionManager()
+    first = manager.connect("iv")
+    for n in range(3):
+        await manager.send("iv", {"n": n})
+    seen = first.queue.get_nowait()
+    manager.disconnect(first)
+
+    resumed = manager.connect("iv", last_event_id=seen["id"])
+
+    assert [resumed.queue.get_nowait()["data"]["n"] for _ in range(2)] == [1, 2]
+    assert resumed.queue.empty()
+
+
+async def test_replay_buffer_expires() -> None:
+    manager = ConnectionManager(replay_ttl_seconds=0.0)
+    await manager.send("iv", {"n": 0})
+
+    assert manager.connect("iv").replayed == 0
+    assert manager.stats()["replay_buffered_interviews"] == 0
+
+
+async def test_replay_buffer_is_bounded_per_interview() -> None:
+    manager = ConnectionManager(replay_size=2)
+    for n in range(5):
+        await manager.send("iv", {"n": n})
+
+    late = manager.connect("iv")
+
+    assert [late.queue.get_nowait()["data"]["n"] for _ in range(late.replayed)] == [3, 4]
@@ -3,7 +3,35 @@ from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     openai_api_key: str
+    openai_base_url: str | None = None  # point at a local fake server in tests/benchmarks
     rabbitmq_uri: str
     storage_path: str = "/app/storage"
     app_id: str = "transcript_service"
     health_port: int = 8001
+    # Unacked deliveries, and how many run at once (see mq.consumer.limit_concurrency)
+    prefetch_count: int = 8
+    max_concurrency: int = 8
+    # Connection pool of the process-wide OpenAI client
+    openai_max_connections: int = 20
+    openai_max_keepalive_connections: int = 10
+    openai_keepalive_expiry: float = 30.0
+    # Starting OpenAI limits; RATE_LIMIT_REDIS_URL shares them between replicas
+    openai_requests_per_minute: float = 500
+    rate_limit_redis_url: str | None = None
+    # Transcripts of audio already seen, keyed by content hash; shared by replicas on
+    # the same volume. Size is the total of the stored transcript text.
+    transcript_cache_enabled: bool = True
+    transcript_cache_path: str = "/app/storage/.cache/transcripts.sqlite3"
+    transcript_cache_max_bytes: int = 64 * 1024 * 1024
+    # Recordings longer than one chunk are split at pauses (needs ffmpeg) and their
+    # chunks transcribed concurrently, at most transcript_chunk_parallelism at once
+    transcript_chunking_enabled: bool = True
+    transcript_chunk_seconds: float = 90.0
+    transcript_chunk_overlap_seconds: float = 2.0
+    transcript_chunk_parallelism: int = 8
+    # Fused pipeline: grade the answer in this worker right after transcribing it and
+    # publish both results, instead of handing off through feedback_processing. Saves a
+    # queue hop; the feedback service's cache, streaming and batch mode don't apply.
+    fused_pipeline_enabled: bool = False
+    openai_feedback_requests_per_minute: float = 500
+    openai_feedback_tokens_per_minute: float = 30_000
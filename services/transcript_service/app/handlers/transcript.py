@@ -1,51 +1,143 @@
+import asyncio
 import logging
 import os
+from collections.abc import Awaitable, Callable
 
 import aio_pika
+import openai
 from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+from openai import AsyncOpenAI
+from pydantic import ValidationError
 
+from mock_interview_shared.mq.retry import dead_letter, retry_or_dead_letter
+from mock_interview_shared.utils.rate_limit import AdaptiveRateLimiter
 from mock_interview_shared.schemas.messages import (
+    FailureResult,
     FeedbackRequest,
+    FeedbackResult,
+    FeedbackScore,
     TranscriptRequest,
     TranscriptResult,
 )
 
 from ..config import Settings
-from ..services.whisper import transcribe
+from ..services.chunking import ChunkingOptions
+from ..services.transcript_cache import TranscriptCache, hash_file
+from ..services.whisper import MODEL, transcribe
 
 logger = logging.getLogger(__name__)
 
+QUEUE = "transcript_processing"
 
-async def handle(
-    message: AbstractIncomingMessage, channel: AbstractChannel, settings: Settings
+# Provider hiccups worth waiting out, plus a malformed feedback reply in fused mode;
+# anything else (a bad file, a 400) won't improve
+_RETRYABLE = (
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+    ValidationError,
+)
+
+# Grades (question, transcript) in-process when the fused pipeline is on
+Grade = Callable[[str, str], Awaitable[FeedbackScore]]
+
+
+async def _publish(channel: AbstractChannel, body: str, routing_key: str) -> None:
+    await channel.default_exchange.publish(
+        aio_pika.Message(body=body.encode()), routing_key=routing_key
+    )
+
+
+async def _process(
+    req: TranscriptRequest,
+    channel: AbstractChannel,
+    settings: Settings,
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None,
+    cache: TranscriptCache | None,
+    grade: Grade | None,
 ) -> None:
-    async with message.process(requeue=False):
-        req = TranscriptRequest.model_validate_json(message.body)
-        audio_path = os.path.join(settings.storage_path, req.recording_path)
+    audio_path = os.path.join(settings.storage_path, req.recording_path)
 
-        transcript = await transcribe(audio_path, settings.openai_api_key)
+    transcript = None
+    if cache is not None:
+        # Re-submitted recordings are byte-identical: skip Whisper for them
+        digest = req.audio_sha256 or await asyncio.to_thread(hash_file, audio_path)
+        cache_key = f"{MODEL}:{digest}"
+        transcript = await cache.get(cache_key)
+    if transcript is None:
+        chunking = None
+        if settings.transcript_chunking_enabled:
+            chunking = ChunkingOptions(
+                max_seconds=settings.transcript_chunk_seconds,
+                overlap_seconds=settings.transcript_chunk_overlap_seconds,
+                max_parallel=settings.transcript_chunk_parallelism,
+            )
+        transcript = await transcribe(audio_path, client, limiter, chunking)
+        if cache is not None:
+            await cache.put(cache_key, transcript)
+    else:
+        logger.info("Reused cached transcript for interview %s", req.interview_id)
 
-        result = TranscriptResult(
-            interview_id=req.interview_id,
-            transcript=transcript,
-            app_id=settings.app_id,
-            question=req.question,
-        )
-        await channel.default_exchange.publish(
-            aio_pika.Message(body=result.model_dump_json(by_alias=True).encode()),
-            routing_key="results_to_main_api",
-        )
+    result = TranscriptResult(
+        interview_id=req.interview_id,
+        transcript=transcript,
+        app_id=settings.app_id,
+        question=req.question,
+    )
+    await _publish(channel, result.model_dump_json(by_alias=True), "results_to_main_api")
 
-        feedback_req = FeedbackRequest(
-            interview_id=req.interview_id,
-            transcript=transcript,
-            question=req.question,
-            difficulty=req.difficulty,
-            category=req.category,
-        )
-        await channel.default_exchange.publish(
-            aio_pika.Message(body=feedback_req.model_dump_json(by_alias=True).encode()),
-            routing_key="feedback_processing",
+    if grade is not None:
+        # A failure here retries the whole job, but the transcript cache skips Whisper
+        score = await grade(req.question, transcript)
+        feedback = FeedbackResult(
+            interview_id=req.interview_id, feedback=score, app_id=settings.app_id
         )
+        await _publish(channel, feedback.model_dump_json(by_alias=True), "results_to_main_api")
+        return
+
+    feedback_req = FeedbackRequest(
+        interview_id=req.interview_id,
+        transcript=transcript,
+        question=req.question,
+        difficulty=req.difficulty,
+        category=req.category,
+    )
+    await _publish(channel, feedback_req.model_dump_json(by_alias=True), "feedback_processing")
+
+
+async def handle(
+    message: AbstractIncomingMessage,
+    channel: AbstractChannel,
+    settings: Settings,
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None = None,
+    cache: TranscriptCache | None = None,
+    grade: Grade | None = None,
+) -> None:
+    # Failures are moved to a retry or dead-letter queue below, so this only requeues
+    # if that move itself failed — the job is never dropped
+    async with message.process(requeue=True):
+        try:
+            req = TranscriptRequest.model_validate_json(message.body)
+        except ValidationError as exc:
+            await dead_letter(channel, message, QUEUE, f"invalid request: {exc}")
+            return
+
+        try:
+            await _process(req, channel, settings, client, limiter, cache, grade)
+        except Exception as exc:  # noqa: BLE001 - every failure is retried or dead-lettered
+            reason = f"{type(exc).__name__}: {exc}"
+            logger.warning("Transcription failed for interview %s: %s", req.interview_id, reason)
+            if await retry_or_dead_letter(
+                channel, message, QUEUE, reason, isinstance(exc, _RETRYABLE)
+            ):
+                failure = FailureResult(
+                    interview_id=req.interview_id, error=reason, app_id=settings.app_id
+                )
+                await _publish(
+                    channel, failure.model_dump_json(by_alias=True), "results_to_main_api"
+                )
+            return
 
         logger.info("Processed transcript for interview %s", req.interview_id)
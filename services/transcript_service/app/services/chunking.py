@@ -0,0 +1,187 @@
+"""Splitting long recordings into chunks that can be transcribed in parallel.
+
+Cuts go in pauses where possible: one ffmpeg pass with silencedetect finds the
+pauses and the recording's length (browser webm often has no duration header).
+A chunk with no pause near its end is cut hard and the next one starts
+`overlap_seconds` earlier, so no word is lost; merge_transcripts drops the words
+the two transcripts then share. Needs the ffmpeg binary; without it callers fall
+back to uploading the whole file.
+"""
+
+import asyncio
+import logging
+import re
+import shutil
+import string
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+_SILENCE_START = re.compile(r"silence_start: (-?\d+(?:\.\d+)?)")
+_SILENCE_END = re.compile(r"silence_end: (\d+(?:\.\d+)?)")
+_TIME = re.compile(r"time=(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+# How far from the ends of two overlapping transcripts to look for shared words
+_MAX_OVERLAP_WORDS = 20
+# Words Whisper may garble or drop right at a hard cut
+_MAX_CUT_WORDS = 2
+
+
+@dataclass(frozen=True)
+class ChunkingOptions:
+    max_seconds: float = 90.0
+    overlap_seconds: float = 2.0
+    # Chunks of one recording transcribed at once
+    max_parallel: int = 8
+    silence_db: float = -35.0
+    min_silence_seconds: float = 0.4
+
+
+@dataclass(frozen=True)
+class Chunk:
+    start: float
+    end: float
+    # Starts before the previous chunk's end, so their transcripts share some words
+    overlaps_previous: bool = False
+
+
+class FFmpegError(RuntimeError):
+    """ffmpeg couldn't read or write a recording."""
+
+
+def ffmpeg_available() -> bool:
+    return shutil.which("ffmpeg") is not None
+
+
+def parse_silencedetect(output: str) -> tuple[float | None, list[tuple[float, float]]]:
+    """Duration and (start, end) pauses from the stderr of an ffmpeg silencedetect pass."""
+    silences: list[tuple[float, float]] = []
+    start: float | None = None
+    for line in output.splitlines():
+        if match := _SILENCE_START.search(line):
+            start = max(0.0, float(match.group(1)))
+        elif (match := _SILENCE_END.search(line)) and start is not None:
+            silences.append((start, float(match.group(1))))
+            start = None
+    # The last progress line has the decoded length
+    times = _TIME.findall(output)
+    duration = None
+    if times:
+        hours, minutes, seconds = times[-1]
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    if start is not None and duration is not None:
+        silences.append((start, duration))  # trailing pause runs to the end
+    return duration, silences
+
+
+def plan_chunks(
+    duration: float, silences: list[tuple[float, float]], options: ChunkingOptions
+) -> list[Chunk]:
+    """Chunks of at most max_seconds, each ending in the latest pause of its second half."""
+    chunks: list[Chunk] = []
+    overlap = min(options.overlap_seconds, options.max_seconds / 2)  # always make progress
+    start, overlaps = 0.0, False
+    while duration - start > options.max_seconds:
+        limit = start + options.max_seconds
+        pauses = [
+            (s + e) / 2
+            for s, e in silences
+            if start + options.max_seconds / 2 <= (s + e) / 2 <= limit
+        ]
+        if pauses:
+            chunks.append(Chunk(start, max(pauses), overlaps))
+            start, overlaps = max(pauses), False
+        else:
+            chunks.append(Chunk(start, limit, overlaps))
+            start, overlaps = limit - overlap, True
+    chunks.append(Chunk(start, duration, overlaps))
+    return chunks
+
+
+async def _ffmpeg(*args: str) -> str:
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    output = stderr.decode(errors="replace")
+    if process.returncode != 0:
+        raise FFmpegError(f"ffmpeg exited with {process.returncode}: {output[-500:]}")
+    return output
+
+
+async def analyze(
+    path: str, options: ChunkingOptions
+) -> tuple[float | None, list[tuple[float, float]]]:
+    """Decode `path` once, returning its duration (None if unknown) and its pauses."""
+    output = await _ffmpeg(
+        "-i",
+        path,
+        "-vn",
+        "-af",
+        f"silencedetect=noise={options.silence_db}dB:d={options.min_silence_seconds}",
+        "-f",
+        "null",
+        "-",
+    )
+    return parse_silencedetect(output)
+
+
+async def cut(path: str, chunk: Chunk, out_path: str) -> None:
+    """Write one chunk as 16 kHz mono FLAC, small and lossless for Whisper."""
+    await _ffmpeg(
+        "-v",
+        "error",
+        "-ss",
+        f"{chunk.start:.3f}",
+        "-t",
+        f"{chunk.end - chunk.start:.3f}",
+        "-i",
+        path,
+        "-vn",
+        "-ac",
+        "1",
+        "-ar",
+        "16000",
+        "-c:a",
+        "flac",
+        "-y",
+        out_path,
+    )
+
+
+def _normalize(word: str) -> str:
+    return word.strip(string.punctuation + "“”‘’…").casefold()
+
+
+def _overlap(previous: list[str], following: list[str]) -> tuple[int, int]:
+    """(words to drop from the end of previous, words to drop from the start of following)."""
+    tail = [_normalize(w) for w in previous[-_MAX_OVERLAP_WORDS:]]
+    head = [_normalize(w) for w in following[:_MAX_OVERLAP_WORDS]]
+    best = (0, 0, 0)  # shared run length, drop from previous, drop from following
+    for skip_tail in range(_MAX_CUT_WORDS + 1):
+        for skip_head in range(_MAX_CUT_WORDS + 1):
+            end = len(tail) - skip_tail
+            # Two or more words, so a lone "the" or "and" isn't taken for overlap
+            for size in range(min(end, len(head) - skip_head), max(best[0], 1), -1):
+                if tail[end - size : end] == head[skip_head : skip_head + size]:
+                    best = (size, skip_tail, skip_head + size)
+                    break
+    return best[1], best[2]
+
+
+def merge_transcripts(texts: list[str], chunks: list[Chunk]) -> str:
+    """Join chunk transcripts in order, dropping words repeated across hard cuts."""
+    words: list[str] = []
+    for text, chunk in zip(texts, chunks):
+        following = text.split()
+        if chunk.overlaps_previous and words:
+            drop_previous, drop_following = _overlap(words, following)
+            del words[len(words) - drop_previous :]
+            following = following[drop_following:]
+        words.extend(following)
+    return " ".join(words)
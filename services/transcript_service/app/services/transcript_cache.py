@@ -0,0 +1,74 @@
+import hashlib
+import logging
+import sqlite3
+from typing import Protocol
+
+from mock_interview_shared.utils.sqlite_store import SQLiteLRUStore
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+def hash_file(path: str) -> str:
+    """sha256 of a file, read in chunks; blocking, so call it in a thread."""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class TranscriptCache(Protocol):
+    """Transcripts keyed by the content hash (and model) of the audio they came from."""
+
+    async def get(self, key: str) -> str | None: ...
+    async def put(self, key: str, transcript: str) -> None: ...
+    def stats(self) -> dict[str, int]: ...
+
+
+class SQLiteTranscriptCache:
+    """Persistent transcript cache in a single SQLite file, bounded by total size.
+
+    Least recently used transcripts are evicted first (see SQLiteLRUStore). A
+    broken or locked database never fails a job: errors are logged and treated
+    as a miss.
+    """
+
+    def __init__(self, path: str, max_bytes: int) -> None:
+        self._store = SQLiteLRUStore(path, max_bytes)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._errors = 0
+
+    async def get(self, key: str) -> str | None:
+        try:
+            transcript = await self._store.get(key)
+        except sqlite3.Error as exc:
+            self._errors += 1
+            logger.warning("Transcript cache lookup failed: %s", exc)
+            transcript = None
+        if transcript is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return transcript
+
+    async def put(self, key: str, transcript: str) -> None:
+        try:
+            self._evictions += await self._store.put(key, transcript)
+        except sqlite3.Error as exc:
+            self._errors += 1
+            logger.warning("Transcript cache write failed: %s", exc)
+
+    def close(self) -> None:
+        self._store.close()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "errors": self._errors,
+        }
@@ -1,8 +1,84 @@
+import asyncio
+import logging
+import os
+import tempfile
+
+from mock_interview_shared.utils.rate_limit import AdaptiveRateLimiter
 from openai import AsyncOpenAI
 
+from .chunking import (
+    ChunkingOptions,
+    FFmpegError,
+    analyze,
+    cut,
+    ffmpeg_available,
+    merge_transcripts,
+    plan_chunks,
+)
+
+logger = logging.getLogger(__name__)
+
+MODEL = "whisper-1"
+
+
+async def transcribe(
+    audio_path: str,
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None = None,
+    chunking: ChunkingOptions | None = None,
+) -> str:
+    """Transcribe a recording; with `chunking`, long ones are split and done in parallel.
+
+    Chunked, latency follows the chunk length rather than the recording's, and no
+    upload comes near Whisper's file-size limit. Recordings no longer than one
+    chunk, and every recording when ffmpeg is missing or can't read the file, go
+    up whole.
+    """
+    if chunking is not None and ffmpeg_available():
+        try:
+            duration, silences = await analyze(audio_path, chunking)
+            if duration is not None and duration > chunking.max_seconds:
+                return await _transcribe_chunks(
+                    audio_path, duration, silences, client, limiter, chunking
+                )
+        except FFmpegError as exc:
+            logger.warning("Can't split %s, uploading it whole: %s", audio_path, exc)
 
-async def transcribe(audio_path: str, api_key: str) -> str:
-    client = AsyncOpenAI(api_key=api_key)
+    if limiter is not None:
+        await limiter.acquire()
     with open(audio_path, "rb") as f:
-        response = await client.audio.transcriptions.create(model="whisper-1", file=f)
+        response = await client.audio.transcriptions.create(model=MODEL, file=f)
     return response.text
+
+
+async def _transcribe_chunks(
+    audio_path: str,
+    duration: float,
+    silences: list[tuple[float, float]],
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None,
+    chunking: ChunkingOptions,
+) -> str:
+    chunks = plan_chunks(duration, silences, chunking)
+    logger.info("Transcribing %.0fs of audio in %d chunks", duration, len(chunks))
+    semaphore = asyncio.Semaphore(chunking.max_parallel)
+    texts = [""] * len(chunks)
+
+    with tempfile.TemporaryDirectory(prefix="chunks-") as workdir:
+
+        async def one(index: int) -> None:
+            async with semaphore:
+                chunk_path = os.path.join(workdir, f"{index:04d}.flac")
+                await cut(audio_path, chunks[index], chunk_path)
+                texts[index] = await transcribe(chunk_path, client, limiter)
+
+        # A failed chunk cancels the rest. Re-raise its own error rather than the group,
+        # so callers can tell an ffmpeg failure or a retryable provider error apart
+        try:
+            async with asyncio.TaskGroup() as group:
+                for index in range(len(chunks)):
+                    group.create_task(one(index))
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from None
+
+    return merge_transcripts(texts, chunks)
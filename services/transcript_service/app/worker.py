@@ -1,39 +1,109 @@
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
 
 import uvicorn
-from aio_pika.abc import AbstractIncomingMessage
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+from openai import AsyncOpenAI
 
+from mock_interview_shared.ai.client import create_openai_client
+from mock_interview_shared.ai.feedback import MODEL as FEEDBACK_MODEL, generate_feedback
 from mock_interview_shared.mq.client import declare_queues, get_channel, get_connection
+from mock_interview_shared.mq.consumer import limit_concurrency
+from mock_interview_shared.schemas.messages import FeedbackScore
+from mock_interview_shared.utils.rate_limit import AdaptiveRateLimiter, create_rate_limit_backend
 
 from .config import Settings
-from .handlers.transcript import handle
+from .handlers.transcript import Grade, handle
 from .health import app as health_app
+from .services.transcript_cache import SQLiteTranscriptCache, TranscriptCache
 
 logging.basicConfig(level=logging.INFO)
 
+# Bucket key, named after the model (see AdaptiveRateLimiter)
+LIMITER_NAME = "openai:whisper-1"
+
+
+def make_on_message(
+    channel: AbstractChannel,
+    settings: Settings,
+    client: AsyncOpenAI,
+    limiter: AdaptiveRateLimiter | None = None,
+    cache: TranscriptCache | None = None,
+    grade: Grade | None = None,
+) -> Callable[[AbstractIncomingMessage], Awaitable[None]]:
+    """Transcribe each delivery, and grade it too when `grade` is set (fused pipeline)."""
+
+    async def on_message(message: AbstractIncomingMessage) -> None:
+        await handle(message, channel, settings, client, limiter, cache, grade)
+
+    return limit_concurrency(on_message, settings.max_concurrency)
+
+
+def make_grader(client: AsyncOpenAI, limiter: AdaptiveRateLimiter | None = None) -> Grade:
+    """Grade answers in this process, as the feedback service would (fused pipeline)."""
+
+    async def grade(question: str, transcript: str) -> FeedbackScore:
+        return await generate_feedback(question, transcript, client, limiter)
+
+    return grade
+
 
 async def main() -> None:
     settings = Settings()
 
+    rate_limit_backend = create_rate_limit_backend(settings.rate_limit_redis_url)
+    limiter = AdaptiveRateLimiter(
+        rate_limit_backend, LIMITER_NAME, settings.openai_requests_per_minute
+    )
+    health_app.state.rate_limiter = limiter
+    grade: Grade | None = None
+    feedback_client: AsyncOpenAI | None = None
+    if settings.fused_pipeline_enabled:
+        # Same bucket name as the feedback service, so both draw on one gpt-4o budget
+        feedback_limiter = AdaptiveRateLimiter(
+            rate_limit_backend,
+            f"openai:{FEEDBACK_MODEL}",
+            settings.openai_feedback_requests_per_minute,
+            settings.openai_feedback_tokens_per_minute,
+        )
+        health_app.state.feedback_rate_limiter = feedback_limiter
+        # Its own client, so each limiter only sees its own model's responses
+        feedback_client = create_openai_client(settings, feedback_limiter)
+        grade = make_grader(feedback_client, feedback_limiter)
+
+    cache: SQLiteTranscriptCache | None = None
+    if settings.transcript_cache_enabled:
+        cache = SQLiteTranscriptCache(
+            settings.transcript_cache_path, settings.transcript_cache_max_bytes
+        )
+    health_app.state.transcript_cache = cache
+    client = create_openai_client(settings, limiter)
     connection = await get_connection(settings.rabbitmq_uri)
     channel = await get_channel(connection)
-    queues = await declare_queues(channel)
+    queues = await declare_queues(channel, prefetch_count=settings.prefetch_count)
 
-    async def on_message(message: AbstractIncomingMessage) -> None:
-        await handle(message, channel, settings)
-
-    await queues["transcript_processing"].consume(on_message)
+    await queues["transcript_processing"].consume(
+        make_on_message(channel, settings, client, limiter, cache, grade)
+    )
 
     server_config = uvicorn.Config(
         health_app, host="0.0.0.0", port=settings.health_port, log_level="warning"
     )
     server = uvicorn.Server(server_config)
 
-    await asyncio.gather(
-        asyncio.get_event_loop().create_future(),  # keeps consumer alive
-        server.serve(),
-    )
+    try:
+        await asyncio.gather(
+            asyncio.get_event_loop().create_future(),  # keeps consumer alive
+            server.serve(),
+        )
+    finally:
+        await connection.close()
+        await client.close()
+        if feedback_client is not None:
+            await feedback_client.close()
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services.chunking import (
+    Chunk,
+    ChunkingOptions,
+    FFmpegError,
+    analyze,
+    merge_transcripts,
+    parse_silencedetect,
+    plan_chunks,
+)
+from app.services.whisper import transcribe
+
+_OPTIONS = ChunkingOptions(max_seconds=60, overlap_seconds=2)
+
+_SILENCEDETECT_OUTPUT = """\
+Input #0, matroska,webm, from 'answer.webm':
+  Duration: N/A, start: 0.000000, bitrate: N/A
+[silencedetect @ 0x5581] silence_start: -0.00566
+[silencedetect @ 0x5581] silence_end: 1.2 | silence_duration: 1.20566
+size=N/A time=00:01:30.00 bitrate=N/A speed= 400x
+[silencedetect @ 0x5581] silence_start: 41.5
+[silencedetect @ 0x5581] silence_end: 42.3 | silence_duration: 0.8
+[silencedetect @ 0x5581] silence_start: 598.9
+size=N/A time=00:10:00.02 bitrate=N/A speed= 412x
+"""
+
+
+def test_parse_silencedetect_reads_pauses_and_decoded_length() -> None:
+    duration, silences = parse_silencedetect(_SILENCEDETECT_OUTPUT)
+
+    assert duration == pytest.approx(600.02)
+    assert silences == [(0.0, 1.2), (41.5, 42.3), (598.9, pytest.approx(600.02))]
+
+
+def test_plan_cuts_in_the_latest_pause_of_each_chunk() -> None:
+    silences = [(20.0, 21.0), (50.0, 51.0), (55.0, 56.0), (100.0, 101.0)]
+
+    chunks = plan_chunks(130, silences, _OPTIONS)
+
+    assert chunks == [Chunk(0, 55.5), Chunk(55.5, 100.5), Chunk(100.5, 130)]
+
+
+def test_plan_cuts_hard_with_overlap_when_there_is_no_pause() -> None:
+    chunks = plan_chunks(150, [(10.0, 11.0)], _OPTIONS)
+
+    assert chunks == [Chunk(0, 60), Chunk(58, 118, True), Chunk(116, 150, True)]
+
+
+def test_plan_keeps_a_short_recording_whole() -> None:
+    assert plan_chunks(45, [], _OPTIONS) == [Chunk(0, 45)]
+
+
+def test_merge_drops_words_repeated_across_a_hard_cut() -> None:
+    chunks = [Chunk(0, 60), Chunk(58, 118, True), Chunk(118, 150)]
+    texts = [
+        "First we scoped the migration and shipped the new bil",
+        "the new billing system. On time, too.",
+        "The team was happy.",
+    ]
+
+    assert merge_transcripts(texts, chunks) == (
+        "First we scoped the migration and shipped the new billing system. On time, too."
+        " The team was happy."
+    )
+
+
+def test_merge_keeps_everything_when_nothing_repeats() -> None:
+    chunks = [Chunk(0, 60), Chunk(58, 118, True)]
+
+    assert merge_transcripts(["so I said", "we should ship"], chunks) == "so I said we should ship"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_runs_chunks_concurrently_and_keeps_their_order() -> None:
+    chunks = [Chunk(0, 60), Chunk(60, 120), Chunk(120, 180), Chunk(180, 200)]
+    running = peak = 0
+
+    async def fake_cut(path: str, chunk: Chunk, out_path: str) -> None:
+        await asyncio.to_thread(Path(out_path).write_text, str(chunks.index(chunk)))
+
+    async def fake_create(model: str, file) -> MagicMock:  # type: ignore[no-untyped-def]
+        nonlocal running, peak
+        index = int(file.read())
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (len(chunks) - index))  # later chunks finish first
+        running -= 1
+        return MagicMock(text=f"part{index}")
+
+    client = MagicMock()
+    client.audio.transcriptions.create = fake_create
+    options = ChunkingOptions(max_seconds=60, max_parallel=2)
+
+    with (
+        patch("app.services.whisper.ffmpeg_available", return_value=True),
+        patch("app.services.whisper.analyze", new=AsyncMock(return_value=(200.0, []))),
+        patch("app.services.whisper.plan_chunks", return_value=chunks),
+        patch("app.services.whisper.cut", new=fake_cut),
+    ):
+        text = await transcribe("/recordings/long.webm", client, chunking=options)
+
+    assert text == "part0 part1 part2 part3"
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_transcribe_uploads_short_recordings_whole() -> None:
+    client = MagicMock()
+    client.audio.transcriptions.create = AsyncMock(return_value=MagicMock(text="short answer"))
+
+    with (
+        patch("app.services.whisper.ffmpeg_available", return_value=True),
+        patch("app.services.whisper.analyze", new=AsyncMock(return_value=(45.0, []))),
+        patch("app.services.whisper.cut", new=AsyncMock()) as cut,
+        patch("builtins.open", MagicMock()),
+    ):
+        text = await transcribe("/recordings/short.webm", client, chunking=_OPTIONS)
+
+    assert text == "short answer"
+    cut.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_uploads_whole_when_a_chunk_cannot_be_cut() -> None:
+    client = MagicMock()
+    client.audio.transcriptions.create = AsyncMock(return_value=MagicMock(text="whole answer"))
+
+    with (
+        patch("app.services.whisper.ffmpeg_available", return_value=True),
+        patch("app.services.whisper.analyze", new=AsyncMock(return_value=(200.0, []))),
+        patch("app.services.whisper.cut", new=AsyncMock(side_effect=FFmpegError("bad file"))),
+        patch("builtins.open", MagicMock()),
+    ):
+        text = await transcribe("/recordings/odd.webm", client, chunking=_OPTIONS)
+
+    assert text == "whole answer"
+    client.audio.transcriptions.create.assert_awaited_once()
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg")
+@pytest.mark.asyncio
+async def test_analyze_finds_the_pause_in_real_audio(tmp_path) -> None:
+    path = os.path.join(tmp_path, "answer.webm")
+    # 3s tone, 1s silence, 3s tone
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg", "-v", "error", "-f", "lavfi", "-i", "sine=frequency=440:duration=3",
+        "-f", "lavfi", "-i", "anullsrc=r=44100:cl=mono:d=1",
+        "-f", "lavfi", "-i", "sine=frequency=440:duration=3",
+        "-filter_complex", "[0][1][2]concat=n=3:v=0:a=1", "-c:a", "libopus", path,
+    )  # fmt: skip
+    assert await process.wait() == 0
+
+    duration, silences = await analyze(path, ChunkingOptions())
+
+    assert duration == pytest.approx(7.0, abs=0.2)
+    assert len(silences) == 1
+    assert silences[0][0] == pytest.approx(3.0, abs=0.2)
@@ -0,0 +1,71 @@
+import hashlib
+from unittest.mock import patch
+
+import pytest
+
+from app.services.transcript_cache import SQLiteTranscriptCache, hash_file
+
+
+def test_hash_file_matches_sha256(tmp_path) -> None:
+    audio = tmp_path / "a.webm"
+    audio.write_bytes(b"x" * 3_000_000)
+    assert hash_file(str(audio)) == hashlib.sha256(b"x" * 3_000_000).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_round_trip_counts_hits_and_misses(tmp_path) -> None:
+    cache = SQLiteTranscriptCache(str(tmp_path / "t.sqlite3"), max_bytes=1_000)
+
+    assert await cache.get("whisper-1:abc") is None
+    await cache.put("whisper-1:abc", "hello there")
+    assert await cache.get("whisper-1:abc") == "hello there"
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "errors": 0}
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_a_restart(tmp_path) -> None:
+    path = str(tmp_path / "nested" / "t.sqlite3")
+    first = SQLiteTranscriptCache(path, max_bytes=1_000)
+    await first.put("k", "persisted")
+    first.close()
+
+    second = SQLiteTranscriptCache(path, max_bytes=1_000)
+    assert await second.get("k") == "persisted"
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_by_size(tmp_path) -> None:
+    cache = SQLiteTranscriptCache(str(tmp_path / "t.sqlite3"), max_bytes=30)
+    clock = iter(range(100))
+
+    with patch(
+        "mock_interview_shared.utils.sqlite_store.time.time", side_effect=lambda: next(clock)
+    ):
+        await cache.put("a", "a" * 10)
+        await cache.put("b", "b" * 10)
+        await cache.put("c", "c" * 10)
+        assert await cache.get("a") == "a" * 10  # now the most recently used
+        await cache.put("d", "d" * 10)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+        assert await cache.get("d") is not None
+
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_unusable_database_is_treated_as_a_miss(tmp_path) -> None:
+    # A directory where the database file should be: sqlite cannot open it
+    (tmp_path / "t.sqlite3").mkdir()
+    cache = SQLiteTranscriptCache(str(tmp_path / "t.sqlite3"), max_bytes=1_000)
+
+    assert await cache.get("k") is None
+    await cache.put("k", "v")
+
+    assert cache.stats()["errors"] == 2
@@ -13,9 +13,8 @@ async def test_transcribe_returns_text() -> None:
     mock_client = AsyncMock()
     mock_client.audio.transcriptions.create = AsyncMock(return_value=mock_response)
 
-    with patch("app.services.whisper.AsyncOpenAI", return_value=mock_client):
-        with patch("builtins.open", MagicMock()):
-            result = await transcribe("/fake/path/audio.mp3", "fake-key")
+    with patch("builtins.open", MagicMock()):
+        result = await transcribe("/fake/path/audio.mp3", mock_client)
 
     assert result == "Hello world transcript"
     mock_client.audio.transcriptions.create.assert_called_once()
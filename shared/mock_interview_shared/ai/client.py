@@ -0,0 +1,48 @@
+"""The pooled OpenAI client each worker process shares across its messages.
+
+Unlike the rest of mock_interview_shared this imports openai and httpx, so only
+services that call OpenAI (and therefore install both) should import it.
+"""
+
+from typing import Protocol
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from ..utils.rate_limit import AdaptiveRateLimiter, rate_limit_hook
+
+
+class OpenAIClientSettings(Protocol):
+    """The fields create_openai_client() reads from a service's Settings."""
+
+    openai_api_key: str
+    openai_base_url: str | None
+    openai_max_connections: int
+    openai_max_keepalive_connections: int
+    openai_keepalive_expiry: float
+
+
+def create_openai_client(
+    settings: OpenAIClientSettings, limiter: AdaptiveRateLimiter | None = None
+) -> AsyncOpenAI:
+    """Build the single OpenAI client shared by every message a worker handles.
+
+    Reusing one client keeps its httpx connection pool warm, so DNS, TCP and TLS
+    setup are paid once per connection rather than once per message. With a
+    limiter, every response (including the SDK's own retries) is fed to it so it
+    tracks the x-ratelimit-* headers and 429s.
+    """
+    event_hooks = {"response": [rate_limit_hook(limiter)]} if limiter is not None else {}
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive_connections,
+            keepalive_expiry=settings.openai_keepalive_expiry,
+        ),
+        event_hooks=event_hooks,
+    )
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url,
+        http_client=http_client,
+    )
@@ -0,0 +1,84 @@
+"""Grading one interview answer with a chat completion.
+
+Shared so that every worker that grades answers (the feedback service, and the
+transcript service in fused pipeline mode) sends the same prompt and agrees on
+PROMPT_VERSION. openai is imported for typing only: the caller brings the client.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from ..schemas.messages import FeedbackScore
+from ..utils.rate_limit import AdaptiveRateLimiter
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
+
+MODEL = "gpt-4o"
+# Bump whenever _SYSTEM_PROMPT or the request shape changes: it keys the feedback cache
+PROMPT_VERSION = "1"
+
+_SYSTEM_PROMPT = """You are a professional interview coach. Evaluate the candidate's answer and return JSON only.
+
+Return a JSON object with exactly these fields:
+{
+  "overall_impression": "<string>",
+  "strengths": ["<string>", ...],
+  "areas_for_improvement": ["<string>", ...],
+  "suggestions": ["<string>", ...],
+  "score": <integer 1-10>
+}"""
+
+
+# Rough size of the JSON reply, reserved up front along with the prompt
+_REPLY_TOKENS = 600
+
+
+def estimate_tokens(*texts: str) -> int:
+    """Tokens a completion over `texts` will count against the TPM limit (~4 chars each)."""
+    return sum(len(text) for text in texts) // 4 + _REPLY_TOKENS
+
+
+def completion_request(question: str, transcript: str) -> dict:
+    """Body of the chat.completions call that grades one answer (also used for batches)."""
+    return {
+        "model": MODEL,
+        "response_format": {"type": "json_object"},
+        "messages": [
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": f"Question: {question}\n\nCandidate's Answer: {transcript}",
+            },
+        ],
+    }
+
+
+def parse_feedback(content: str | None) -> FeedbackScore:
+    return FeedbackScore.model_validate_json(content or "{}")
+
+
+async def generate_feedback(
+    question: str,
+    transcript: str,
+    client: "AsyncOpenAI",
+    limiter: AdaptiveRateLimiter | None = None,
+    on_delta: Callable[[str], Awaitable[None]] | None = None,
+) -> FeedbackScore:
+    """Grade one answer; with on_delta, stream the reply and pass on each piece of its text."""
+    request = completion_request(question, transcript)
+    if limiter is not None:
+        await limiter.acquire(
+            tokens=estimate_tokens(*(message["content"] for message in request["messages"]))
+        )
+    if on_delta is None:
+        response = await client.chat.completions.create(**request)
+        return parse_feedback(response.choices[0].message.content)
+
+    parts: list[str] = []
+    stream = await client.chat.completions.create(**request, stream=True)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            parts.append(chunk.choices[0].delta.content)
+            await on_delta(chunk.choices[0].delta.content)
+    return parse_feedback("".join(parts))
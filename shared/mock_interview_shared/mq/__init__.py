@@ -1,3 +1,30 @@
 from .client import get_connection, get_channel, declare_queues, QUEUE_NAMES
+from .consumer import limit_concurrency
+from .retry import (
+    RETRY_DELAYS_MS,
+    RETRY_HEADER,
+    WORKER_QUEUES,
+    dead_letter,
+    dead_letter_queue_name,
+    retry_count,
+    retry_later,
+    retry_or_dead_letter,
+    retry_queue_name,
+)
 
-__all__ = ["get_connection", "get_channel", "declare_queues", "QUEUE_NAMES"]
+__all__ = [
+    "get_connection",
+    "get_channel",
+    "declare_queues",
+    "QUEUE_NAMES",
+    "limit_concurrency",
+    "RETRY_DELAYS_MS",
+    "RETRY_HEADER",
+    "WORKER_QUEUES",
+    "dead_letter",
+    "dead_letter_queue_name",
+    "retry_count",
+    "retry_later",
+    "retry_or_dead_letter",
+    "retry_queue_name",
+]
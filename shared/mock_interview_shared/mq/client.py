@@ -1,6 +1,8 @@
 import aio_pika
 from aio_pika.abc import AbstractRobustConnection, AbstractChannel, AbstractQueue
 
+from .retry import WORKER_QUEUES, declare_retry_queues
+
 # transcript_processing — main API → transcript service: audio file path + question, triggers Whisper
 # feedback_processing   — transcript service → feedback service: transcript + question, triggers GPT-4o
 # results_to_main_api  — both workers → main API: delivers transcript or feedback result back
@@ -16,10 +18,20 @@ async def get_channel(connection: AbstractRobustConnection) -> AbstractChannel:
     return await connection.channel()
 
 
-async def declare_queues(channel: AbstractChannel) -> dict[str, AbstractQueue]:
-    """Declare all service queues as durable. Sets prefetch_count=1 for fair consumer dispatch."""
-    await channel.set_qos(prefetch_count=1)
+async def declare_queues(
+    channel: AbstractChannel, prefetch_count: int = 1
+) -> dict[str, AbstractQueue]:
+    """Declare all service queues as durable and set the channel's prefetch_count.
+
+    The default of 1 gives strict fair dispatch; workers that process deliveries
+    concurrently raise it so the broker keeps enough messages in flight. The retry
+    tiers and dead-letter queue of each worker queue are declared too (see retry.py);
+    only the work queues are returned.
+    """
+    await channel.set_qos(prefetch_count=prefetch_count)
     queues: dict[str, AbstractQueue] = {}
     for name in QUEUE_NAMES:
         queues[name] = await channel.declare_queue(name, durable=True)
+    for name in WORKER_QUEUES:
+        await declare_retry_queues(channel, name)
     return queues
@@ -0,0 +1,22 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from aio_pika.abc import AbstractIncomingMessage
+
+OnMessage = Callable[[AbstractIncomingMessage], Awaitable[None]]
+
+
+def limit_concurrency(handler: OnMessage, max_concurrency: int) -> OnMessage:
+    """Wrap a consumer callback so at most max_concurrency calls run at once.
+
+    aio-pika starts a task per delivery, so up to the channel's prefetch_count may
+    be waiting on the semaphore; keep prefetch_count >= max_concurrency or some
+    slots go unused. The handler acks or rejects its own message.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def on_message(message: AbstractIncomingMessage) -> None:
+        async with semaphore:
+            await handler(message)
+
+    return on_message
@@ -0,0 +1,92 @@
+"""Move dead-lettered jobs back onto their work queue.
+
+    python -m mock_interview_shared.mq.redrive transcript_processing            # everything
+    python -m mock_interview_shared.mq.redrive feedback_processing --limit 10
+    python -m mock_interview_shared.mq.redrive transcript_processing --dry-run  # list only
+
+Re-driven messages start again with a fresh retry budget. The broker URL comes
+from --rabbitmq-uri or the RABBITMQ_URI environment variable.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+import aio_pika
+from aio_pika.abc import AbstractChannel
+
+from .client import get_connection
+from .retry import (
+    ERROR_HEADER,
+    FAILED_AT_HEADER,
+    RETRY_HEADER,
+    WORKER_QUEUES,
+    dead_letter_queue_name,
+)
+
+
+async def redrive(
+    channel: AbstractChannel, queue: str, limit: int | None = None, dry_run: bool = False
+) -> int:
+    """Republish up to `limit` messages from the DLQ of `queue`; returns how many were moved.
+
+    Each message is acked only once its republish is confirmed, so an interrupted
+    run leaves the remainder in the DLQ. In a dry run nothing is acked and every
+    message returns to the DLQ when the channel closes.
+    """
+    dlq = await channel.declare_queue(dead_letter_queue_name(queue), durable=True)
+    moved = 0
+    while limit is None or moved < limit:
+        message = await dlq.get(no_ack=False, fail=False)
+        if message is None:
+            break
+        headers = dict(message.headers or {})
+        print(
+            f"  {message.message_id or '-'}  failed {headers.get(FAILED_AT_HEADER, '?')}"
+            f"  after {headers.get(RETRY_HEADER, 0)} retries: {headers.get(ERROR_HEADER, '?')}"
+        )
+        moved += 1
+        if dry_run:
+            continue
+        for key in (RETRY_HEADER, ERROR_HEADER, FAILED_AT_HEADER):
+            headers.pop(key, None)
+        await channel.default_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers=headers,
+                content_type=message.content_type,
+                message_id=message.message_id,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=queue,
+        )
+        await message.ack()
+    return moved
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("queue", choices=WORKER_QUEUES)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="list the DLQ, move nothing")
+    parser.add_argument("--rabbitmq-uri", default=os.environ.get("RABBITMQ_URI"))
+    args = parser.parse_args()
+    if not args.rabbitmq_uri:
+        parser.error("--rabbitmq-uri or RABBITMQ_URI is required")
+
+    connection = await get_connection(args.rabbitmq_uri)
+    try:
+        # Confirms (the default) make each ack wait for its republish to land
+        channel = await connection.channel()
+        moved = await redrive(channel, args.queue, args.limit, args.dry_run)
+        await channel.close()
+    finally:
+        await connection.close()
+
+    verb = "would be re-driven" if args.dry_run else "re-driven"
+    print(f"\n{moved} message(s) {verb} to {args.queue}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""Delayed retries and dead-lettering for the worker queues.
+
+Each worker queue gets one retry queue per backoff tier. A retry queue has no
+consumers: messages sit there until its x-message-ttl expires and RabbitMQ
+dead-letters them back onto the work queue. The TTL is per queue rather than per
+message, so expiry is strictly FIFO and a long delay never holds up a short one.
+
+    transcript_processing ──fail──▶ transcript_processing.retry.5s ──5s──▶ transcript_processing
+                          ──exhausted / permanent──▶ transcript_processing.dlq
+
+The work queues themselves keep their original arguments, so existing
+deployments redeclare them without a PRECONDITION_FAILED; the handlers move
+failed messages explicitly instead.
+"""
+
+import logging
+from datetime import UTC, datetime
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage
+
+logger = logging.getLogger(__name__)
+
+# Queues whose consumers call an upstream provider and so need retries
+WORKER_QUEUES = ["transcript_processing", "feedback_processing"]
+
+# Backoff tiers; attempt n waits RETRY_DELAYS_MS[n]. The TTLs are queue arguments,
+# so every service must agree on them — change them here, not per service.
+RETRY_DELAYS_MS = (5_000, 30_000, 120_000, 600_000)
+
+RETRY_HEADER = "x-retry-count"
+ERROR_HEADER = "x-last-error"
+FAILED_AT_HEADER = "x-failed-at"
+
+
+def retry_queue_name(queue: str, delay_ms: int) -> str:
+    return f"{queue}.retry.{delay_ms // 1000}s"
+
+
+def dead_letter_queue_name(queue: str) -> str:
+    return f"{queue}.dlq"
+
+
+def retry_count(message: AbstractIncomingMessage) -> int:
+    """How many times this message has already been retried."""
+    value = (message.headers or {}).get(RETRY_HEADER, 0)
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return 0
+
+
+async def declare_retry_queues(channel: AbstractChannel, queue: str) -> None:
+    """Declare the backoff tiers and dead-letter queue for one work queue."""
+    for delay_ms in RETRY_DELAYS_MS:
+        await channel.declare_queue(
+            retry_queue_name(queue, delay_ms),
+            durable=True,
+            arguments={
+                "x-message-ttl": delay_ms,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": queue,
+            },
+        )
+    await channel.declare_queue(dead_letter_queue_name(queue), durable=True)
+
+
+def _copy(message: AbstractIncomingMessage, headers: dict) -> aio_pika.Message:
+    return aio_pika.Message(
+        body=message.body,
+        headers={**(message.headers or {}), **headers},
+        content_type=message.content_type,
+        message_id=message.message_id,
+        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+    )
+
+
+async def retry_later(
+    channel: AbstractChannel, message: AbstractIncomingMessage, queue: str
+) -> bool:
+    """Park the message on the next backoff tier for `queue`.
+
+    Returns False, without publishing anything, once every tier has been used;
+    the caller should then dead_letter() it.
+    """
+    attempt = retry_count(message)
+    if attempt >= len(RETRY_DELAYS_MS):
+        return False
+    delay_ms = RETRY_DELAYS_MS[attempt]
+    await channel.default_exchange.publish(
+        _copy(message, {RETRY_HEADER: attempt + 1}),
+        routing_key=retry_queue_name(queue, delay_ms),
+    )
+    logger.info("Retrying %s message in %ds (attempt %d)", queue, delay_ms // 1000, attempt + 1)
+    return True
+
+
+async def dead_letter(
+    channel: AbstractChannel, message: AbstractIncomingMessage, queue: str, reason: str
+) -> None:
+    """Move the message to the dead-letter queue of `queue`, recording why."""
+    await channel.default_exchange.publish(
+        _copy(
+            message,
+            {ERROR_HEADER: reason[:1000], FAILED_AT_HEADER: datetime.now(UTC).isoformat()},
+        ),
+        routing_key=dead_letter_queue_name(queue),
+    )
+    logger.error(
+        "Dead-lettered %s message after %d retries: %s", queue, retry_count(message), reason
+    )
+
+
+async def retry_or_dead_letter(
+    channel: AbstractChannel,
+    message: AbstractIncomingMessage,
+    queue: str,
+    reason: str,
+    retryable: bool,
+) -> bool:
+    """Retry a failed job if it may succeed later, else dead-letter it.
+
+    Returns True when the job has been given up on, so the caller can report it.
+    """
+    if retryable and await retry_later(channel, message, queue):
+        return False
+    await dead_letter(channel, message, queue, reason)
+    return True
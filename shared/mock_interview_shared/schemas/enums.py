@@ -4,6 +4,8 @@ from enum import Enum
 class MessageType(str, Enum):
     TRANSCRIPT = "transcript"
     FEEDBACK = "feedback"
+    FEEDBACK_DELTA = "feedback.delta"
+    FAILURE = "failure"
 
 
 class InterviewStatus(str, Enum):
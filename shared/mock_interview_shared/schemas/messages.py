@@ -8,6 +8,8 @@ from .enums import MessageType, Difficulty, Category
 class TranscriptRequest(BaseModel):
     interview_id: str = Field(alias="interview")
     recording_path: str
+    # Lets the transcript service find a cached transcript without re-reading the file
+    audio_sha256: str | None = None
     question: str
     difficulty: Difficulty | None = None
     category: Category | None = None
@@ -46,3 +48,25 @@ class FeedbackResult(BaseModel):
     feedback: FeedbackScore | str
     app_id: str
     model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+
+
+# A piece of the feedback JSON while the model is still writing it. Best-effort and
+# never stored; every attempt has its own id and seq restarts at 0 with it, so a
+# retry restarts the text. Pieces of one attempt can arrive out of order.
+class FeedbackDelta(BaseModel):
+    type: Literal[MessageType.FEEDBACK_DELTA] = MessageType.FEEDBACK_DELTA
+    interview_id: str = Field(alias="interview")
+    attempt: str = ""
+    seq: int
+    delta: str
+    app_id: str
+    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
+
+
+# Sent when a worker gives up on a job: retries exhausted or a permanent error
+class FailureResult(BaseModel):
+    type: Literal[MessageType.FAILURE] = MessageType.FAILURE
+    interview_id: str = Field(alias="interview")
+    error: str
+    app_id: str
+    model_config = ConfigDict(populate_by_name=True, use_enum_values=True)
@@ -0,0 +1,249 @@
+"""Client-side rate limiting for calls to a provider API such as OpenAI.
+
+AdaptiveRateLimiter keeps a requests-per-minute bucket and, optionally, a
+tokens-per-minute bucket. acquire() reserves capacity before a call and sleeps
+for as long as the buckets are in debt, so callers queue up locally instead of
+collecting 429s. observe() feeds every HTTP response back in: the provider's
+x-ratelimit-* headers replace our idea of the limits and cap what we think is
+left, and a 429 drains the buckets for its retry-after.
+
+rate_limit_hook() plugs observe() into an httpx client. Bucket state lives in
+a RateLimitBackend. The in-memory backend limits one process;
+RedisRateLimitBackend shares the buckets between every replica.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: str | None) -> float | None:
+    """Seconds in an OpenAI reset header ("20ms", "1s", "6m0s") or a plain number."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNITS[unit] for amount, unit in parts)
+
+
+class RateLimitBackend(Protocol):
+    """Token buckets that refill continuously at `rate` per second up to `capacity`."""
+
+    async def reserve(self, key: str, amount: float, capacity: float, rate: float) -> float:
+        """Take `amount` (the level may go negative); returns seconds until it is paid off."""
+        ...
+
+    async def cap(self, key: str, level: float, capacity: float, rate: float) -> None:
+        """Lower the bucket to `level` if it holds more; a negative level pauses it."""
+        ...
+
+
+class InMemoryRateLimitBackend:
+    """Buckets for this process only; the default."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def _refill(self, key: str, capacity: float, rate: float) -> tuple[float, float]:
+        now = time.monotonic()
+        level, updated = self._buckets.get(key, (capacity, now))
+        return min(capacity, level + (now - updated) * rate), now
+
+    async def reserve(self, key: str, amount: float, capacity: float, rate: float) -> float:
+        level, now = self._refill(key, capacity, rate)
+        level -= amount
+        self._buckets[key] = (level, now)
+        return -level / rate if level < 0 else 0.0
+
+    async def cap(self, key: str, level: float, capacity: float, rate: float) -> None:
+        current, now = self._refill(key, capacity, rate)
+        self._buckets[key] = (min(current, level), now)
+
+
+# KEYS[1] bucket; ARGV: mode ("reserve" | "cap"), amount or level, capacity, rate.
+# Uses the server clock so replicas on different hosts agree on refill.
+_BUCKET_SCRIPT = """
+local capacity, rate = tonumber(ARGV[3]), tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local level = tonumber(redis.call('HGET', KEYS[1], 'level'))
+local updated = tonumber(redis.call('HGET', KEYS[1], 'updated'))
+if level == nil then level = capacity; updated = now end
+level = math.min(capacity, level + math.max(0, now - updated) * rate)
+local wait = 0
+if ARGV[1] == 'reserve' then
+  level = level - tonumber(ARGV[2])
+  if level < 0 then wait = -level / rate end
+else
+  level = math.min(level, tonumber(ARGV[2]))
+end
+redis.call('HSET', KEYS[1], 'level', tostring(level), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - level) / rate * 1000) + 60000)
+return tostring(wait)
+"""
+
+
+class RedisRateLimitBackend:
+    """Buckets shared by every process, over any redis.asyncio-compatible client."""
+
+    def __init__(self, client: Any, prefix: str = "mock-interview:ratelimit:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def _run(self, mode: str, key: str, value: float, capacity: float, rate: float) -> float:
+        result = await self._client.eval(
+            _BUCKET_SCRIPT, 1, self._prefix + key, mode, value, capacity, rate
+        )
+        return float(result.decode() if isinstance(result, bytes) else result)
+
+    async def reserve(self, key: str, amount: float, capacity: float, rate: float) -> float:
+        return await self._run("reserve", key, amount, capacity, rate)
+
+    async def cap(self, key: str, level: float, capacity: float, rate: float) -> None:
+        await self._run("cap", key, level, capacity, rate)
+
+
+def create_rate_limit_backend(redis_url: str | None) -> RateLimitBackend:
+    """Return a Redis backend when a URL is configured, otherwise an in-process one."""
+    if not redis_url:
+        return InMemoryRateLimitBackend()
+    try:
+        import redis.asyncio as redis_asyncio  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise RuntimeError(
+            "RATE_LIMIT_REDIS_URL is set but the 'redis' package is not installed"
+        ) from exc
+    return RedisRateLimitBackend(redis_asyncio.from_url(redis_url))
+
+
+class AdaptiveRateLimiter:
+    """Requests- and tokens-per-minute limits for one provider model.
+
+    `name` keys the buckets in the backend. Provider limits are per model, so name
+    the limiter after its model ("openai:whisper-1"): every replica calling that
+    model with the same API key then shares one budget, given a shared backend
+    such as RedisRateLimitBackend. The configured limits are a starting point:
+    x-ratelimit-limit-* headers replace them once seen.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        name: str,
+        requests_per_minute: float,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        self.backend = backend
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._acquired = 0
+        self._waits = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._throttled = 0
+
+    async def _reserve(self, bucket: str, amount: float, per_minute: float) -> float:
+        return await self.backend.reserve(
+            f"{self.name}:{bucket}", amount, per_minute, per_minute / 60.0
+        )
+
+    async def _cap(self, bucket: str, level: float, per_minute: float) -> None:
+        await self.backend.cap(f"{self.name}:{bucket}", level, per_minute, per_minute / 60.0)
+
+    async def acquire(self, tokens: int = 0) -> float:
+        """Wait until one request (and `tokens` tokens) may be sent; returns seconds waited."""
+        wait = await self._reserve("requests", 1, self.requests_per_minute)
+        if tokens and self.tokens_per_minute:
+            wait = max(wait, await self._reserve("tokens", tokens, self.tokens_per_minute))
+        self._acquired += 1
+        if wait > 0:
+            self._waits += 1
+            self._wait_seconds_total += wait
+            self._wait_seconds_max = max(self._wait_seconds_max, wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    async def observe(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt to one provider response (call it for every response, retries included)."""
+        limit = headers.get("x-ratelimit-limit-requests")
+        if limit and float(limit) > 0:
+            self.requests_per_minute = float(limit)
+        limit = headers.get("x-ratelimit-limit-tokens")
+        if limit and float(limit) > 0 and self.tokens_per_minute is not None:
+            self.tokens_per_minute = float(limit)
+
+        if status_code == 429:
+            self._throttled += 1
+            pause = (
+                (parse_duration(headers.get("retry-after-ms")) or 0) / 1000
+                or parse_duration(headers.get("retry-after"))
+                or max(
+                    parse_duration(headers.get("x-ratelimit-reset-requests")) or 0,
+                    parse_duration(headers.get("x-ratelimit-reset-tokens")) or 0,
+                )
+                or 1.0
+            )
+            logger.warning("%s rate limited by provider; pausing %.1fs", self.name, pause)
+            # Debt of `pause` seconds' refill: every caller waits it out
+            await self._cap(
+                "requests", -self.requests_per_minute / 60.0 * pause, self.requests_per_minute
+            )
+            if self.tokens_per_minute:
+                await self._cap(
+                    "tokens", -self.tokens_per_minute / 60.0 * pause, self.tokens_per_minute
+                )
+            return
+
+        # The provider also counts other clients' usage; never believe we have more left
+        remaining = headers.get("x-ratelimit-remaining-requests")
+        if remaining is not None:
+            await self._cap("requests", float(remaining), self.requests_per_minute)
+        remaining = headers.get("x-ratelimit-remaining-tokens")
+        if remaining is not None and self.tokens_per_minute:
+            await self._cap("tokens", float(remaining), self.tokens_per_minute)
+
+    def stats(self) -> dict[str, float | int | None]:
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "acquired": self._acquired,
+            "waits": self._waits,
+            "wait_seconds_total": round(self._wait_seconds_total, 3),
+            "wait_seconds_max": round(self._wait_seconds_max, 3),
+            "throttled": self._throttled,
+        }
+
+
+def rate_limit_hook(
+    limiter: AdaptiveRateLimiter,
+) -> Callable[["httpx.Response"], Awaitable[None]]:
+    """httpx response hook that reports every provider response to `limiter`.
+
+    A response the limiter can't use (a malformed header, the Redis backend down)
+    is logged and skipped: the hook must never fail the call it observes.
+    """
+
+    async def observe(response: "httpx.Response") -> None:
+        try:
+            await limiter.observe(response.status_code, response.headers)
+        except Exception:
+            logger.warning("%s: could not observe a response", limiter.name, exc_info=True)
+
+    return observe
@@ -0,0 +1,96 @@
+"""A size-bounded, least-recently-used key/value store in a single SQLite file.
+
+Both workers keep results on local disk with this: the transcript service its
+transcripts, the feedback service its graded feedback. The file can live on a
+volume shared by several replicas (WAL mode). Blocking calls run in a thread,
+one at a time; sqlite3.Error is left to the caller, which usually treats it as
+a miss so a broken cache never fails a job.
+"""
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+
+
+class SQLiteLRUStore:
+    """Text values keyed by string, bounded by total size and optionally by age.
+
+    Every get() refreshes the entry's last-used time. put() deletes entries older
+    than max_age, then least recently used ones until the stored values fit in
+    max_bytes, and returns how many entries it evicted. An entry's age counts from
+    `stored_at` (wall-clock seconds, default now), so a value made elsewhere can
+    keep its original time.
+    """
+
+    def __init__(self, path: str, max_bytes: int, max_age: float | None = None) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = asyncio.Lock()
+        self._db: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_used)")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_age ON entries (stored_at)")
+            db.commit()
+            self._db = db
+        return self._db
+
+    def _get(self, key: str) -> str | None:
+        db = self._connect()
+        row = db.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        db.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), key))
+        db.commit()
+        return row[0]
+
+    def _put(self, key: str, value: str, stored_at: float | None) -> int:
+        db = self._connect()
+        now = time.time()
+        db.execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, stored_at, last_used)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, value, len(value.encode()), now if stored_at is None else stored_at, now),
+        )
+        evicted = 0
+        if self.max_age is not None:
+            evicted += db.execute(
+                "DELETE FROM entries WHERE stored_at < ?", (now - self.max_age,)
+            ).rowcount
+        (total,) = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total > self.max_bytes:
+            # Walk from the least recently used entry until enough has been freed
+            victims: list[str] = []
+            for victim, size in db.execute("SELECT key, size FROM entries ORDER BY last_used"):
+                if total <= self.max_bytes:
+                    break
+                victims.append(victim)
+                total -= size
+            db.executemany("DELETE FROM entries WHERE key = ?", [(v,) for v in victims])
+            evicted += len(victims)
+        db.commit()
+        return evicted
+
+    async def get(self, key: str) -> str | None:
+        async with self._lock:
+            return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, value: str, stored_at: float | None = None) -> int:
+        async with self._lock:
+            return await asyncio.to_thread(self._put, key, value, stored_at)
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,139 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mock_interview_shared.mq.client import QUEUE_NAMES, declare_queues
+from mock_interview_shared.mq.consumer import limit_concurrency
+from mock_interview_shared.mq.redrive import redrive
+from mock_interview_shared.mq.retry import (
+    RETRY_DELAYS_MS,
+    RETRY_HEADER,
+    WORKER_QUEUES,
+    dead_letter,
+    dead_letter_queue_name,
+    retry_later,
+    retry_queue_name,
+)
+
+
+@pytest.mark.asyncio
+async def test_declare_queues_defaults_to_fair_dispatch() -> None:
+    channel = AsyncMock()
+    queues = await declare_queues(channel)
+    channel.set_qos.assert_awaited_once_with(prefetch_count=1)
+    assert set(queues) == set(QUEUE_NAMES)
+
+
+@pytest.mark.asyncio
+async def test_declare_queues_custom_prefetch() -> None:
+    channel = AsyncMock()
+    await declare_queues(channel, prefetch_count=16)
+    channel.set_qos.assert_awaited_once_with(prefetch_count=16)
+
+
+def _incoming(headers: dict | None = None) -> MagicMock:
+    message = MagicMock()
+    message.body = b'{"interview": "i-1"}'
+    message.headers = headers or {}
+    message.content_type = "application/json"
+    message.message_id = "m-1"
+    message.ack = AsyncMock()
+    return message
+
+
+@pytest.mark.asyncio
+async def test_declare_queues_adds_retry_tiers_and_dlq() -> None:
+    channel = AsyncMock()
+    await declare_queues(channel)
+
+    declared = {c.args[0]: c.kwargs for c in channel.declare_queue.await_args_list}
+    for queue in WORKER_QUEUES:
+        assert dead_letter_queue_name(queue) in declared
+        for delay_ms in RETRY_DELAYS_MS:
+            arguments = declared[retry_queue_name(queue, delay_ms)]["arguments"]
+            assert arguments["x-message-ttl"] == delay_ms
+            assert arguments["x-dead-letter-routing-key"] == queue
+    # The work queues keep their plain declaration
+    assert declared["transcript_processing"] == {"durable": True}
+
+
+@pytest.mark.asyncio
+async def test_retry_later_walks_the_backoff_tiers() -> None:
+    channel = AsyncMock()
+
+    assert await retry_later(channel, _incoming(), "feedback_processing")
+    message = channel.default_exchange.publish.await_args.args[0]
+    routing_key = channel.default_exchange.publish.await_args.kwargs["routing_key"]
+    assert routing_key == retry_queue_name("feedback_processing", RETRY_DELAYS_MS[0])
+    assert message.headers[RETRY_HEADER] == 1
+    assert message.body == b'{"interview": "i-1"}'
+
+    await retry_later(channel, _incoming({RETRY_HEADER: 2}), "feedback_processing")
+    routing_key = channel.default_exchange.publish.await_args.kwargs["routing_key"]
+    assert routing_key == retry_queue_name("feedback_processing", RETRY_DELAYS_MS[2])
+
+
+@pytest.mark.asyncio
+async def test_retry_later_refuses_once_tiers_are_exhausted() -> None:
+    channel = AsyncMock()
+    exhausted = _incoming({RETRY_HEADER: len(RETRY_DELAYS_MS)})
+
+    assert not await retry_later(channel, exhausted, "feedback_processing")
+    channel.default_exchange.publish.assert_not_awaited()
+
+    await dead_letter(channel, exhausted, "feedback_processing", "RateLimitError")
+    message = channel.default_exchange.publish.await_args.args[0]
+    routing_key = channel.default_exchange.publish.await_args.kwargs["routing_key"]
+    assert routing_key == "feedback_processing.dlq"
+    assert message.headers["x-last-error"] == "RateLimitError"
+
+
+@pytest.mark.asyncio
+async def test_redrive_republishes_with_a_fresh_retry_budget() -> None:
+    dead = [
+        _incoming({RETRY_HEADER: 4, "x-last-error": "boom", "trace": "t"}),
+        _incoming({RETRY_HEADER: 4}),
+    ]
+    dlq = AsyncMock()
+    dlq.get.side_effect = [*dead, None]
+    channel = AsyncMock()
+    channel.declare_queue.return_value = dlq
+
+    moved = await redrive(channel, "transcript_processing")
+
+    assert moved == 2
+    first = channel.default_exchange.publish.await_args_list[0]
+    assert first.kwargs["routing_key"] == "transcript_processing"
+    assert first.args[0].headers == {"trace": "t"}
+    for message in dead:
+        message.ack.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_redrive_dry_run_moves_nothing() -> None:
+    dlq = AsyncMock()
+    dlq.get.side_effect = [_incoming(), _incoming(), None]
+    channel = AsyncMock()
+    channel.declare_queue.return_value = dlq
+
+    assert await redrive(channel, "transcript_processing", limit=1, dry_run=True) == 1
+    channel.default_exchange.publish.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_limit_concurrency_caps_handlers_in_flight() -> None:
+    running = peak = 0
+
+    async def handler(message) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    on_message = limit_concurrency(handler, 2)
+    # A whole prefetch window is delivered at once
+    await asyncio.gather(*(on_message(MagicMock()) for _ in range(6)))
+
+    assert peak == 2
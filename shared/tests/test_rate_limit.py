@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mock_interview_shared.utils.rate_limit import (
+    AdaptiveRateLimiter,
+    InMemoryRateLimitBackend,
+    parse_duration,
+    rate_limit_hook,
+)
+
+
+def test_parse_duration_understands_openai_reset_headers() -> None:
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("1s") == 1.0
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("1h2m3.5s") == pytest.approx(3723.5)
+    assert parse_duration("2.5") == 2.5
+    assert parse_duration(None) is None
+    assert parse_duration("soon") is None
+
+
+@pytest.mark.asyncio
+async def test_backend_lets_a_burst_through_then_charges_debt() -> None:
+    backend = InMemoryRateLimitBackend()
+
+    assert await backend.reserve("k", 1, capacity=2, rate=1.0) == 0
+    assert await backend.reserve("k", 1, capacity=2, rate=1.0) == 0
+    assert await backend.reserve("k", 1, capacity=2, rate=1.0) == pytest.approx(1.0, abs=0.01)
+    assert await backend.reserve("k", 1, capacity=2, rate=1.0) == pytest.approx(2.0, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_once_the_minute_budget_is_spent() -> None:
+    limiter = AdaptiveRateLimiter(InMemoryRateLimitBackend(), "m", requests_per_minute=2)
+
+    with patch("mock_interview_shared.utils.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+        assert await limiter.acquire() == 0
+        assert await limiter.acquire() == 0
+        waited = await limiter.acquire()
+
+    assert waited == pytest.approx(30.0, abs=0.1)
+    sleep.assert_awaited_once()
+    stats = limiter.stats()
+    assert stats["acquired"] == 3
+    assert stats["waits"] == 1
+    assert stats["wait_seconds_max"] == pytest.approx(30.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_tokens_bucket_limits_large_requests() -> None:
+    limiter = AdaptiveRateLimiter(
+        InMemoryRateLimitBackend(), "m", requests_per_minute=1000, tokens_per_minute=6000
+    )
+
+    with patch("mock_interview_shared.utils.rate_limit.asyncio.sleep", new=AsyncMock()):
+        assert await limiter.acquire(tokens=6000) == 0
+        # 600 tokens at 100/s
+        assert await limiter.acquire(tokens=600) == pytest.approx(6.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_429_pauses_every_caller_for_retry_after() -> None:
+    limiter = AdaptiveRateLimiter(InMemoryRateLimitBackend(), "m", requests_per_minute=600)
+
+    await limiter.observe(429, {"retry-after": "3"})
+
+    with patch("mock_interview_shared.utils.rate_limit.asyncio.sleep", new=AsyncMock()):
+        assert await limiter.acquire() == pytest.approx(3.1, abs=0.05)
+    assert limiter.stats()["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_headers_replace_limits_and_cap_remaining() -> None:
+    limiter = AdaptiveRateLimiter(
+        InMemoryRateLimitBackend(), "m", requests_per_minute=10_000, tokens_per_minute=1_000_000
+    )
+
+    await limiter.observe(
+        200,
+        {
+            "x-ratelimit-limit-requests": "60",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "29000",
+        },
+    )
+
+    assert limiter.requests_per_minute == 60
+    assert limiter.tokens_per_minute == 30000
+    with patch("mock_interview_shared.utils.rate_limit.asyncio.sleep", new=AsyncMock()):
+        # Another client used up the window: wait for one request's refill (1s at 60/min)
+        assert await limiter.acquire() == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_hook_logs_instead_of_failing_the_observed_call(caplog) -> None:
+    backend = InMemoryRateLimitBackend()
+    limiter = AdaptiveRateLimiter(backend, "m", requests_per_minute=60)
+    hook = rate_limit_hook(limiter)
+
+    await hook(SimpleNamespace(status_code=200, headers={"x-ratelimit-limit-requests": "lots"}))
+    with patch.object(backend, "cap", new=AsyncMock(side_effect=ConnectionError("redis down"))):
+        await hook(SimpleNamespace(status_code=429, headers={"retry-after": "1"}))
+
+    assert limiter.requests_per_minute == 60
+    assert len([r for r in caplog.records if "could not observe" in r.message]) == 2
@@ -1,9 +1,11 @@
 import pytest
 from mock_interview_shared.schemas.enums import MessageType
 from mock_interview_shared.schemas.messages import (
+    FeedbackDelta,
     FeedbackRequest,
     FeedbackResult,
     FeedbackScore,
+    FailureResult,
     TranscriptRequest,
     TranscriptResult,
 )
@@ -134,3 +136,17 @@ def test_feedback_result_score_round_trip():
     dumped = obj.model_dump(by_alias=True)
     obj2 = FeedbackResult.model_validate(dumped)
     assert isinstance(obj2.feedback, FeedbackScore)
+
+
+def test_failure_result_type_serialises_as_string():
+    obj = FailureResult(interview_id="r6", error="RateLimitError", app_id="app")
+    dumped = obj.model_dump(by_alias=True)
+    assert dumped["type"] == "failure"
+    assert dumped["interview"] == "r6"
+
+
+def test_feedback_delta_type_serialises_as_string():
+    obj = FeedbackDelta(interview_id="r7", seq=2, delta='"score": ', app_id="app")
+    dumped = obj.model_dump(by_alias=True)
+    assert dumped["type"] == "feedback.delta"
+    assert FeedbackDelta.model_validate(dumped) == obj
@@ -0,0 +1,60 @@
+import sqlite3
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mock_interview_shared.utils.sqlite_store import SQLiteLRUStore
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_until_it_fits(tmp_path) -> None:
+    store = SQLiteLRUStore(str(tmp_path / "s.sqlite3"), max_bytes=30)
+    clock = iter(range(100))
+
+    with patch(
+        "mock_interview_shared.utils.sqlite_store.time.time", side_effect=lambda: next(clock)
+    ):
+        assert await store.put("a", "a" * 10) == 0
+        await store.put("b", "b" * 10)
+        await store.put("c", "c" * 10)
+        assert await store.get("a") == "a" * 10  # now the most recently used
+        assert await store.put("d", "d" * 10) == 1
+
+        assert await store.get("b") is None
+        assert [await store.get(key) for key in "acd"] == ["a" * 10, "c" * 10, "d" * 10]
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_drops_entries_past_max_age(tmp_path) -> None:
+    store = SQLiteLRUStore(str(tmp_path / "s.sqlite3"), max_bytes=1_000, max_age=60)
+
+    await store.put("old", "made on another replica", stored_at=time.time() - 120)
+    await store.put("new", "fresh")
+
+    assert await store.get("old") is None
+    assert await store.get("new") == "fresh"
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_entries_survive_a_restart(tmp_path) -> None:
+    path = str(tmp_path / "nested" / "s.sqlite3")
+    first = SQLiteLRUStore(path, max_bytes=1_000)
+    await first.put("k", "persisted")
+    first.close()
+
+    second = SQLiteLRUStore(path, max_bytes=1_000)
+    assert await second.get("k") == "persisted"
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_the_caller(tmp_path) -> None:
+    # A directory where the database file should be: sqlite cannot open it
+    (tmp_path / "s.sqlite3").mkdir()
+    store = SQLiteLRUStore(str(tmp_path / "s.sqlite3"), max_bytes=1_000)
+
+    with pytest.raises(sqlite3.Error):
+        await store.get("k")